@@ -0,0 +1,436 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+"""
+Benchmark definitions. Each case is a setup function which prepares the input
+data and returns a callable without arguments along with amount of operations
+it performs per call; results are reported per single operation. Cases which
+change global state in setup return a teardown callable as the third element.
+"""
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+from typing import Callable, Dict, Tuple, Union
+
+from pytermor import fmt, autof, build, build_rgb, sgr, seq, SequenceSGR, Gradient, SGRState, LineIndex
+from pytermor.numf import (
+    format_auto_float, format_prefixed_unit, format_time_delta, format_time_delta_ns, format_time_delta_until,
+    PRESET_SI_METRIC,
+)
+from pytermor.registry import sgr_parity_registry
+from pytermor.strf import (
+    StyledText, ReplaceSGR, ReplaceCSI, ljust_fmtd, rjust_fmtd, center_fmtd, truncate_fmtd, slice_fmtd, wrap_fmtd,
+    anchor_lines, unanchor_lines, SearchableText,
+)
+from pytermor.output import VectoredWriter
+from . import corpus
+
+BenchmarkFn = Callable[[], object]
+BenchmarkSetup = Callable[[], Union[Tuple[BenchmarkFn, int], Tuple[BenchmarkFn, int, Callable[[], None]]]]
+
+BENCHMARKS: Dict[str, BenchmarkSetup] = dict()
+
+
+def benchmark(name: str) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    def register(setup: BenchmarkSetup) -> BenchmarkSetup:
+        if name in BENCHMARKS:
+            raise RuntimeError(f'Conflict: benchmark {name!r} is already registered')
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# --- seq ----------------------------------------------------------------------
+
+@benchmark('seq.print.cached')
+def setup_seq_print_cached():
+    sequences = [seq.BOLD, seq.RED, seq.BOLD + seq.RED, seq.build_c256(208), seq.build_rgb(255, 128, 0)]
+    return lambda: [s.print() for s in sequences], len(sequences)
+
+
+@benchmark('seq.print.uncached')
+def setup_seq_print_uncached():
+    params = [(sgr.BOLD,), (sgr.RED,), (sgr.BOLD, sgr.RED), (38, 5, 208), (38, 2, 255, 128, 0)]
+    return lambda: [SequenceSGR(*p).print() for p in params], len(params)
+
+
+@benchmark('seq.build.names')
+def setup_seq_build_names():
+    args = [('bold',), ('red',), ('bold', 'red', 'underlined'), ('hi_blue', 'bg_black')]
+    return lambda: [build(*a) for a in args], len(args)
+
+
+@benchmark('seq.build.mixed')
+def setup_seq_build_mixed():
+    args = [(sgr.BOLD, 'red'), (seq.ITALIC, sgr.BG_GRAY), ('dim', seq.build_c256(100))]
+    return lambda: [build(*a) for a in args], len(args)
+
+
+@benchmark('seq.parse')
+def setup_seq_parse():
+    strings = ['\033[1m', '\033[31m', '\033[1;31;4m', '\033[38;5;208m', '\033[38;2;255;128;0;40m', '\033[m']
+    return lambda: [SequenceSGR.parse(s) for s in strings], len(strings)
+
+
+# --- fmt ----------------------------------------------------------------------
+
+@benchmark('fmt.autof')
+def setup_fmt_autof():
+    args = [('bold',), (sgr.RED,), (seq.BOLD + seq.RED,), ('bold', 'red', 'underlined')]
+    return lambda: [autof(*a) for a in args], len(args)
+
+
+@benchmark('fmt.wrap')
+def setup_fmt_wrap():
+    formats = [fmt.bold, fmt.red, autof(sgr.BOLD, sgr.RED), autof(seq.build_rgb(255, 128, 0))]
+    texts = corpus.plain_lines(len(formats))
+    pairs = list(zip(formats, texts))
+    return lambda: [f.wrap(t) for f, t in pairs], len(pairs)
+
+
+@benchmark('fmt.wrap.disabled')
+def setup_fmt_wrap_disabled():
+    formats = [fmt.bold, fmt.red, autof(sgr.BOLD, sgr.RED), autof(seq.build_rgb(255, 128, 0))]
+    texts = corpus.plain_lines(len(formats))
+    pairs = list(zip(formats, texts))
+    prev_color_mode = fmt.get_color_mode()
+    fmt.set_color_mode(False)
+    return lambda: [f.wrap(t) for f, t in pairs], len(pairs), lambda: fmt.set_color_mode(prev_color_mode)
+
+
+@benchmark('fmt.wrap_bytes')
+def setup_fmt_wrap_bytes():
+    formats = [fmt.bold, fmt.red, autof(sgr.BOLD, sgr.RED), autof(seq.build_rgb(255, 128, 0))]
+    payloads = [line.encode() for line in corpus.plain_lines(len(formats))]
+    pairs = list(zip(formats, payloads))
+    return lambda: [f.wrap_bytes(p) for f, p in pairs], len(pairs)
+
+
+# --- gradient -----------------------------------------------------------------
+
+@benchmark('gradient.wrap_many')
+def setup_gradient_wrap_many():
+    heat = Gradient([0x0000ff, 0xffff00, 0xff0000], steps=32, vmin=0, vmax=1000)
+    values = corpus.float_values(200 * 50)
+    values = [abs(v) % 1000 for v in values]
+    texts = ['%4d' % v for v in values]
+    return lambda: heat.wrap_many(values, texts), len(values)
+
+
+@benchmark('gradient.build_rgb_per_cell')
+def setup_gradient_build_rgb_per_cell():
+    """Reference approach for 'gradient.wrap_many'."""
+    values = corpus.float_values(200 * 50)
+    values = [abs(v) % 1000 for v in values]
+    texts = ['%4d' % v for v in values]
+
+    def run():
+        return [autof(build_rgb(min(255, int(v / 2)), 0, max(0, 255 - int(v / 2))))(t) for v, t in zip(values, texts)]
+    return run, len(values)
+
+
+# --- registry -----------------------------------------------------------------
+
+@benchmark('registry.get_closing_seq')
+def setup_registry_get_closing_seq():
+    sequences = [seq.BOLD, seq.RED, seq.BOLD + seq.RED + seq.UNDERLINED, seq.build_c256(208),
+                 seq.build_rgb(255, 128, 0) + seq.BG_BLACK]
+    return lambda: [sgr_parity_registry.get_closing_seq(s) for s in sequences], len(sequences)
+
+
+# --- state --------------------------------------------------------------------
+
+@benchmark('state.apply')
+def setup_state_apply():
+    sequences = [seq.BOLD, seq.RED, seq.BOLD + seq.RED + seq.UNDERLINED, seq.build_c256(208),
+                 seq.build_rgb(255, 128, 0) + seq.BG_BLACK, seq.BOLD_DIM_OFF + seq.COLOR_OFF]
+    initial = SGRState()
+    return lambda: [initial.apply(s) for s in sequences], len(sequences)
+
+
+@benchmark('state.diff')
+def setup_state_diff():
+    states = [SGRState.from_sequence(s) for s in (seq.BOLD + seq.RED, seq.BOLD + seq.BLUE, seq.DIM,
+                                                  seq.build_c256(208) + seq.BG_BLACK, seq.NOOP)]
+    pairs = [(a, b) for a in states for b in states]
+    return lambda: [a.diff(b) for a, b in pairs], len(pairs)
+
+
+# --- strf ---------------------------------------------------------------------
+
+@benchmark('strf.replace_sgr')
+def setup_strf_replace_sgr():
+    lines, f = corpus.styled_lines(), ReplaceSGR()
+    return lambda: [f.apply(line) for line in lines], len(lines)
+
+
+@benchmark('strf.replace_csi')
+def setup_strf_replace_csi():
+    lines, f = corpus.styled_lines(), ReplaceCSI()
+    return lambda: [f.apply(line) for line in lines], len(lines)
+
+
+@benchmark('strf.replace_sgr.plain')
+def setup_strf_replace_sgr_plain():
+    lines, f = corpus.plain_lines(), ReplaceSGR()
+    return lambda: [f.apply(line) for line in lines], len(lines)
+
+
+@benchmark('strf.ljust_fmtd')
+def setup_strf_ljust_fmtd():
+    lines = corpus.styled_lines()
+    return lambda: [ljust_fmtd(line, 120) for line in lines], len(lines)
+
+
+@benchmark('strf.rjust_fmtd')
+def setup_strf_rjust_fmtd():
+    lines = corpus.styled_lines()
+    return lambda: [rjust_fmtd(line, 120) for line in lines], len(lines)
+
+
+@benchmark('strf.center_fmtd')
+def setup_strf_center_fmtd():
+    lines = corpus.styled_lines()
+    return lambda: [center_fmtd(line, 120) for line in lines], len(lines)
+
+
+@benchmark('strf.truncate_fmtd')
+def setup_strf_truncate_fmtd():
+    lines = corpus.styled_lines()
+    return lambda: [truncate_fmtd(line, 40, '…') for line in lines], len(lines)
+
+
+@benchmark('strf.truncate_fmtd.huge')
+def setup_strf_truncate_fmtd_huge():
+    line = ''.join(corpus.styled_lines(2000))
+    return lambda: truncate_fmtd(line, 80), 1
+
+
+@benchmark('strf.slice_fmtd')
+def setup_strf_slice_fmtd():
+    lines = corpus.styled_lines()
+    return lambda: [slice_fmtd(line, 10, 50) for line in lines], len(lines)
+
+
+@benchmark('strf.wrap_fmtd')
+def setup_strf_wrap_fmtd():
+    text = '\n'.join(corpus.styled_lines(200))
+    return lambda: list(wrap_fmtd(text, 60)), 200
+
+
+@benchmark('strf.styled_text.concat')
+def setup_strf_styled_text_concat():
+    formats = [fmt.noop, fmt.red, fmt.bold, autof(sgr.BOLD, sgr.BLUE)]
+    words = ' '.join(corpus.plain_lines(200)).split(' ')
+
+    def run():
+        text = StyledText()
+        for idx, word in enumerate(words):
+            text += StyledText(word, formats[idx % len(formats)]) + ' '
+        return ljust_fmtd(text, len(text) + 10)
+    return run, len(words)
+
+
+@benchmark('strf.styled_text.join')
+def setup_strf_styled_text_join():
+    formats = [fmt.noop, fmt.red, fmt.bold, autof(sgr.BOLD, sgr.BLUE)]
+    words = ' '.join(corpus.plain_lines(200)).split(' ')
+
+    def run():
+        text = StyledText(' ').join(StyledText(word, formats[idx % len(formats)]) for idx, word in enumerate(words))
+        return ljust_fmtd(text, len(text) + 10)
+    return run, len(words)
+
+
+@benchmark('strf.styled_text.render')
+def setup_strf_styled_text_render():
+    formats = [fmt.noop, fmt.red, fmt.bold, autof(sgr.BOLD, sgr.BLUE)]
+    words = ' '.join(corpus.plain_lines(200)).split(' ')
+    text = StyledText()
+    for idx, word in enumerate(words):
+        text += StyledText(word, formats[idx % len(formats)]) + ' '
+    return text.render, len(words)
+
+
+@benchmark('strf.styled_text.slice')
+def setup_strf_styled_text_slice():
+    text = StyledText()
+    for idx, line in enumerate(corpus.plain_lines()):
+        text += StyledText(line, [fmt.red, fmt.bold][idx % 2])
+    step = len(text) // 100
+    return lambda: [text[i:i + 80] for i in range(0, len(text), step)], len(range(0, len(text), step))
+
+
+@benchmark('strf.anchor_lines')
+def setup_strf_anchor_lines():
+    lines = [line + '\n' for line in corpus.styled_lines()]
+    return lambda: list(anchor_lines(lines)), len(lines)
+
+
+@benchmark('strf.unanchor_lines')
+def setup_strf_unanchor_lines():
+    lines = list(anchor_lines(line + '\n' for line in corpus.styled_lines()))
+    return lambda: list(unanchor_lines(lines)), len(lines)
+
+
+@benchmark('strf.searchable_text')
+def setup_strf_searchable_text():
+    text = '\n'.join(corpus.styled_lines())
+    return lambda: SearchableText(text), 1
+
+
+@benchmark('strf.searchable_text.highlight')
+def setup_strf_searchable_text_highlight():
+    text = SearchableText('\n'.join(corpus.styled_lines()))
+    highlight = autof(sgr.INVERSED)
+    return lambda: text.highlight('session', highlight), 1
+
+
+# --- numf ---------------------------------------------------------------------
+
+@benchmark('numf.format_auto_float')
+def setup_numf_format_auto_float():
+    values = corpus.float_values()
+    return lambda: [format_auto_float(v, 8) for v in values], len(values)
+
+
+@benchmark('numf.format_prefixed_unit.binary')
+def setup_numf_format_prefixed_unit_binary():
+    values = corpus.size_values()
+    return lambda: [format_prefixed_unit(v) for v in values], len(values)
+
+
+@benchmark('numf.format_prefixed_unit.metric')
+def setup_numf_format_prefixed_unit_metric():
+    values = corpus.float_values()
+    return lambda: [format_prefixed_unit(v, PRESET_SI_METRIC) for v in values], len(values)
+
+
+@benchmark('numf.format_time_delta')
+def setup_numf_format_time_delta():
+    values = corpus.duration_values()
+    return lambda: [format_time_delta(v, 6) for v in values], len(values)
+
+
+@benchmark('numf.format_time_delta.default')
+def setup_numf_format_time_delta_default():
+    values = corpus.duration_values()
+    return lambda: [format_time_delta(v) for v in values], len(values)
+
+
+@benchmark('numf.format_time_delta_ns')
+def setup_numf_format_time_delta_ns():
+    values = [int(v * 10 ** 9) for v in corpus.duration_values()]
+    return lambda: [format_time_delta_ns(v, 6) for v in values], len(values)
+
+
+@benchmark('numf.format_time_delta.live')
+def setup_numf_format_time_delta_live():
+    """Elapsed time counter refreshed 10 times per second for an hour."""
+    values = [tick / 10 for tick in range(36000)]
+    return lambda: [format_time_delta(v, 6) for v in values], len(values)
+
+
+@benchmark('numf.format_time_delta_until.live')
+def setup_numf_format_time_delta_until_live():
+    """Same as 'numf.format_time_delta.live', but reformatting only when the output changes."""
+    values = [tick / 10 for tick in range(36000)]
+
+    def run():
+        output, valid_until = '', float('-inf')
+        for v in values:
+            if v >= valid_until:
+                output, valid_until = format_time_delta_until(v, 6)
+        return output
+    return run, len(values)
+
+
+# --- output -------------------------------------------------------------------
+
+def _output_records(count: int, payload_lines: int):
+    formats = [fmt.gray, fmt.noop, fmt.yellow, fmt.red, autof(sgr.BOLD, sgr.RED)]
+    payloads = [('\n'.join(corpus.plain_lines(payload_lines, seed=i)) + '\n').encode() for i in range(count)]
+    return [(formats[i % len(formats)], payload) for i, payload in enumerate(payloads)]
+
+
+def _setup_vectored_writer(records):
+    writer = VectoredWriter(os.open(os.devnull, os.O_WRONLY))
+
+    def run():
+        for f, payload in records:
+            writer.write(payload, f)
+        writer.flush()
+    return run, len(records)
+
+
+def _setup_join_write(records):
+    """Reference approach for `VectoredWriter`."""
+    fd = os.open(os.devnull, os.O_WRONLY)
+
+    def run():
+        parts = []
+        for f, payload in records:
+            parts += (f.opening_bytes, payload, f.closing_bytes)
+            if len(parts) >= 1024:
+                os.write(fd, b''.join(parts))
+                parts.clear()
+        os.write(fd, b''.join(parts))
+    return run, len(records)
+
+
+@benchmark('output.vectored_writer.1k')
+def setup_output_vectored_writer_1k():
+    return _setup_vectored_writer(_output_records(1000, 20))
+
+
+@benchmark('output.join_write.1k')
+def setup_output_join_write_1k():
+    return _setup_join_write(_output_records(1000, 20))
+
+
+@benchmark('output.vectored_writer.64k')
+def setup_output_vectored_writer_64k():
+    return _setup_vectored_writer(_output_records(100, 1200))
+
+
+@benchmark('output.join_write.64k')
+def setup_output_join_write_64k():
+    return _setup_join_write(_output_records(100, 1200))
+
+
+# --- line_index ---------------------------------------------------------------
+
+def _line_index_file(tmp_dir: tempfile.TemporaryDirectory, lines_count: int) -> str:
+    path = os.path.join(tmp_dir.name, 'input.log')
+    with open(path, 'w') as f:
+        f.write('\n'.join(corpus.styled_lines(lines_count)) + '\n')
+    return path
+
+
+@benchmark('line_index.update.100k')
+def setup_line_index_update_100k():
+    tmp_dir = tempfile.TemporaryDirectory()
+    path = _line_index_file(tmp_dir, 100000)
+
+    def run():
+        with LineIndex(path) as index:
+            index.update()
+        return tmp_dir
+    return run, 100000
+
+
+@benchmark('line_index.render.window')
+def setup_line_index_render_window():
+    tmp_dir = tempfile.TemporaryDirectory()
+    index = LineIndex(_line_index_file(tmp_dir, 100000))
+    index.update()
+    starts = random.Random(corpus.SEED).sample(range(len(index) - 50), 100)
+
+    def run():
+        for start in starts:
+            index.render(start, 50)
+        return tmp_dir
+    return run, len(starts)
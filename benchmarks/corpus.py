@@ -0,0 +1,91 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+"""
+Deterministic input data for the benchmarks, modelled after typical pytermor
+output: colored log lines, directory listings and progress bars.
+"""
+from __future__ import annotations
+
+import random
+from typing import List
+
+from pytermor import fmt, autof, sgr, seq
+from pytermor.fmt import Format
+
+SEED = 1337
+
+_WORDS = [
+    'request', 'handler', 'connection', 'timeout', 'worker', 'cache', 'miss', 'hit', 'queue', 'flush',
+    'user', 'session', 'token', 'expired', 'retry', 'backend', 'upstream', 'ok', 'failed', 'db01',
+]
+_LEVEL_FORMATS: List[Format] = [fmt.gray, fmt.noop, fmt.yellow, fmt.red, autof(sgr.BOLD, sgr.RED)]
+_LEVEL_NAMES = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+_FILE_FORMATS: List[Format] = [fmt.noop, fmt.blue, autof(sgr.BOLD, sgr.BLUE), fmt.green, fmt.cyan, fmt.magenta]
+
+
+def log_lines(count: int = 1000, seed: int = SEED) -> List[str]:
+    rnd = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        level = rnd.randrange(len(_LEVEL_NAMES))
+        message = ' '.join(rnd.choice(_WORDS) for _ in range(rnd.randint(3, 14)))
+        lines.append(
+            fmt.gray(f'{rnd.randint(0, 86399):>6d}') + ' ' +
+            _LEVEL_FORMATS[level](f'{_LEVEL_NAMES[level]:<8s}') + ' ' +
+            fmt.bold('app.' + rnd.choice(_WORDS)) + ': ' + message
+        )
+    return lines
+
+
+def listing_lines(count: int = 1000, seed: int = SEED) -> List[str]:
+    rnd = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        name = '_'.join(rnd.choice(_WORDS) for _ in range(rnd.randint(1, 3)))
+        lines.append(
+            fmt.gray('-rw-r--r--') + f' {rnd.randint(0, 10**9):>10d} ' + rnd.choice(_FILE_FORMATS)(name)
+        )
+    return lines
+
+
+def progress_lines(count: int = 1000, seed: int = SEED) -> List[str]:
+    rnd = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        done = rnd.randint(0, 40)
+        lines.append(
+            fmt.bold(f'{rnd.choice(_WORDS):<10s}') + ' [' +
+            autof(seq.build_c256(rnd.randint(16, 231)))('#' * done) + fmt.gray('.' * (40 - done)) + '] ' +
+            autof(seq.build_rgb(rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(0, 255)))(f'{done * 2.5:5.1f}%')
+        )
+    return lines
+
+
+def plain_lines(count: int = 1000, seed: int = SEED) -> List[str]:
+    rnd = random.Random(seed)
+    return [' '.join(rnd.choice(_WORDS) for _ in range(rnd.randint(3, 14))) for _ in range(count)]
+
+
+def styled_lines(count: int = 1000, seed: int = SEED) -> List[str]:
+    """Mix of all the styled corpora above."""
+    per_kind = count // 3
+    lines = log_lines(per_kind, seed) + listing_lines(per_kind, seed) + progress_lines(count - 2 * per_kind, seed)
+    random.Random(seed).shuffle(lines)
+    return lines
+
+
+def float_values(count: int = 1000, seed: int = SEED) -> List[float]:
+    rnd = random.Random(seed)
+    return [rnd.choice((-1, 1)) * 10 ** rnd.uniform(-3, 6) for _ in range(count)]
+
+
+def size_values(count: int = 1000, seed: int = SEED) -> List[int]:
+    rnd = random.Random(seed)
+    return [int(10 ** rnd.uniform(0, 15)) for _ in range(count)]
+
+
+def duration_values(count: int = 1000, seed: int = SEED) -> List[float]:
+    rnd = random.Random(seed)
+    return [10 ** rnd.uniform(-3, 9) for _ in range(count)]
@@ -0,0 +1,175 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+"""
+Run the benchmarks, write the results as JSON and compare them with the
+baseline. Exit code is 1 if any benchmark became slower than the baseline by
+more than the allowed ratio.
+
+Timings depend on the machine, so the baseline should be recorded on the same
+one the comparison is made on (``--update-baseline``). To compensate for
+the machine load fluctuations, the timings are normalized by the time of a
+fixed pure Python workload measured along with each benchmark (unless
+``--no-normalize`` is specified).
+
+Usage:
+    python -m benchmarks.run [-k seq.] [--max-regression 0.3] [--threshold strf.wrap_fmtd=0.5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Dict, List, Tuple
+
+import pytermor
+from pytermor import fmt
+from pytermor.strf import ljust_fmtd, rjust_fmtd
+from .cases import BENCHMARKS
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE_PATH = os.path.join(BENCHMARKS_DIR, 'baseline.json')
+DEFAULT_OUTPUT_PATH = os.path.join(BENCHMARKS_DIR, 'results.json')
+
+STATUS_OK = 'ok'
+STATUS_FASTER = 'faster'
+STATUS_REGRESSION = 'REGRESSION'
+STATUS_NEW = 'new'
+
+
+def measure(name: str, repeat: int, min_time: float) -> Dict[str, float | int]:
+    """
+    Time benchmark *name* and return the best time per single operation in
+    nanoseconds. The reference workload is timed in turns with the benchmark,
+    so that both are equally affected by the machine load.
+    """
+    fn, ops, *teardown = BENCHMARKS[name]()
+    try:
+        timer, calibration_timer = timeit.Timer(fn), timeit.Timer(_calibration_workload)
+        number = _autorange(timer, min_time)
+        calibration_number = _autorange(calibration_timer, min_time / 2)
+
+        best = best_calibration = float('inf')
+        for _ in range(repeat):
+            best_calibration = min(best_calibration, calibration_timer.timeit(calibration_number))
+            best = min(best, timer.timeit(number))
+    finally:
+        for fn_teardown in teardown:
+            fn_teardown()
+    return {
+        'ns_per_op': best / number / ops * 1e9,
+        'calibration_ns': best_calibration / calibration_number * 1e9,
+        'calls': number,
+        'ops_per_call': ops,
+    }
+
+
+def _autorange(timer: timeit.Timer, min_time: float) -> int:
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            return number
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+
+
+def _calibration_workload():
+    return sorted(str(i * 7919 % 1000) for i in range(100))
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], max_regression: float,
+            thresholds: Dict[str, float], normalize: bool = True) -> List[Tuple[str, float | None, str]]:
+    """Return (name, current/baseline ratio, status) for each of the *results*."""
+    report = []
+    for name, result in results.items():
+        if name not in baseline:
+            report.append((name, None, STATUS_NEW))
+            continue
+        ratio = result['ns_per_op'] / baseline[name]['ns_per_op']
+        if normalize:
+            ratio *= baseline[name]['calibration_ns'] / result['calibration_ns']
+        allowed = thresholds.get(name, max_regression)
+        if ratio > 1 + allowed:
+            status = STATUS_REGRESSION
+        elif ratio < 1 / (1 + allowed):
+            status = STATUS_FASTER
+        else:
+            status = STATUS_OK
+        report.append((name, ratio, status))
+    return report
+
+
+def parse_thresholds(values: List[str]) -> Dict[str, float]:
+    thresholds = dict()
+    for value in values:
+        name, sep, ratio = value.partition('=')
+        if not sep or name not in BENCHMARKS:
+            raise ValueError(f'Invalid threshold (expected <benchmark>=<ratio>): {value!r}')
+        thresholds[name] = float(ratio)
+    return thresholds
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.split('\n\n')[0])
+    parser.add_argument('-k', dest='pattern', default='', help='run only benchmarks containing PATTERN')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT_PATH, help='results file path')
+    parser.add_argument('-b', '--baseline', default=DEFAULT_BASELINE_PATH, help='baseline file path')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repeats, the best one is used')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum duration of one repeat, sec')
+    parser.add_argument('--max-regression', type=float, default=0.3,
+                        help='allowed slowdown relative to baseline (0.3 = 30%%)')
+    parser.add_argument('--threshold', action='append', default=[], metavar='NAME=RATIO',
+                        help='allowed slowdown for specific benchmark, overrides --max-regression')
+    parser.add_argument('--no-normalize', action='store_true', help='compare raw timings')
+    parser.add_argument('--update-baseline', action='store_true', help='write results to the baseline file')
+    args = parser.parse_args(argv)
+    try:
+        thresholds = parse_thresholds(args.threshold)
+    except ValueError as e:
+        parser.error(str(e))
+
+    names = [name for name in BENCHMARKS.keys() if args.pattern in name]
+    results = {name: measure(name, args.repeat, args.min_time) for name in names}
+    document = {
+        'meta': {
+            'pytermor': pytermor.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+    if args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'rt') as f:  # keep the benchmarks not selected by -k
+            document['results'] = {**json.load(f)['results'], **results}
+    with open(args.baseline if args.update_baseline else args.output, 'wt') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        for name, result in results.items():
+            print(ljust_fmtd(name, 36) + rjust_fmtd(f'{result["ns_per_op"]:.1f} ns', 14))
+        return 0
+
+    with open(args.baseline, 'rt') as f:
+        baseline = json.load(f)['results']
+    report = compare(results, baseline, args.max_regression, thresholds, not args.no_normalize)
+    status_formats = {STATUS_OK: fmt.noop, STATUS_FASTER: fmt.green, STATUS_REGRESSION: fmt.red, STATUS_NEW: fmt.gray}
+    for name, ratio, status in report:
+        ratio_str = f'{ratio:.2f}x' if ratio is not None else '-'
+        print(ljust_fmtd(name, 36) + rjust_fmtd(f'{results[name]["ns_per_op"]:.1f} ns', 14) +
+              rjust_fmtd(ratio_str, 8) + '  ' + status_formats[status](status))
+
+    regressions = [name for name, _, status in report if status == STATUS_REGRESSION]
+    if regressions:
+        print(fmt.red(f'{len(regressions)} regression(s): {", ".join(regressions)}'), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,19 +2,31 @@
 # pytermor [ANSI formatted terminal output toolset]
 # (C) 2022 A. Shavykin <0.delameter@gmail.com>
 # -----------------------------------------------------------------------------
-from .seq import build, build_c256, build_rgb, SequenceSGR
-from .fmt import autof, Format
+from .seq import build, build_c256, build_rgb, SequenceSGR, SequenceCSI
+from .fmt import autof, Format, set_color_mode, get_color_mode, color_mode
+from .gradient import Palette, Gradient
+from .state import SGRState
 from .numf import *
 from .strf import *
+from .line_index import LineIndex
 
 __all__ = [
     'build',
     'build_c256',
     'build_rgb',
     'SequenceSGR',
+    'SequenceCSI',
 
     'autof',
     'Format',
+    'set_color_mode',
+    'get_color_mode',
+    'color_mode',
+
+    'Palette',
+    'Gradient',
+
+    'SGRState',
 
     'apply_filters',
     'StringFilter',
@@ -22,16 +34,39 @@ __all__ = [
     'ReplaceSGR',
     'ReplaceNonAsciiBytes',
 
+    'StyledText',
+
     'ljust_fmtd',
     'rjust_fmtd',
     'center_fmtd',
+    'truncate_fmtd',
+    'slice_fmtd',
+    'wrap_fmtd',
+
+    'TableColumn',
+    'TableRenderer',
+
+    'MarkupTemplate',
+    'compile_markup',
+    'render_markup',
+
+    'anchor_lines',
+    'unanchor_lines',
+
+    'SearchableText',
+    'highlight_fmtd',
+
+    'LineIndex',
 
     'format_auto_float',
     'format_prefixed_unit',
+    'format_prefixed_unit_interval',
     'PrefixedUnitPreset',
     'PRESET_SI_METRIC',
     'PRESET_SI_BINARY',
     'format_time_delta',
+    'format_time_delta_until',
+    'format_time_delta_ns',
     'TimeDeltaPreset',
 ]
 __version__ = '1.8.0'
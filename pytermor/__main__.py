@@ -0,0 +1,10 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import sys
+
+from .cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
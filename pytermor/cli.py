@@ -0,0 +1,271 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+"""
+Command line interface, run as ``python -m pytermor``.
+
+Commands:
+  - ``strip`` -- remove SGR (or all CSI) sequences from files.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import BinaryIO, ContextManager, Deque, Iterator, List, Tuple
+
+from .numf import format_prefixed_unit
+from .strf import apply_filters, ReplaceCSI, ReplaceSGR
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_SEQUENCE_LEN = 256
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m pytermor', description='pytermor command line tools')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+
+    strip = commands.add_parser('strip', help='remove escape sequences from files',
+                                description='Remove SGR (or all CSI) escape sequences from files. Files are '
+                                            'processed as bytes in chunks of limited size, which are '
+                                            'distributed across worker processes. Results are written to '
+                                            'stdout, unless --output-dir or --in-place is specified.')
+    strip.add_argument('files', nargs='+', metavar='FILE', help="input file, '-' for stdin")
+    output = strip.add_mutually_exclusive_group()
+    output.add_argument('-o', '--output-dir', help='write results into DIR, keeping file names')
+    output.add_argument('-i', '--in-place', action='store_true', help='replace input files with the results')
+    strip.add_argument('-a', '--all-csi', action='store_true', help='remove all CSI sequences, not just SGR')
+    strip.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                       help='worker processes amount, 1 disables the pool (default: CPU count)')
+    strip.add_argument('-c', '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                       help=f'approximate chunk size in bytes (default: {DEFAULT_CHUNK_SIZE})')
+    strip.add_argument('-q', '--quiet', action='store_true', help='do not report throughput')
+    strip.set_defaults(func=_run_strip)
+
+    args = parser.parse_args(argv)
+    if args.command == 'strip':
+        if args.jobs < 1 or args.chunk_size < 1:
+            parser.error('--jobs and --chunk-size must be positive')
+        if args.in_place and '-' in args.files:
+            parser.error('stdin cannot be modified in place')
+        if args.output_dir:
+            names = [_get_output_name(path) for path in args.files]
+            duplicates = sorted(name for name, count in Counter(names).items() if count > 1)
+            if duplicates:
+                parser.error(f'input files with the same names cannot be written into one --output-dir: '
+                             f'{", ".join(duplicates)}')
+    try:
+        return args.func(args)
+    except OSError as e:
+        print(f'{parser.prog} {args.command}: error: {e}', file=sys.stderr)
+        return 1
+
+
+def strip_chunk(data: bytes, all_csi: bool = False) -> bytes:
+    """
+    Remove escape sequences from *data*. Bytes which are not valid UTF-8 are kept
+    as is, so the result is the same for a whole input and for its chunks split
+    by `iter_chunks()`.
+    """
+    text = data.decode('utf-8', 'surrogateescape')
+    text = apply_filters(text, ReplaceCSI if all_csi else ReplaceSGR)
+    return text.encode('utf-8', 'surrogateescape')
+
+
+def iter_chunks(stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read *stream* by chunks of approximately *chunk_size* bytes, which never
+    split an escape sequence. Chunks end with a newline if possible, otherwise
+    they are cut before the last ``ESC``, as sequences cannot contain either.
+    Sequences longer than *MAX_SEQUENCE_LEN* bytes are not expected.
+    """
+    tail = b''
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            if tail:
+                yield tail
+            return
+        if tail:
+            data = tail + data
+
+        cut_pos = data.rfind(b'\n') + 1
+        if cut_pos == 0:
+            cut_pos = data.rfind(b'\x1b')
+            if cut_pos == 0 and len(data) <= MAX_SEQUENCE_LEN:
+                tail = data
+                continue
+            if cut_pos <= 0:
+                cut_pos = len(data)
+        yield data[:cut_pos]
+        tail = data[cut_pos:]
+
+
+class _Output:
+    """
+    Destination of one input file. Errors are reported and make the output
+    *failed*: the rest of the data is discarded and the partial result is
+    removed, so that other files can still be processed.
+    """
+    def __init__(self, path: str, output_dir: str | None, in_place: bool):
+        self.failed: bool = False
+        self._path: str | None = None
+        self._final_path: str | None = None
+        self._owned: bool = True
+        if in_place:
+            fd, self._path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.pytermor-')
+            self._stream: BinaryIO = os.fdopen(fd, 'wb')
+            self._final_path = path
+            try:
+                shutil.copymode(path, self._path)
+            except OSError:
+                self._discard()
+                raise
+        elif output_dir:
+            self._path = os.path.join(output_dir, _get_output_name(path))
+            self._stream = open(self._path, 'wb')
+        else:
+            self._stream = sys.stdout.buffer
+            self._owned = False
+
+    def write(self, data: bytes):
+        if self.failed:
+            return
+        try:
+            self._stream.write(data)
+        except OSError as e:
+            self.fail(e)
+
+    def close(self):
+        if self.failed:
+            return
+        try:
+            if not self._owned:
+                self._stream.flush()
+                return
+            self._stream.close()
+            if self._final_path:
+                os.replace(self._path, self._final_path)
+        except OSError as e:
+            self.fail(e)
+
+    def fail(self, error: OSError):
+        if self.failed:
+            return
+        self.failed = True
+        _report_error(error)
+        if self._owned:
+            self._discard()
+
+    def _discard(self):
+        try:
+            self._stream.close()
+        except OSError:
+            pass
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
+
+
+def _run_strip(args: argparse.Namespace) -> int:
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    started_at = time.perf_counter()
+    executor: Executor | None = None
+    if args.jobs > 1:
+        executor = ProcessPoolExecutor(args.jobs)
+    try:
+        bytes_in, bytes_out, failed = _process(args, executor, window=2 * args.jobs)
+    finally:
+        if executor:
+            executor.shutdown()
+    elapsed = time.perf_counter() - started_at
+
+    if not args.quiet:
+        rate = format_prefixed_unit(bytes_in / elapsed if elapsed else 0)
+        print(f'{len(args.files) - failed} file(s), {format_prefixed_unit(bytes_in)} -> '
+              f'{format_prefixed_unit(bytes_out)} in {elapsed:.2f}s ({rate}/s, {args.jobs} job(s))', file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _process(args: argparse.Namespace, executor: Executor | None, window: int) -> Tuple[int, int, int]:
+    """
+    Feed chunks of all the files to *executor* keeping at most *window* chunks
+    in flight, and write the results in the original order. Files which cannot
+    be read or written are reported and skipped; return amount of them along
+    with amounts of bytes read and written.
+    """
+    pending: Deque[Tuple[_Output, Future | None]] = deque()
+    outputs: List[_Output] = []
+    bytes_in = bytes_out = failed = 0
+
+    def complete_next():
+        nonlocal bytes_out
+        output, future = pending.popleft()
+        if future is None:
+            output.close()
+            return
+        result = future.result()
+        if not output.failed:
+            output.write(result)
+            bytes_out += len(result)
+
+    for path in args.files:
+        try:
+            input_cm = _open_input(path)
+        except OSError as e:
+            _report_error(e)
+            failed += 1
+            continue
+        with input_cm as stream:
+            try:
+                output = _Output(path, args.output_dir, args.in_place)
+            except OSError as e:
+                _report_error(e)
+                failed += 1
+                continue
+            outputs.append(output)
+            try:
+                for chunk in iter_chunks(stream, args.chunk_size):
+                    bytes_in += len(chunk)
+                    if len(pending) >= window:
+                        complete_next()
+                    pending.append((output, _submit(executor, chunk, args.all_csi)))
+            except OSError as e:
+                output.fail(e)
+        pending.append((output, None))
+    while pending:
+        complete_next()
+    return bytes_in, bytes_out, failed + sum(output.failed for output in outputs)
+
+
+def _submit(executor: Executor | None, chunk: bytes, all_csi: bool) -> Future:
+    if executor:
+        return executor.submit(strip_chunk, chunk, all_csi)
+    future = Future()
+    future.set_result(strip_chunk(chunk, all_csi))
+    return future
+
+
+def _open_input(path: str) -> ContextManager[BinaryIO]:
+    if path == '-':
+        return nullcontext(sys.stdin.buffer)
+    return open(path, 'rb')
+
+
+def _get_output_name(path: str) -> str:
+    return 'stdin' if path == '-' else os.path.basename(path)
+
+
+def _report_error(error: OSError):
+    print(f'python -m pytermor strip: error: {error}', file=sys.stderr)
@@ -3,6 +3,14 @@
 # (C) 2022 A. Shavykin <0.delameter@gmail.com>
 # -----------------------------------------------------------------------------
 
+numf_hook = None
+"""
+Callable invoked by numf formatters as ``numf_hook(func_name, preset)``, where
+*preset* is either a preset instance or its description. Set by `stats.enable()`,
+*None* means disabled.
+"""
+
+
 def get_terminal_width():
     try:
         import shutil as _shutil
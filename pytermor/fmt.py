@@ -4,7 +4,9 @@
 # -----------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import Any
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 from . import build, sgr, seq, SequenceSGR
 from .registry import sgr_parity_registry
@@ -18,25 +20,59 @@ class Format:
         if hard_reset_after:
             self._closing_seq = SequenceSGR(sgr.RESET)
 
-    def wrap(self, text: Any = None) -> str:
+    def _wrap_colored(self, text: Any = None) -> str:
         result = self._opening_seq.print()
         if text is not None:
             result += str(text)
         result += self._closing_seq.print()
         return result
 
+    def _wrap_plain(self, text: Any = None) -> str:
+        if text is None:
+            return ''
+        return str(text)
+
+    def _wrap_bytes_colored(self, data: bytes) -> bytes:
+        return self._opening_seq.print_bytes() + data + self._closing_seq.print_bytes()
+
+    def _wrap_bytes_plain(self, data: bytes) -> bytes:
+        return data
+
+    wrap = _wrap_colored  # both are replaced by set_color_mode()
+    wrap_bytes = _wrap_bytes_colored
+    """Frame already encoded *data* with the opening and closing sequences, without decoding it."""
+
+    def __call__(self, text: Any = None) -> str:
+        return self.wrap(text)
+
     @property
     def opening_str(self) -> str:
+        if not _color_mode:
+            return ''
         return self._opening_seq.print()
 
+    @property
+    def opening_bytes(self) -> bytes:
+        if not _color_mode:
+            return b''
+        return self._opening_seq.print_bytes()
+
     @property
     def opening_seq(self) -> SequenceSGR:
         return self._opening_seq
 
     @property
     def closing_str(self) -> str:
+        if not _color_mode:
+            return ''
         return self._closing_seq.print()
 
+    @property
+    def closing_bytes(self) -> bytes:
+        if not _color_mode:
+            return b''
+        return self._closing_seq.print_bytes()
+
     @property
     def closing_seq(self) -> SequenceSGR:
         return self._closing_seq
@@ -46,9 +82,6 @@ class Format:
             return seq.NOOP
         return arg
 
-    def __call__(self, text: Any = None) -> str:
-        return self.wrap(text)
-
     def __eq__(self, other: Format) -> bool:
         if not isinstance(other, Format):
             return False
@@ -64,6 +97,53 @@ def autof(*args: str | int | SequenceSGR) -> Format:
     return Format(opening_seq, closing_seq)
 
 
+_color_mode: bool = True
+
+
+def set_color_mode(enabled: bool):
+    """
+    Enable or disable SGR sequences output globally. When disabled, all `Format`
+    instances (including predefined ones and `autof()` results) return the
+    text as is, and their ``opening_str`` and ``closing_str`` (as well as
+    ``opening_bytes`` and ``closing_bytes``) are empty. The switch is done by
+    replacing the wrapping methods of `Format` class, so there is no overhead
+    in either mode. Default mode is disabled if ``NO_COLOR``
+    environment variable is set.
+
+    The mode is process-global: switching it affects all threads at once
+    (including the ones of `ThreadedWriter` and `RedrawScheduler`), and is
+    not synchronized with the rendering done by them. Set it at startup or
+    while no other thread is formatting the output.
+    """
+    global _color_mode
+    _color_mode = bool(enabled)
+    Format.wrap = Format._wrap_colored if _color_mode else Format._wrap_plain
+    Format.wrap_bytes = Format._wrap_bytes_colored if _color_mode else Format._wrap_bytes_plain
+
+
+def get_color_mode() -> bool:
+    return _color_mode
+
+
+@contextmanager
+def color_mode(enabled: bool) -> Iterator[None]:
+    """
+    Temporarily enable or disable SGR sequences output, see `set_color_mode()`.
+    This is not a thread-local setting: the mode is switched for the whole
+    process until the block exits, and nested blocks must exit in reverse
+    order.
+    """
+    prev_color_mode = _color_mode
+    set_color_mode(enabled)
+    try:
+        yield
+    finally:
+        set_color_mode(prev_color_mode)
+
+
+set_color_mode(not os.environ.get('NO_COLOR'))
+
+
 noop = autof()
 """Special instance in cases where you *have to* select one or 
 another Format, but do not want anything to be actually printed. 
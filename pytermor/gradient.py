@@ -0,0 +1,217 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Iterable, List, Sequence, Tuple, Union
+
+from . import sgr
+from .fmt import get_color_mode
+from .seq import SequenceSGR, build_c256, build_rgb
+
+MODE_RGB = 'rgb'
+MODE_C256 = 'c256'
+
+Color = Union[Tuple[int, int, int], int]
+
+
+class Palette:
+    """
+    Mapping of numeric values to a fixed set of colors. *colors* are either
+    ``(r, g, b)`` tuples or ``0xRRGGBB`` integers, and *thresholds* are the
+    ascending values separating them, so there must be one color more than
+    thresholds. Values less than the first threshold get the first color,
+    values which are equal or greater than the last one (and NaN) -- the last.
+
+    Opening sequences for all the colors are rendered in advance, so the
+    mapping is a lookup. `indices()`, `prefixes()` and `wrap_many()` process
+    the whole sequence of values at once; NumPy is used for that if it's
+    installed (any array shape is supported then), ``bisect`` otherwise. NumPy
+    is imported on the first palette creation, not with the package.
+
+    *mode* is either *MODE_RGB* (true color) or *MODE_C256* (the closest
+    xterm 256-color palette entries).
+
+    Usage:
+        >>> latency = Palette([0x00ff00, 0xffff00, 0xff0000], thresholds=[100, 500])
+        >>> latency.wrap(230, '230ms')
+    """
+    def __init__(self, colors: Sequence[Color], thresholds: Sequence[float], mode: str = MODE_RGB, bg: bool = False):
+        if len(colors) != len(thresholds) + 1:
+            raise ValueError(f'Expected {len(thresholds) + 1} colors for {len(thresholds)} thresholds, '
+                             f'got {len(colors)}')
+        if any(a > b for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError('Thresholds must be in ascending order')
+        if mode not in (MODE_RGB, MODE_C256):
+            raise ValueError(f'Invalid color mode: {mode!r}')
+
+        self._colors: List[Tuple[int, int, int]] = [_to_rgb(c) for c in colors]
+        self._thresholds: List[float] = [float(t) for t in thresholds]
+        self._opening_strs: List[str] = [_build_color(rgb, mode, bg).print() for rgb in self._colors]
+        self._closing_str: str = SequenceSGR(sgr.BG_COLOR_OFF if bg else sgr.COLOR_OFF).print()
+
+        self._numpy = _import_numpy()
+        if self._numpy is not None:
+            self._thresholds_arr = self._numpy.asarray(self._thresholds, dtype=float)
+            self._opening_strs_arr = self._numpy.asarray(self._opening_strs, dtype=object)
+
+    @property
+    def colors(self) -> List[Tuple[int, int, int]]:
+        return self._colors
+
+    @property
+    def thresholds(self) -> List[float]:
+        return self._thresholds
+
+    @property
+    def closing_str(self) -> str:
+        if not get_color_mode():
+            return ''
+        return self._closing_str
+
+    def index(self, value: float) -> int:
+        return bisect_right(self._thresholds, value)
+
+    def indices(self, values: Iterable[float]) -> List[int] | Any:
+        """Get color indices for all *values*; result is ``numpy.ndarray`` if NumPy is available."""
+        np = self._numpy
+        if np is not None:
+            return np.searchsorted(self._thresholds_arr, np.asarray(values, dtype=float), side='right')
+        thresholds = self._thresholds
+        return [bisect_right(thresholds, value) for value in values]
+
+    def prefix(self, value: float) -> str:
+        """Get rendered opening sequence for *value*."""
+        if not get_color_mode():
+            return ''
+        return self._opening_strs[bisect_right(self._thresholds, value)]
+
+    def prefixes(self, values: Iterable[float]) -> List[str] | Any:
+        """
+        Get rendered opening sequences for all *values*; result is ``numpy.ndarray``
+        of the same shape as *values* if NumPy is available.
+        """
+        if self._numpy is not None:
+            result = self._opening_strs_arr[self.indices(values)]
+            if not get_color_mode():
+                result[...] = ''
+            return result
+        if not get_color_mode():
+            return ['' for _ in values]
+        opening_strs = self._opening_strs
+        return [opening_strs[idx] for idx in self.indices(values)]
+
+    def wrap(self, value: float, text: Any) -> str:
+        """Colorize *text* according to *value*."""
+        return self.prefix(value) + str(text) + self.closing_str
+
+    def wrap_many(self, values: Iterable[float], texts: Iterable[Any]) -> List[str]:
+        """Colorize each of *texts* according to corresponding item of 1-D *values*."""
+        if not get_color_mode():
+            return [str(text) for text in texts]
+        indices = self.indices(values)
+        if self._numpy is not None:
+            indices = indices.tolist()
+        opening_strs, closing_str = self._opening_strs, self._closing_str
+        return [opening_strs[idx] + str(text) + closing_str for idx, text in zip(indices, texts)]
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{len(self)}]'
+
+
+class Gradient(Palette):
+    """
+    `Palette` with *steps* colors linearly interpolated between *anchors*, which
+    are spread evenly across [*vmin*, *vmax*] range. The range is split into
+    *steps* equal intervals, each of them gets its own color.
+
+    Usage:
+        >>> heat = Gradient([0x0000ff, 0xffff00, 0xff0000], steps=32, vmin=0, vmax=100)
+        >>> rows = [''.join(heat.wrap_many(row, ['██'] * len(row))) for row in load_matrix]
+    """
+    def __init__(self, anchors: Sequence[Color], steps: int = 32, vmin: float = 0.0, vmax: float = 1.0,
+                 mode: str = MODE_RGB, bg: bool = False):
+        if len(anchors) < 2:
+            raise ValueError('At least 2 anchor colors are required')
+        if steps < 2:
+            raise ValueError(f'Invalid steps amount: {steps}')
+        if vmax <= vmin:
+            raise ValueError(f'Invalid value range: [{vmin}, {vmax}]')
+        self._vmin: float = vmin
+        self._vmax: float = vmax
+
+        rgb_anchors = [_to_rgb(c) for c in anchors]
+        colors = [_interpolate(rgb_anchors, step / (steps - 1)) for step in range(steps)]
+        thresholds = [vmin + (vmax - vmin) * step / steps for step in range(1, steps)]
+        super().__init__(colors, thresholds, mode, bg)
+
+    @property
+    def vmin(self) -> float:
+        return self._vmin
+
+    @property
+    def vmax(self) -> float:
+        return self._vmax
+
+
+def _import_numpy():
+    """Import NumPy on the first call, *None* if it's not installed."""
+    global numpy
+    if numpy is _NOT_IMPORTED:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy = module
+    return numpy
+
+
+def _to_rgb(color: Color) -> Tuple[int, int, int]:
+    if isinstance(color, int):
+        if not 0 <= color <= 0xffffff:
+            raise ValueError(f'Invalid color: {color:#x}')
+        return (color >> 16) & 0xff, (color >> 8) & 0xff, color & 0xff
+    r, g, b = color
+    return int(r), int(g), int(b)
+
+
+def _interpolate(anchors: List[Tuple[int, int, int]], pos: float) -> Tuple[int, int, int]:
+    """Get color at *pos* (from 0 to 1) of the gradient between evenly spaced *anchors*."""
+    scaled = pos * (len(anchors) - 1)
+    idx = min(int(scaled), len(anchors) - 2)
+    frac = scaled - idx
+    start, end = anchors[idx], anchors[idx + 1]
+    r, g, b = (round(s + (e - s) * frac) for s, e in zip(start, end))
+    return r, g, b
+
+
+def _build_color(rgb: Tuple[int, int, int], mode: str, bg: bool) -> SequenceSGR:
+    if mode == MODE_C256:
+        return build_c256(_rgb_to_c256(*rgb), bg)
+    return build_rgb(*rgb, bg)
+
+
+_C256_CUBE_LEVELS = [0, 95, 135, 175, 215, 255]
+
+
+def _rgb_to_c256(r: int, g: int, b: int) -> int:
+    """Find the closest color among the 6x6x6 cube and the grayscale ramp of xterm 256-color palette."""
+    cube_idx = [min(range(6), key=lambda i: abs(_C256_CUBE_LEVELS[i] - c)) for c in (r, g, b)]
+    cube_rgb = [_C256_CUBE_LEVELS[i] for i in cube_idx]
+    gray_idx = max(0, min(23, round(((r + g + b) / 3 - 8) / 10)))
+    gray_level = 8 + gray_idx * 10
+
+    cube_dist = sum((c - v) ** 2 for c, v in zip((r, g, b), cube_rgb))
+    gray_dist = sum((c - gray_level) ** 2 for c in (r, g, b))
+    if gray_dist < cube_dist:
+        return 232 + gray_idx
+    return 16 + 36 * cube_idx[0] + 6 * cube_idx[1] + cube_idx[2]
+
+
+_NOT_IMPORTED = object()
+numpy = _NOT_IMPORTED
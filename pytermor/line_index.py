@@ -0,0 +1,232 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import tempfile
+import zlib
+from array import array
+from typing import List, Tuple
+
+from .state import SGR_BYTES_REGEX, SGRState, apply_printed
+from .strf import anchor_lines
+
+
+class LineIndex:
+    """
+    Index of lines of a (possibly huge) file with SGR sequences, which allows
+    to render any window of lines with correct styles without replaying the
+    sequences from the very beginning. The index contains offsets of all the
+    lines and `SGRState` at the start of every *checkpoint_interval*-th line,
+    so getting the style at any line requires replaying at most that amount
+    of lines.
+
+    The file is memory-mapped and scanned on `update()`, which processes only
+    the data appended since the previous call; incomplete last line is not
+    indexed until it ends. The index is persisted into a binary sidecar file
+    with `save()` (*path* + ``.ptidx`` by default) and loaded from it on
+    creation, if it's valid for the file.
+
+    Usage:
+        >>> with LineIndex('/var/log/build.log') as index:
+        ...     index.update()
+        ...     index.save()
+        ...     print('\\n'.join(index.render(1000000, 50)))
+    """
+    SIDECAR_SUFFIX = '.ptidx'
+
+    def __init__(self, path: str, checkpoint_interval: int = 256, sidecar_path: str = None):
+        if checkpoint_interval < 1:
+            raise ValueError(f'Invalid checkpoint interval: {checkpoint_interval}')
+        self._path: str = path
+        self._sidecar_path: str = sidecar_path or path + self.SIDECAR_SUFFIX
+        self._checkpoint_interval: int = checkpoint_interval
+        self._mmap: mmap.mmap | None = None
+        self._reset()
+        self._load()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def sidecar_path(self) -> str:
+        return self._sidecar_path
+
+    @property
+    def checkpoint_interval(self) -> int:
+        return self._checkpoint_interval
+
+    @property
+    def indexed_size(self) -> int:
+        """Amount of bytes of the file which are indexed, i.e. offset of the incomplete last line."""
+        return self._offsets[-1]
+
+    def update(self) -> int:
+        """Index the lines appended to the file since the last update, return their amount."""
+        size = os.path.getsize(self._path)
+        if size < self.indexed_size or self._read_head_crc(self._head_len) != self._head_crc:
+            self._reset()  # file was truncated or replaced
+        self._remap(size)
+        if size == self.indexed_size:
+            return 0
+
+        prev_count = len(self._offsets) - 1
+        self._offsets.extend(m.end() for m in _NEWLINE_REGEX.finditer(self._mmap, self.indexed_size))
+        line_count = len(self._offsets) - 1
+        if self._head_len < _HEAD_CRC_LEN:
+            self._head_len = min(_HEAD_CRC_LEN, self.indexed_size)
+            self._head_crc = self._read_head_crc(self._head_len)
+
+        state, state_offset = self._end_state, self._offsets[prev_count]
+        first_checkpoint = len(self._checkpoints) // 3
+        for checkpoint_idx in range(first_checkpoint, line_count // self._checkpoint_interval + 1):
+            checkpoint_offset = self._offsets[checkpoint_idx * self._checkpoint_interval]
+            state = _replay(self._mmap, state_offset, checkpoint_offset, state)
+            state_offset = checkpoint_offset
+            self._checkpoints.extend((state.attrs, state.fg, state.bg))
+        self._end_state = _replay(self._mmap, state_offset, self.indexed_size, state)
+        return line_count - prev_count
+
+    def __len__(self) -> int:
+        """Amount of lines, including the incomplete last line (if the file doesn't end with a line break)."""
+        if self._mmap is not None and len(self._mmap) > self.indexed_size:
+            return len(self._offsets)
+        return len(self._offsets) - 1
+
+    def get_line(self, idx: int) -> bytes:
+        """Get raw line at *idx* with the line break (if any)."""
+        start, end = self._get_bounds(idx)
+        return self._mmap[start:end]
+
+    def state_at(self, idx: int) -> SGRState:
+        """Get the style in effect at the start of line *idx*."""
+        self._get_bounds(idx)
+        checkpoint_idx = idx // self._checkpoint_interval
+        state = SGRState(*self._checkpoints[checkpoint_idx * 3:checkpoint_idx * 3 + 3])
+        return _replay(self._mmap, self._offsets[checkpoint_idx * self._checkpoint_interval], self._offsets[idx],
+                       state)
+
+    def render(self, start: int, count: int, encoding: str = 'utf-8', errors: str = 'replace') -> List[str]:
+        """
+        Get *count* lines starting from *start* without line breaks, each of them
+        self-contained, i.e. with the style in effect reopened at the start and
+        closed at the end (see `anchor_lines()`).
+        """
+        end = min(len(self), start + count)
+        if start >= end:
+            return []
+        lines = (self.get_line(idx).decode(encoding, errors) for idx in range(start, end))
+        return [line.rstrip('\r\n') for line in anchor_lines(lines, self.state_at(start))]
+
+    def save(self):
+        """
+        Write the index into the sidecar file, replacing it atomically.
+
+        :raises ValueError: if the sidecar path exists and is not a regular file
+        """
+        if os.path.exists(self._sidecar_path) and not os.path.isfile(self._sidecar_path):
+            raise ValueError(f'Sidecar path is not a regular file: {self._sidecar_path!r}')
+        header = _HEADER.pack(_MAGIC, self._checkpoint_interval, self._head_len, self._head_crc,
+                              len(self._offsets), len(self._checkpoints) // 3,
+                              self._end_state.attrs, self._end_state.fg, self._end_state.bg)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self._sidecar_path)), prefix='.pytermor-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                self._offsets.tofile(f)
+                self._checkpoints.tofile(f)
+            os.replace(tmp_path, self._sidecar_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> LineIndex:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{self._path!r}, {len(self)} lines]'
+
+    def _reset(self):
+        self._offsets: array = array('Q', [0])
+        self._checkpoints: array = array('Q')
+        self._end_state: SGRState = SGRState()
+        self._head_len: int = 0
+        self._head_crc: int = 0
+
+    def _load(self):
+        """Load the index from the sidecar file, if it exists and matches the file."""
+        try:
+            with open(self._sidecar_path, 'rb') as f:
+                header = f.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return
+                magic, interval, head_len, head_crc, offsets_count, checkpoints_count, *end_state = \
+                    _HEADER.unpack(header)
+                if magic != _MAGIC or interval != self._checkpoint_interval:
+                    return
+                offsets, checkpoints = array('Q'), array('Q')
+                offsets.fromfile(f, offsets_count)
+                checkpoints.fromfile(f, checkpoints_count * 3)
+        except (OSError, EOFError, struct.error):
+            return
+
+        self._offsets, self._checkpoints = offsets, checkpoints
+        self._end_state = SGRState(*end_state)
+        self._head_len, self._head_crc = head_len, head_crc
+
+    def _remap(self, size: int):
+        if self._mmap is not None and len(self._mmap) == size:
+            return
+        self.close()
+        if size:
+            with open(self._path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _read_head_crc(self, head_len: int) -> int:
+        if not head_len:
+            return 0
+        with open(self._path, 'rb') as f:
+            return zlib.crc32(f.read(head_len))
+
+    def _get_bounds(self, idx: int) -> Tuple[int, int]:
+        if not 0 <= idx < len(self):
+            raise IndexError(f'Line index out of range: {idx}')
+        if self._mmap is None:
+            raise RuntimeError('File is not mapped, call update() first')
+        if idx + 1 < len(self._offsets):
+            return self._offsets[idx], self._offsets[idx + 1]
+        return self._offsets[idx], len(self._mmap)
+
+
+def _replay(data: mmap.mmap, start: int, end: int, state: SGRState) -> SGRState:
+    """Apply SGR sequences from *data* in [start, end) range to *state*."""
+    for reset_bytes in _RESET_BYTES:
+        reset_pos = data.rfind(reset_bytes, start, end)
+        if reset_pos >= 0:  # everything before the last reset doesn't matter
+            start, state = reset_pos + len(reset_bytes), SGRState()
+    if start < end:
+        for match in SGR_BYTES_REGEX.finditer(data, start, end):
+            state = apply_printed(state, match.group(0))
+    return state
+
+
+_MAGIC = b'PTLIDX\x00\x01'
+_HEADER = struct.Struct('<8sIIIQQQQQ')
+_HEAD_CRC_LEN = 4096
+
+_NEWLINE_REGEX = re.compile(b'\n')
+_RESET_BYTES = (b'\x1b[0m', b'\x1b[m')
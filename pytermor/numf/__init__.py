@@ -10,10 +10,13 @@ __all__ = [
     'format_auto_float',
 
     'format_prefixed_unit',
+    'format_prefixed_unit_interval',
     'PrefixedUnitPreset',
     'PRESET_SI_METRIC',
     'PRESET_SI_BINARY',
 
     'format_time_delta',
+    'format_time_delta_until',
+    'format_time_delta_ns',
     'TimeDeltaPreset',
 ]
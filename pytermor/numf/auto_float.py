@@ -4,6 +4,8 @@
 # -----------------------------------------------------------------------------
 from math import trunc
 
+from .. import common
+
 
 def format_auto_float(value: float, max_len: int) -> str:
     """
@@ -20,15 +22,19 @@ def format_auto_float(value: float, max_len: int) -> str:
     :param max_len: maximum output string length (total)
     :return: formatted value
     """
+    if common.numf_hook is not None:
+        common.numf_hook('format_auto_float', f'max_len={max_len}')
+
+    return f'{value:{max_len}.{_get_decimals_len(value, max_len)}f}'
+
+
+def _get_decimals_len(value: float, max_len: int) -> int:
     max_decimals_len = max_len - 2
     if value < 0:
         max_decimals_len -= 1  # minus sign
     integer_len = len(str(trunc(value)))
     decimals_and_point_len = min(max_decimals_len + 1, max_len - integer_len)
 
-    decimals_len = 0
     if decimals_and_point_len >= 2:  # dot without decimals makes no sense
-        decimals_len = decimals_and_point_len - 1
-    dot_str = f'.{decimals_len!s}'
-
-    return f'{value:{max_len}{dot_str}f}'
+        return decimals_and_point_len - 1
+    return 0
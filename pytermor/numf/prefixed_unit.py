@@ -6,9 +6,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import trunc
-from typing import List
+from typing import List, Tuple
 
-from . import format_auto_float
+from .auto_float import format_auto_float, _get_decimals_len
+from .. import common
 
 
 @dataclass
@@ -98,7 +99,47 @@ def format_prefixed_unit(value: float, preset: PrefixedUnitPreset = None) -> str
     """
     if preset is None:
         preset = PRESET_SI_BINARY
+    if common.numf_hook is not None:
+        common.numf_hook('format_prefixed_unit', preset)
+    return _format(value, preset)[0]
 
+
+def format_prefixed_unit_interval(value: float, preset: PrefixedUnitPreset = None) -> Tuple[str, float, float]:
+    """
+    Same as `format_prefixed_unit()`, but also return the closed interval
+    of input values which are formatted to the same string, taking into
+    account rounding of `format_auto_float()` and truncation of integer
+    input. The cached string can be used until the value leaves the interval.
+
+    Zero and the values out of prefixes range result in a single point
+    interval, as the strings around them are different.
+
+    Usage:
+        >>> format_prefixed_unit_interval(1257800)
+        ('1.200 Mb', 1257766.912, 1258815.488)
+
+    :param value: input value
+    :param preset: formatter settings
+    :return: formatted value, lower and upper bounds of the interval
+    """
+    if preset is None:
+        preset = PRESET_SI_BINARY
+    if common.numf_hook is not None:
+        common.numf_hook('format_prefixed_unit_interval', preset)
+
+    result, unit_idx, scaled_value = _format(value, preset)
+    if value == 0 or unit_idx is None:
+        return result, value, value
+
+    scaled_lower, scaled_upper = _get_scaled_bounds(scaled_value, preset, unit_idx)
+    scale = preset.mcoef ** (unit_idx - preset.prefix_zero_idx)
+    lower = _shrink_bound(min(value, scaled_lower * scale), value, result, preset)
+    upper = _shrink_bound(max(value, scaled_upper * scale), value, result, preset)
+    return result, lower, upper
+
+
+def _format(value: float, preset: PrefixedUnitPreset) -> Tuple[str, int | None, float]:
+    """Format *value*, return the result along with prefix index and *value* scaled accordingly."""
     prefixes = preset.prefixes or ['']
     unit_separator = preset.unit_separator or ''
     unit_idx = preset.prefix_zero_idx or ''
@@ -120,9 +161,78 @@ def format_prefixed_unit(value: float, preset: PrefixedUnitPreset = None) -> str
         else:
             num_str = format_auto_float(value, preset.max_value_len)
 
-        return f'{num_str.strip()}{unit_separator}{unit_full}'
+        return f'{num_str.strip()}{unit_separator}{unit_full}', unit_idx, value
 
     # no more prefixes left
     return f'{value!r:{preset.max_value_len}.{preset.max_value_len}}{preset.unit_separator or ""}' + \
            '?' * max([len(p) for p in prefixes if p]) + \
-           (preset.unit or "")
+           (preset.unit or ""), None, value
+
+
+def _get_scaled_bounds(value: float, preset: PrefixedUnitPreset, unit_idx: int) -> Tuple[float, float]:
+    """
+    Estimate the range of scaled values formatted the same as *value* with
+    prefix *unit_idx*. The bounds can be inclusive or exclusive, depending
+    on the rounding, and are to be verified by `_shrink_bound()`.
+    """
+    # prefix is chosen by scaling the value until it's in (1/mcoef, mcoef) range
+    lower, upper = 1 / preset.mcoef, preset.mcoef
+    if unit_idx > preset.prefix_zero_idx:
+        lower = 1
+    elif unit_idx < preset.prefix_zero_idx:
+        upper = 1
+    if value < 0:
+        lower, upper = -upper, -lower
+
+    integer_part = trunc(value)
+    if preset.integer_input and unit_idx == preset.prefix_zero_idx:
+        if value > 0:
+            return max(lower, integer_part), min(upper, integer_part + 1)
+        return max(lower, integer_part - 1), min(upper, integer_part)
+
+    decimals_len = _get_decimals_len(value, preset.max_value_len)
+    rounded = round(value, decimals_len)
+    half_step = 0.5 * 10 ** -decimals_len
+    lower, upper = max(lower, rounded - half_step), min(upper, rounded + half_step)
+
+    # amount of decimals depends on integer part length, which can change only
+    # at powers of 10, so find the range of lengths with the same amount
+    sign = 1 if value > 0 else -1
+    min_digits = max_digits = len(str(abs(integer_part)))
+    while min_digits > 1 and _get_decimals_len(sign * 10 ** (min_digits - 2), preset.max_value_len) == decimals_len:
+        min_digits -= 1
+    while 10 ** max_digits < preset.mcoef and \
+            _get_decimals_len(sign * 10 ** max_digits, preset.max_value_len) == decimals_len:
+        max_digits += 1
+
+    abs_lower, abs_upper = (10 ** (min_digits - 1) if min_digits > 1 else 0), 10 ** max_digits
+    if value > 0:
+        return max(lower, abs_lower), min(upper, abs_upper)
+    return max(lower, -abs_upper), min(upper, -abs_lower)
+
+
+def _shrink_bound(bound: float, value: float, expected: str, preset: PrefixedUnitPreset) -> float:
+    """
+    Move *bound* towards *value* until it's formatted as *expected*: first with
+    exponentially growing steps, then bisecting the last step a few times.
+    """
+    if _format(bound, preset)[0] == expected:
+        return bound
+    outer, ratio = bound, 2.0 ** -45
+    while True:
+        inner = outer + (value - outer) * ratio
+        if _format(inner, preset)[0] == expected:
+            break
+        outer, ratio = inner, min(1.0, ratio * 2)
+    for _ in range(_SHRINK_BISECT_STEPS):
+        middle = (inner + outer) / 2
+        if middle in (inner, outer):
+            break
+        if _format(middle, preset)[0] == expected:
+            inner = middle
+        else:
+            outer = middle
+    return inner
+
+
+_SHRINK_BISECT_STEPS = 16
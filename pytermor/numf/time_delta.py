@@ -4,9 +4,13 @@
 # -----------------------------------------------------------------------------
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
-from math import floor, trunc, isclose
-from typing import List
+from datetime import timedelta
+from math import floor, trunc, isclose, inf
+from typing import Dict, List, Tuple
+
+from .. import common
 
 
 @dataclass
@@ -25,6 +29,8 @@ class TimeDeltaPreset:
     unit_separator: str|None
     plural_suffix: str|None
     overflow_msg: str|None
+    base_unit_ns: int = 1000000000
+    """Length of the first unit in nanoseconds."""
 
 
 FMT_PRESET_DEFAULT_KEY = 10
@@ -82,7 +88,67 @@ FMT_PRESETS = {
 }
 
 
-def format_time_delta(seconds: float, max_len: int = None) -> str:
+FMT_PRESETS_SUBSECOND = {
+    5: TimeDeltaPreset([
+        TimeUnit('ns', 1000),
+        TimeUnit('μs', 1000),
+        TimeUnit('ms', 1000),
+        TimeUnit('s', 60),
+        TimeUnit('m', 60),
+        TimeUnit('h', 24),
+        TimeUnit('d', overflow_afer=99),
+    ], allow_negative=False,
+        unit_separator=None,
+        plural_suffix=None,
+        overflow_msg='OVERF',
+        base_unit_ns=1,
+    ),
+
+    6: TimeDeltaPreset([
+        TimeUnit('ns', 1000),
+        TimeUnit('μs', 1000),
+        TimeUnit('ms', 1000),
+        TimeUnit('sec', 60),
+        TimeUnit('min', 60),
+        TimeUnit('hr', 24, collapsible_after=10),
+        TimeUnit('day', 30, collapsible_after=10),
+        TimeUnit('mon', 12),
+        TimeUnit('yr', overflow_afer=99),
+    ], allow_negative=False,
+        unit_separator=' ',
+        plural_suffix=None,
+        overflow_msg='OVERFL',
+        base_unit_ns=1,
+    ),
+
+    FMT_PRESET_DEFAULT_KEY: TimeDeltaPreset([
+        TimeUnit('ns', 1000),
+        TimeUnit('μs', 1000),
+        TimeUnit('ms', 1000, custom_short='ms'),
+        TimeUnit('sec', 60, collapsible_after=10),
+        TimeUnit('min', 60, custom_short='min'),
+        TimeUnit('hour', 24, collapsible_after=24),
+        TimeUnit('day', 30, collapsible_after=10),
+        TimeUnit('mon', 12),
+        TimeUnit('yr', overflow_afer=999),
+    ], allow_negative=True,
+        unit_separator=' ',
+        plural_suffix=None,
+        overflow_msg='OVERFLOW',
+        base_unit_ns=1,
+    ),
+}
+"""
+Presets with sub-second units for `format_time_delta_ns()`.
+
+Example outputs:
+  - max_len=5: 750ns | 12μs | 15ms | 10s | 5m
+  - max_len=6: 750 ns | 12 μs | 15 ms | 10 sec | 4h 15m
+  - max_len=10: 750 ns | 15 ms | 9s 500ms | 10 sec | 4h 15min
+"""
+
+
+def format_time_delta(seconds: float | timedelta, max_len: int = None) -> str:
     """
     Format time delta using suitable format (which depends on
     *max_len* argument). Key feature of this formatter is
@@ -100,38 +166,114 @@ def format_time_delta(seconds: float, max_len: int = None) -> str:
       - max_len=6: 10 sec | 5 min | 4h 15m | 5d 22h
       - max_len=10: 10 secs | 5 mins | 4h 15min | 5d 22h
 
+    *seconds* can also be a ``timedelta``, which is formatted with
+    integer arithmetic, see `format_time_delta_ns()`.
+
     :param seconds: value to format
     :param max_len: maximum output string length (total)
     :return: formatted string
     """
-    preset = None
+    preset_key, preset = _get_preset(max_len)
+    if common.numf_hook is not None:
+        common.numf_hook('format_time_delta', f'max_len={preset_key}')
+    if isinstance(seconds, timedelta):
+        return _format_ns(_timedelta_to_ns(seconds), max_len, preset)
+    return _format(seconds, max_len, preset)[0]
+
+
+def format_time_delta_ns(nanoseconds: int | timedelta, max_len: int = None, subsecond: bool = False) -> str:
+    """
+    Same as `format_time_delta()`, but for integer amount of nanoseconds, e.g.
+    from ``time.perf_counter_ns()``, or a ``timedelta``. The value is split into
+    units with integer ``divmod``, without conversion to float seconds.
+
+    If *subsecond* is *True*, presets from *FMT_PRESETS_SUBSECOND* with units
+    from nanoseconds to years are used; these are defined for max_len= 5, 6
+    and 10.
+
+    :param nanoseconds: value to format
+    :param max_len: maximum output string length (total)
+    :param subsecond: use presets with sub-second units
+    :return: formatted string
+    """
+    presets = FMT_PRESETS_SUBSECOND if subsecond else FMT_PRESETS
+    preset_key, preset = _get_preset(max_len, presets)
+    if common.numf_hook is not None:
+        common.numf_hook('format_time_delta_ns', f'max_len={preset_key}' + (' subsecond' if subsecond else ''))
+    if isinstance(nanoseconds, timedelta):
+        nanoseconds = _timedelta_to_ns(nanoseconds)
+    return _format_ns(nanoseconds, max_len, preset)
+
+
+def format_time_delta_until(seconds: float, max_len: int = None) -> Tuple[str, float]:
+    """
+    Same as `format_time_delta()`, but also return the value up to which
+    (exclusive) the output stays the same, provided that the input is
+    increasing. That is the next boundary of the smallest displayed unit,
+    e.g. ``('4h 15min', 15360)`` for *seconds* = 15300.5. Live counters can
+    skip formatting until the value reaches that point. For overflown values
+    the boundary is ``inf``. Negative values are truncated towards zero, so
+    e.g. -58 is the last value displayed as ``-58 secs``, and the returned
+    boundary is the closest float above it.
+
+    :param seconds: value to format
+    :param max_len: maximum output string length (total)
+    :return: formatted string and the value up to which it is valid
+    """
+    preset_key, preset = _get_preset(max_len)
+    if common.numf_hook is not None:
+        common.numf_hook('format_time_delta_until', f'max_len={preset_key}')
+    result, lower, upper = _format(seconds, max_len, preset)
+    if seconds < 0:
+        return result, _next_float_above(-lower) if lower else 0
+    return result, upper
+
+
+def _next_float_above(value: float) -> float:
+    """Get the smallest float greater than non-zero *value*."""
+    bits, = struct.unpack('<Q', struct.pack('<d', value))
+    return struct.unpack('<d', struct.pack('<Q', bits + 1 if value > 0 else bits - 1))[0]
+
+
+def _get_preset(max_len: int | None, presets: Dict[int, TimeDeltaPreset] = None) -> Tuple[int, TimeDeltaPreset]:
+    if presets is None:
+        presets = FMT_PRESETS
     if max_len is None:
-        preset = FMT_PRESETS[FMT_PRESET_DEFAULT_KEY]
-    else:
-        fmt_preset_list = sorted(
-            [key for key in FMT_PRESETS.keys() if key <= max_len],
-            key=lambda k: k,
-            reverse=True,
-        )
-        if len(fmt_preset_list) > 0:
-            preset = FMT_PRESETS[fmt_preset_list[0]]
-
-    if not preset:
+        return FMT_PRESET_DEFAULT_KEY, presets[FMT_PRESET_DEFAULT_KEY]
+
+    fmt_preset_list = sorted(
+        [key for key in presets.keys() if key <= max_len],
+        key=lambda k: k,
+        reverse=True,
+    )
+    if len(fmt_preset_list) == 0:
         raise ValueError(f'No settings defined for max length = {max_len} (or less)')
+    return fmt_preset_list[0], presets[fmt_preset_list[0]]
 
+
+def _format(seconds: float, max_len: int | None, preset: TimeDeltaPreset) -> Tuple[str, float, float]:
+    """
+    Format *seconds* and find the range of absolute input values, in which
+    the output is the same, as (result, lower bound, upper bound). The lower
+    bound is inclusive, the upper one is exclusive.
+    """
     num = abs(seconds)
     unit_idx = 0
+    unit_seconds = prev_unit_seconds = 1
     prev_frac = ''
 
     negative = preset.allow_negative and seconds < 0
     sign = '-' if negative else ''
     result = None
+    step = None
 
     while result is None and unit_idx < len(preset.units):
         unit = preset.units[unit_idx]
         if unit.overflow_afer and num > unit.overflow_afer:
             result = preset.overflow_msg[0:max_len]
-            break
+            if unit_idx:
+                return result, (unit.overflow_afer + 1) * unit_seconds, inf
+            return result, unit.overflow_afer, inf
 
         unit_name = unit.name
         unit_name_suffixed = unit_name
@@ -147,23 +289,81 @@ def format_time_delta(seconds: float, max_len: int = None) -> str:
 
         if abs(num) < 1:
             if negative:
-                result = f'~0{unit_separator}{unit_name_suffixed:s}'
+                return f'~0{unit_separator}{unit_name_suffixed:s}', 0, 1
             elif isclose(num, 0, abs_tol=1e-03):
-                result = f'0{unit_separator}{unit_name_suffixed:s}'
+                return f'0{unit_separator}{unit_name_suffixed:s}', 0, _next_float_above(1e-03)
             else:
-                result = f'<1{unit_separator}{unit_name:s}'
+                return f'<1{unit_separator}{unit_name:s}', _next_float_above(1e-03), 1
 
         elif unit.collapsible_after is not None and num < unit.collapsible_after:
             result = f'{sign}{floor(num):d}{short_unit_name:s}{unit_separator}{prev_frac:<s}'
+            step = prev_unit_seconds
 
         elif not next_unit_ratio or num < next_unit_ratio:
             result = f'{sign}{floor(num):d}{unit_separator}{unit_name_suffixed:s}'
+            step = unit_seconds
 
         else:
             next_num = floor(num / next_unit_ratio)
             prev_frac = '{:d}{:s}'.format(floor(num - (next_num * next_unit_ratio)), short_unit_name)
             num = next_num
             unit_idx += 1
+            prev_unit_seconds = unit_seconds
+            unit_seconds *= next_unit_ratio
             continue
 
-    return result or ''
+    if step is None:
+        return result or '', 0, inf
+    lower = floor(abs(seconds) / step) * step
+    return result, lower, lower + step
+
+
+def _format_ns(nanoseconds: int, max_len: int | None, preset: TimeDeltaPreset) -> str:
+    """Integer counterpart of `_format()`, the results are the same for the same values."""
+    abs_ns = abs(nanoseconds)
+    num, frac_ns = divmod(abs_ns, preset.base_unit_ns)
+    unit_idx = 0
+    prev_frac = ''
+
+    negative = preset.allow_negative and nanoseconds < 0
+    sign = '-' if negative else ''
+    unit_separator = preset.unit_separator or ''
+
+    while unit_idx < len(preset.units):
+        unit = preset.units[unit_idx]
+        if unit.overflow_afer and (num > unit.overflow_afer or num == unit.overflow_afer and frac_ns):
+            return preset.overflow_msg[0:max_len]
+
+        unit_name = unit.name
+        unit_name_suffixed = unit_name
+        if preset.plural_suffix and num != 1:
+            unit_name_suffixed += preset.plural_suffix
+
+        short_unit_name = unit_name[0]
+        if unit.custom_short:
+            short_unit_name = unit.custom_short
+
+        next_unit_ratio = unit.in_next
+
+        if num == 0:
+            if negative:
+                return f'~0{unit_separator}{unit_name_suffixed:s}'
+            elif abs_ns * 1000 <= preset.base_unit_ns:
+                return f'0{unit_separator}{unit_name_suffixed:s}'
+            return f'<1{unit_separator}{unit_name:s}'
+
+        elif unit.collapsible_after is not None and num < unit.collapsible_after:
+            return f'{sign}{num:d}{short_unit_name:s}{unit_separator}{prev_frac:<s}'
+
+        elif not next_unit_ratio or num < next_unit_ratio:
+            return f'{sign}{num:d}{unit_separator}{unit_name_suffixed:s}'
+
+        num, remainder = divmod(num, next_unit_ratio)
+        prev_frac = f'{remainder:d}{short_unit_name:s}'
+        frac_ns = 0
+        unit_idx += 1
+    return ''
+
+
+def _timedelta_to_ns(delta: timedelta) -> int:
+    return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
@@ -0,0 +1,25 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+"""
+Buffered writers and renderers for formatted output. This package is not
+imported by ``pytermor`` itself, import it explicitly when needed.
+"""
+from .async_sink import *
+from .threaded_writer import *
+from .log_formatter import *
+from .live_region import *
+from .redraw_scheduler import *
+from .vectored_writer import *
+
+__all__ = [
+    'AsyncSink',
+    'ThreadedWriter',
+    'POLICY_BLOCK',
+    'POLICY_DROP',
+    'LogFormatter',
+    'LiveRegion',
+    'RedrawScheduler',
+    'VectoredWriter',
+]
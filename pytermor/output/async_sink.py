@@ -0,0 +1,96 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Set
+
+from ..fmt import Format
+
+
+class AsyncSink:
+    """
+    Buffered output for ``asyncio.StreamWriter``. Formatted fragments are
+    accumulated as references to their parts (without concatenating them with
+    SGR sequences one by one), and then joined, encoded and written in one go
+    when the buffer size exceeds *flush_size* characters, or *flush_interval*
+    seconds after the first unflushed write, whichever comes first.
+
+    Size-triggered flushes are awaited by `write()` along with
+    ``StreamWriter.drain()``, so fast producers are slowed down when the
+    transport buffer is full.
+
+    Usage:
+        >>> async with AsyncSink(writer) as sink:
+        ...     await sink.write('OK', fmt.green)
+        ...     await sink.write(' 5 jobs\\n')
+    """
+    def __init__(self, writer: asyncio.StreamWriter, flush_size: int = 64 * 1024,
+                 flush_interval: float = 0.05, encoding: str = 'utf-8'):
+        self._writer: asyncio.StreamWriter = writer
+        self._flush_size: int = flush_size
+        self._flush_interval: float = flush_interval
+        self._encoding: str = encoding
+
+        self._buffer: List[str] = []
+        self._buffer_len: int = 0
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_tasks: Set[asyncio.Task] = set()
+
+        self.bytes_written: int = 0
+        self.flush_count: int = 0
+
+    async def write(self, text: Any, fmt: Format = None):
+        text = str(text)
+        if fmt is None:
+            self._buffer.append(text)
+            self._buffer_len += len(text)
+        else:
+            opening_str, closing_str = fmt.opening_str, fmt.closing_str
+            self._buffer += (opening_str, text, closing_str)
+            self._buffer_len += len(opening_str) + len(text) + len(closing_str)
+
+        if self._buffer_len >= self._flush_size:
+            await self.flush()
+        elif self._timer is None and self._flush_interval is not None:
+            self._timer = asyncio.get_running_loop().call_later(self._flush_interval, self._on_timer)
+
+    async def flush(self):
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return
+
+            data = ''.join(self._buffer).encode(self._encoding)
+            self._buffer.clear()
+            self._buffer_len = 0
+
+            self._writer.write(data)
+            self.bytes_written += len(data)
+            self.flush_count += 1
+            await self._writer.drain()
+
+    async def close(self, close_writer: bool = True):
+        await self.flush()
+        if self._timer_tasks:
+            await asyncio.gather(*self._timer_tasks)
+        if close_writer:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+    def _on_timer(self):
+        self._timer = None
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._timer_tasks.add(task)
+        task.add_done_callback(self._timer_tasks.discard)
+
+    async def __aenter__(self) -> AsyncSink:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,118 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import re
+from typing import IO, List
+
+from .. import seq
+from ..strf import ReplaceSGR, slice_fmtd
+
+
+class LiveRegion:
+    """
+    Multi-line region at the bottom of the terminal which is redrawn in place,
+    e.g. a set of progress bars. Previously drawn lines are kept, and on each
+    `update()` only the lines that differ are rewritten, while the cursor is
+    moved over the unchanged ones. If the new line shares a beginning with the
+    old one, only the differing tail is rewritten.
+
+    Lines must not contain newlines and should fit into the terminal width
+    (see `truncate_fmtd()`), otherwise cursor positioning will be broken.
+
+    Usage:
+        >>> region = LiveRegion(sys.stdout)
+        >>> for frame in frames:
+        ...     region.update([render_progress(job) for job in jobs])
+        >>> region.finish()
+    """
+    def __init__(self, stream: IO[str]):
+        self._stream: IO[str] = stream
+        self._lines: List[str] = []
+        self.bytes_written: int = 0
+
+    @property
+    def lines(self) -> List[str]:
+        return self._lines
+
+    def update(self, lines: List[str]):
+        old_lines = self._lines
+        parts: List[str] = []
+        if old_lines:
+            parts += ('\r', seq.build_cursor_up(len(old_lines)).print())
+
+        unchanged = 0
+        for idx, line in enumerate(lines):
+            old_line = old_lines[idx] if idx < len(old_lines) else None
+            if line == old_line:
+                unchanged += 1
+                continue
+            if unchanged:
+                parts.append(seq.build_cursor_down(unchanged).print())
+                unchanged = 0
+            parts += (self._render_line_update(old_line, line), '\n')
+
+        if unchanged:
+            parts.append(seq.build_cursor_down(unchanged).print())
+        if len(lines) < len(old_lines):
+            parts.append(seq.ERASE_BELOW.print())
+
+        self._lines = list(lines)
+        self._write(''.join(parts))
+
+    def clear(self):
+        """Erase the region and move the cursor to its first line."""
+        if self._lines:
+            self._write('\r' + seq.build_cursor_up(len(self._lines)).print() + seq.ERASE_BELOW.print())
+        self._lines = []
+
+    def finish(self):
+        """Leave the region as is and start a new one below it."""
+        self._lines = []
+
+    def _write(self, data: str):
+        if not data:
+            return
+        self._stream.write(data)
+        self._stream.flush()
+        self.bytes_written += len(data)
+
+    # noinspection PyMethodMayBeStatic
+    def _render_line_update(self, old_line: str | None, line: str) -> str:
+        full_update = line + seq.ERASE_LINE_TAIL.print()
+        if not old_line:
+            return full_update
+
+        prefix_len = _common_prefix_len(old_line, line)
+        if prefix_len == 0:
+            return full_update
+
+        column = len(ReplaceSGR().apply(line[:prefix_len]))
+        tail_update = seq.build_cursor_column(column + 1).print() + slice_fmtd(line, column) + \
+            seq.ERASE_LINE_TAIL.print()
+        if len(tail_update) < len(full_update):
+            return tail_update
+        return full_update
+
+
+_CSI_REGEX = re.compile(r'\033\[[0-9;:<=>?]*[@A-Za-z]')
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Get length of the common beginning of two strings, not ending inside a CSI sequence."""
+    prefix_len, max_len = 0, min(len(a), len(b))
+    while prefix_len < max_len:
+        mid = (prefix_len + max_len + 1) // 2
+        if a[:mid] == b[:mid]:
+            prefix_len = mid
+        else:
+            max_len = mid - 1
+
+    esc_pos = b.rfind('\033', 0, prefix_len)
+    if esc_pos != -1:
+        match = _CSI_REGEX.match(b, esc_pos)
+        if not match or match.end() > prefix_len:
+            return esc_pos
+    return prefix_len
@@ -0,0 +1,121 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import logging
+import sys
+from bisect import bisect_right
+from string import Formatter
+from typing import Dict, IO, Iterable, List
+
+from .. import fmt, sgr
+from ..fmt import Format, autof
+from ..numf import format_time_delta
+
+DEFAULT_LEVEL_FORMATS: Dict[int, Format] = {
+    logging.DEBUG: fmt.gray,
+    logging.INFO: fmt.noop,
+    logging.WARNING: fmt.yellow,
+    logging.ERROR: fmt.red,
+    logging.CRITICAL: autof(sgr.BOLD, sgr.RED),
+}
+
+
+class LogFormatter(logging.Formatter):
+    """
+    ``logging.Formatter`` with per-level formatting of the specified record fields.
+
+    *template* is a ``str.format`` string with record attribute names as the
+    fields; there is also ``{reltime}`` field available, which is the time since
+    logging module initialization formatted with `format_time_delta()` (see
+    *reltime_len*). Instead of wrapping the fields on every record, the template
+    is compiled in advance into separate ``str.format`` templates for each level,
+    with opening and closing sequences already inlined.
+
+    SGR sequences are not used at all if *colorize* is *False*. Default value
+    is *True* if *stream* (or ``sys.stderr``, if *stream* is omitted) is a
+    terminal.
+
+    Usage:
+        >>> handler = logging.StreamHandler(sys.stderr)
+        >>> handler.setFormatter(LogFormatter('{reltime:>6s} {levelname:8s} {message}'))
+    """
+    def __init__(self, template: str = '{reltime:>6s} {levelname:<8s} {name}: {message}',
+                 level_formats: Dict[int, Format] = None, styled_fields: Iterable[str] = ('levelname',),
+                 colorize: bool = None, stream: IO = None, reltime_len: int = 6, datefmt: str = None):
+        super().__init__(datefmt=datefmt)
+        if colorize is None:
+            colorize = _isatty(stream or sys.stderr)
+        if level_formats is None:
+            level_formats = DEFAULT_LEVEL_FORMATS
+        if not colorize:
+            level_formats = {logging.NOTSET: fmt.noop}
+
+        parsed_template = list(Formatter().parse(template))
+        field_names = {field_name for _, field_name, _, _ in parsed_template if field_name}
+        self._uses_asctime: bool = 'asctime' in field_names
+        self._uses_reltime: bool = 'reltime' in field_names
+        self._reltime_len: int = reltime_len
+
+        self._levels: List[int] = sorted(level_formats.keys())
+        self._level_templates: Dict[int, str] = {
+            level: _compile_template(parsed_template, set(styled_fields), level_formats[level])
+            for level in self._levels
+        }
+
+    def usesTime(self) -> bool:
+        return self._uses_asctime
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        if self._uses_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+        if self._uses_reltime:
+            record.reltime = format_time_delta(record.relativeCreated / 1000, self._reltime_len)
+
+        result = self._get_level_template(record.levelno).format_map(record.__dict__)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            result += '\n' + record.exc_text
+        if record.stack_info:
+            result += '\n' + self.formatStack(record.stack_info)
+        return result
+
+    def _get_level_template(self, levelno: int) -> str:
+        level_template = self._level_templates.get(levelno, None)
+        if level_template is None:
+            level_idx = max(0, bisect_right(self._levels, levelno) - 1)
+            level_template = self._level_templates[self._levels[level_idx]]
+            self._level_templates[levelno] = level_template
+        return level_template
+
+
+def _compile_template(parsed_template: List[tuple], styled_fields: set, level_format: Format) -> str:
+    result = ''
+    for literal_text, field_name, format_spec, conversion in parsed_template:
+        result += literal_text.replace('{', '{{').replace('}', '}}')
+        if field_name is None:
+            continue
+
+        field = '{' + field_name
+        if conversion:
+            field += '!' + conversion
+        if format_spec:
+            field += ':' + format_spec
+        field += '}'
+
+        if field_name in styled_fields:
+            field = level_format.opening_str + field + level_format.closing_str
+        result += field
+    return result
+
+
+def _isatty(stream: IO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
@@ -0,0 +1,117 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from .live_region import LiveRegion
+
+
+class RedrawScheduler:
+    """
+    Coalesce redraw requests and render at most *max_fps* frames per second
+    in a background thread. Each `request()` replaces the pending state, so
+    only the latest one is rendered; the intermediate states are skipped.
+
+    *render* is called with the state and should return the lines for the
+    *region*; if *region* is omitted, *render* is expected to do the output
+    by itself. On `stop()` the pending state (if any) is rendered immediately,
+    regardless of the frame rate limit.
+
+    Usage:
+        >>> with RedrawScheduler(lambda jobs: [fmt_job(j) for j in jobs], LiveRegion(sys.stdout), 10) as scheduler:
+        ...     for event in metrics:
+        ...         scheduler.request(snapshot(event))
+    """
+    def __init__(self, render: Callable[[Any], List[str] | None], region: LiveRegion = None, max_fps: float = 20):
+        if max_fps <= 0:
+            raise ValueError(f'Invalid frame rate: {max_fps}')
+        self._render: Callable[[Any], List[str] | None] = render
+        self._region: LiveRegion | None = region
+        self._min_frame_interval: float = 1 / max_fps
+
+        self._cond: threading.Condition = threading.Condition()
+        self._state: Any = None
+        self._pending: bool = False
+        self._stopped: bool = False
+
+        self._requests: int = 0
+        self._frames: int = 0
+        self._errors: int = 0
+        self._frame_time_total: float = 0.0
+        self._frame_time_min: float | None = None
+        self._frame_time_max: float | None = None
+
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='pytermor-redraw', daemon=True)
+        self._thread.start()
+
+    def request(self, state: Any):
+        with self._cond:
+            self._state = state
+            self._pending = True
+            self._requests += 1
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+
+    @property
+    def stats(self) -> Dict[str, int | float | None]:
+        """Snapshot of request and frame counters, frame render times are in seconds."""
+        with self._cond:
+            return {
+                'requests': self._requests,
+                'frames': self._frames,
+                'skipped': self._requests - self._frames - int(self._pending),
+                'errors': self._errors,
+                'frame_time_avg': (self._frame_time_total / self._frames) if self._frames else None,
+                'frame_time_min': self._frame_time_min,
+                'frame_time_max': self._frame_time_max,
+            }
+
+    def _run(self):
+        next_frame_at = 0.0
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                while not self._stopped:
+                    delay = next_frame_at - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if not self._pending:
+                    return
+                state = self._state
+                self._pending = False
+
+            next_frame_at = time.monotonic() + self._min_frame_interval
+            frame_start = time.perf_counter()
+            errors = 0
+            try:
+                lines = self._render(state)
+                if self._region is not None:
+                    self._region.update(lines)
+            except Exception:
+                errors = 1
+            frame_time = time.perf_counter() - frame_start
+
+            with self._cond:
+                self._frames += 1
+                self._errors += errors
+                self._frame_time_total += frame_time
+                self._frame_time_min = min(frame_time, self._frame_time_min or frame_time)
+                self._frame_time_max = max(frame_time, self._frame_time_max or frame_time)
+
+    def __enter__(self) -> RedrawScheduler:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,144 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+from typing import Any, Callable, IO, List, Tuple
+
+from ..fmt import Format
+
+POLICY_BLOCK = 'block'
+POLICY_DROP = 'drop'
+
+_STOP = object()
+
+
+class ThreadedWriter:
+    """
+    Thread-safe buffered output. Producers put records into a bounded queue,
+    while the background thread renders them and writes to the *stream* in
+    batches of up to *batch_size* records.
+
+    Record is a text along with optional `Format`. Text can also be a callable
+    without arguments, which will be invoked in the background thread, so that
+    even string building can be moved out of the producer threads.
+
+    When the queue is full, `write()` either blocks until there is a free
+    space (*POLICY_BLOCK*), or discards the record (*POLICY_DROP*). Queued
+    records are written on interpreter exit; writing after `close()` raises
+    *RuntimeError*.
+
+    A record which fails to render (e.g. its callable raises) is skipped and
+    the rest of the batch is written; if the stream fails, the whole batch is
+    lost. Lost records are counted in ``lost``, and *on_error*, if specified,
+    is called in the background thread with the exception and the list of
+    the lost texts (as they were passed to `write()`).
+
+    Usage:
+        >>> writer = ThreadedWriter(sys.stderr, policy=POLICY_DROP)
+        >>> writer.write('WARN', fmt.yellow)
+        >>> writer.write(lambda: f' queue size is {len(jobs)}\\n')
+    """
+    def __init__(self, stream: IO[str], max_queue: int = 10000, policy: str = POLICY_BLOCK, batch_size: int = 256,
+                 on_error: Callable[[Exception, List[Any]], None] = None):
+        if policy not in (POLICY_BLOCK, POLICY_DROP):
+            raise ValueError(f'Invalid queue policy: {policy!r}')
+
+        self._stream: IO[str] = stream
+        self._batch_size: int = batch_size
+        self._block: bool = (policy == POLICY_BLOCK)
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._on_error: Callable[[Exception, List[Any]], None] | None = on_error
+        self._counter_lock: threading.Lock = threading.Lock()
+        self._close_lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+
+        self.queued: int = 0
+        self.dropped: int = 0
+        self.written: int = 0
+        self.lost: int = 0
+        self.errors: int = 0
+
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='pytermor-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, text: Any | Callable[[], Any], fmt: Format = None):
+        with self._close_lock:  # nothing can be queued after the stop marker
+            if self._closed:
+                raise RuntimeError('Writer is closed')
+            try:
+                self._queue.put((text, fmt), block=self._block)
+            except queue.Full:
+                with self._counter_lock:
+                    self.dropped += 1
+                return
+        with self._counter_lock:
+            self.queued += 1
+
+    def flush(self):
+        """Block until all the records queued so far are written."""
+        self._queue.join()
+
+    def close(self):
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record in batch if record is not _STOP]
+            parts, rendered = self._render(records)
+            if parts:
+                try:
+                    self._stream.write(''.join(parts))
+                    self._stream.flush()
+                    self.written += len(rendered)
+                except Exception as e:
+                    self._fail(e, rendered)
+
+            for _ in batch:
+                self._queue.task_done()
+            if len(records) < len(batch):
+                return
+
+    def _render(self, records: List[Tuple[Any, Format | None]]) -> Tuple[List[str], List[Any]]:
+        """Render *records*, return the parts to write and the texts of the rendered records."""
+        parts: List[str] = []
+        rendered: List[Any] = []
+        for text, fmt in records:
+            try:
+                text_str = str(text() if callable(text) else text)
+            except Exception as e:
+                self._fail(e, [text])
+                continue
+            rendered.append(text)
+            if fmt is None:
+                parts.append(text_str)
+            else:
+                parts += (fmt.opening_str, text_str, fmt.closing_str)
+        return parts, rendered
+
+    def _fail(self, error: Exception, texts: List[Any]):
+        self.errors += 1
+        self.lost += len(texts)
+        if self._on_error:
+            try:
+                self._on_error(error, texts)
+            except Exception:
+                pass
@@ -0,0 +1,116 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import io
+import os
+from typing import BinaryIO, List
+
+from ..fmt import Format
+from ..seq import AbstractSequence
+
+_IOV_MAX_FALLBACK = 1024
+
+
+class VectoredWriter:
+    """
+    Binary output which never concatenates the fragments. Payloads and cached
+    pre-encoded sequences (see `print_bytes()`) are collected as references
+    and then passed to ``os.writev()`` in batches of at most ``IOV_MAX``
+    buffers, either when this amount of buffers is collected, or on `flush()`.
+
+    *stream* is either a file descriptor, or a binary stream. If the stream
+    has no file descriptor (or ``os.writev()`` is not available), the fragments
+    are passed to its ``writelines()`` instead. Payload buffers must not be
+    modified until they are flushed.
+
+    Usage:
+        >>> with VectoredWriter(sys.stdout.buffer) as writer:
+        ...     for level, payload in records:
+        ...         writer.write(payload, level_formats[level])
+        ...         writer.write(b'\\n')
+    """
+    def __init__(self, stream: BinaryIO | int, iov_max: int = None):
+        self._stream: BinaryIO | None = None if isinstance(stream, int) else stream
+        self._fd: int | None = stream if isinstance(stream, int) else _get_fileno(stream)
+        if not hasattr(os, 'writev'):
+            self._fd = None
+        if self._fd is None and self._stream is None:
+            raise ValueError('Vectored output requires os.writev() when stream is a file descriptor')
+
+        self._iov_max: int = iov_max or _get_iov_max()
+        self._buffers: List[bytes] = []
+
+        self.bytes_written: int = 0
+        self.syscall_count: int = 0
+
+    def write(self, data: bytes, fmt: Format = None):
+        buffers = self._buffers
+        if fmt is None:
+            buffers.append(data)
+        else:
+            buffers += (fmt.opening_bytes, data, fmt.closing_bytes)
+        if len(buffers) >= self._iov_max:
+            self.flush()
+
+    def write_seq(self, seq: AbstractSequence):
+        self.write(seq.print_bytes())
+
+    def flush(self):
+        buffers, self._buffers = self._buffers, []
+        if not buffers:
+            return
+        if self._fd is None:
+            self._stream.writelines(buffers)
+            self._stream.flush()
+            self.bytes_written += sum(len(b) for b in buffers)
+            self.syscall_count += 1
+            return
+
+        if self._stream is not None:
+            self._stream.flush()  # keep the order with the data written to the stream directly
+        for start in range(0, len(buffers), self._iov_max):
+            self._writev_all(buffers[start:start + self._iov_max])
+
+    def close(self):
+        self.flush()
+
+    def _writev_all(self, batch: List[bytes]):
+        remaining = sum(len(b) for b in batch)
+        while True:
+            written = os.writev(self._fd, batch)
+            self.syscall_count += 1
+            self.bytes_written += written
+            remaining -= written
+            if remaining <= 0:
+                return
+
+            # partial write: drop complete buffers and cut the first incomplete one
+            idx = 0
+            while written >= len(batch[idx]):
+                written -= len(batch[idx])
+                idx += 1
+            batch = [memoryview(batch[idx])[written:]] + batch[idx + 1:]
+
+    def __enter__(self) -> VectoredWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _get_fileno(stream: BinaryIO) -> int | None:
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _get_iov_max() -> int:
+    try:
+        iov_max = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        return _IOV_MAX_FALLBACK
+    return iov_max if iov_max > 0 else _IOV_MAX_FALLBACK
@@ -4,8 +4,7 @@
 # -----------------------------------------------------------------------------
 from __future__ import annotations
 
-from copy import copy
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Set, Iterator, Sequence
 
 from . import build, sgr, SequenceSGR
 
@@ -15,11 +14,13 @@ class Registry:
         self._code_to_breaker_map: Dict[int|Tuple[int, ...], SequenceSGR] = dict()
         self._complex_code_def: Dict[int|Tuple[int, ...], int] = dict()
         self._complex_code_max_len: int = 0
+        self._breaker_codes: Set[int] = set()
 
     def register_single(self, starter_code: int | Tuple[int, ...], breaker_code: int):
         if starter_code in self._code_to_breaker_map:
             raise RuntimeError(f'Conflict: SGR code {starter_code} already has a registered breaker')
         self._code_to_breaker_map[starter_code] = SequenceSGR(breaker_code)
+        self._breaker_codes.add(breaker_code)
 
     def register_complex(self, starter_codes: Tuple[int, ...], param_len: int, breaker_code: int):
         self.register_single(starter_codes, breaker_code)
@@ -31,23 +32,44 @@ class Registry:
 
     def get_closing_seq(self, opening_seq: SequenceSGR) -> SequenceSGR:
         closing_seq_params: List[int] = []
-        opening_params = copy(opening_seq.params)
-        while len(opening_params):
-            key_params: int|Tuple[int, ...]|None = None
-            for complex_len in range(1, min(len(opening_params), self._complex_code_max_len + 1)):
-                opening_complex_suggestion = tuple(opening_params[:complex_len])
+        for _, breaker_code in self.split_params(opening_seq.params):
+            if breaker_code is not None:
+                closing_seq_params.append(breaker_code)
+        return build(*closing_seq_params)
+
+    def split_params(self, params: Sequence[int]) -> Iterator[Tuple[Tuple[int, ...], int | None]]:
+        """
+        Split SGR params into groups, each of them being a single code or a complex
+        code with its arguments (e.g. ``(38, 5, 208)``), and yield them one by one
+        along with registered breaker code (or *None* if there is no breaker).
+        """
+        idx = 0
+        total_len = len(params)
+        while idx < total_len:
+            key_params: int | Tuple[int, ...] = params[idx]
+            group_len = 1
+            for complex_len in range(1, min(total_len - idx, self._complex_code_max_len + 1)):
+                opening_complex_suggestion = tuple(params[idx:idx + complex_len])
                 if opening_complex_suggestion in self._complex_code_def:
                     key_params = opening_complex_suggestion
-                    complex_total_len = complex_len + self._complex_code_def[opening_complex_suggestion]
-                    opening_params = opening_params[complex_total_len:]
+                    group_len = complex_len + self._complex_code_def[opening_complex_suggestion]
                     break
-            if key_params is None:
-                key_params = opening_params.pop(0)
-            if key_params not in self._code_to_breaker_map:
-                continue
-            closing_seq_params.extend(self._code_to_breaker_map[key_params].params)
 
-        return build(*closing_seq_params)
+            group = tuple(params[idx:idx + group_len])
+            idx += group_len
+            breaker_seq = self._code_to_breaker_map.get(key_params, None)
+            yield group, (breaker_seq.params[0] if breaker_seq else None)
+
+    def is_breaker(self, code: int) -> bool:
+        return code in self._breaker_codes
+
+    def iter_starters(self) -> Iterator[Tuple[int | Tuple[int, ...], int, int]]:
+        """
+        Yield registered starter codes (single ones or tuples for complex codes)
+        along with their breaker codes and amount of complex code arguments.
+        """
+        for starter_code, breaker_seq in self._code_to_breaker_map.items():
+            yield starter_code, breaker_seq.params[0], self._complex_code_def.get(starter_code, 0)
 
 
 sgr_parity_registry = Registry()
@@ -5,21 +5,40 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import List, Any
+from functools import lru_cache
+from typing import Any, List, Tuple
 
 from . import sgr
 
 
 class AbstractSequence(metaclass=ABCMeta):
+    """
+    Sequences are immutable, as their string representations are computed
+    once on the first `print()` (or `print_bytes()`) call and then cached;
+    `params` are therefore exposed as a tuple.
+    """
     def __init__(self, *params: int):
-        self._params: List[int] = [max(0, int(p)) for p in params]
+        self._params: Tuple[int, ...] = tuple([max(0, int(p)) for p in params])
+        self._printed: str | None = None
+        self._printed_bytes: bytes | None = None
 
-    @abstractmethod
     def print(self) -> str:
+        if self._printed is None:
+            self._printed = self._print()
+        return self._printed
+
+    def print_bytes(self) -> bytes:
+        """Same as `print()`, but encoded, for writing directly to binary streams."""
+        if self._printed_bytes is None:
+            self._printed_bytes = self.print().encode('ascii')
+        return self._printed_bytes
+
+    @abstractmethod
+    def _print(self) -> str:
         raise NotImplementedError
 
     @property
-    def params(self) -> List[int]:
+    def params(self) -> Tuple[int, ...]:
         return self._params
 
     def __eq__(self, other: AbstractSequence):
@@ -54,12 +73,32 @@ class SequenceSGR(AbstractSequenceCSI, metaclass=ABCMeta):
     """
     TERMINATOR = 'm'
 
-    def print(self) -> str:
+    @classmethod
+    def parse(cls, s: str) -> SequenceSGR:
+        """
+        Make a sequence from its string representation, e.g. ``'\\x1b[1;38;5;208m'``.
+        Empty params are treated as zeros, same as terminals do. Results are
+        cached, so the same instance of *cls* is returned for repeated strings.
+
+        :raises ValueError: if *s* is not a valid SGR sequence.
+        """
+        if cls is SequenceSGR:
+            return _parse_sgr(s)
+        return _parse_sgr_as(cls, s)
+
+    @classmethod
+    def parse_bytes(cls, b: bytes) -> SequenceSGR:
+        """Same as `parse()`, but for encoded sequences."""
+        if cls is SequenceSGR:
+            return _parse_sgr_bytes(b)
+        return _parse_sgr_as(cls, _decode_sgr(b))
+
+    def _print(self) -> str:
         if len(self._params) == 0:  # noop
             return ''
 
         params = self._params
-        if params == [0]:  # \e[0m <=> \em, saving 1 byte
+        if params == (0,):  # \e[0m <=> \em, saving 1 byte
             params = []
 
         return f'{self.CONTROL_CHARACTER}' \
@@ -90,6 +129,35 @@ class SequenceSGR(AbstractSequenceCSI, metaclass=ABCMeta):
             )
 
 
+class SequenceCSI(AbstractSequenceCSI):
+    """
+    Class representing CSI-type ANSI escape sequence with arbitrary terminator,
+    e.g. cursor movement or erase sequences. Use `SequenceSGR` for the sequences
+    with ``m`` terminator.
+    """
+    def __init__(self, terminator: str, *params: int):
+        super(SequenceCSI, self).__init__(*params)
+        self._terminator: str = terminator
+
+    def _print(self) -> str:
+        return f'{self.CONTROL_CHARACTER}' \
+               f'{self.INTRODUCER}' \
+               f'{self.SEPARATOR.join([str(param) for param in self._params])}' \
+               f'{self._terminator}'
+
+    @property
+    def terminator(self) -> str:
+        return self._terminator
+
+    def __eq__(self, other: SequenceCSI):
+        if type(self) != type(other):
+            return False
+        return self._terminator == other._terminator and self._params == other._params
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{";".join([str(p) for p in self._params])}{self._terminator}]'
+
+
 def build(*args: str | int | SequenceSGR) -> SequenceSGR:
     result: List[int] = []
 
@@ -127,6 +195,58 @@ def build_rgb(r: int, g: int, b: int, bg: bool = False) -> SequenceSGR:
     return SequenceSGR(key_code, sgr.EXTENDED_MODE_RGB, r, g, b)
 
 
+@lru_cache(maxsize=64)
+def build_cursor_up(lines: int = 1) -> SequenceCSI:
+    return SequenceCSI('A', lines)
+
+
+@lru_cache(maxsize=64)
+def build_cursor_down(lines: int = 1) -> SequenceCSI:
+    return SequenceCSI('B', lines)
+
+
+@lru_cache(maxsize=256)
+def build_cursor_column(column: int = 1) -> SequenceCSI:
+    """Move cursor to specified *column* (1-based) of the current line."""
+    return SequenceCSI('G', column)
+
+
+_SGR_PREFIX = AbstractSequenceCSI.CONTROL_CHARACTER + AbstractSequenceCSI.INTRODUCER
+_SGR_PARAMS_CHARS = '0123456789' + AbstractSequenceCSI.SEPARATOR
+
+
+@lru_cache(maxsize=4096)
+def _parse_sgr(s: str) -> SequenceSGR:
+    return SequenceSGR(*_parse_sgr_params(s))
+
+
+@lru_cache(maxsize=256)
+def _parse_sgr_as(cls: type, s: str) -> SequenceSGR:
+    return cls(*_parse_sgr_params(s))
+
+
+def _parse_sgr_params(s: str) -> Tuple[int, ...]:
+    params_str = s[len(_SGR_PREFIX):-len(SequenceSGR.TERMINATOR)]
+    if not s.startswith(_SGR_PREFIX) or not s.endswith(SequenceSGR.TERMINATOR) or \
+            len(s) < len(_SGR_PREFIX) + len(SequenceSGR.TERMINATOR) or params_str.strip(_SGR_PARAMS_CHARS):
+        raise ValueError(f'Invalid SGR sequence: {s!r}')
+    if not params_str:
+        return sgr.RESET,
+    return tuple([int(p) if p else sgr.RESET for p in params_str.split(SequenceSGR.SEPARATOR)])
+
+
+@lru_cache(maxsize=4096)
+def _parse_sgr_bytes(b: bytes) -> SequenceSGR:
+    return _parse_sgr(_decode_sgr(b))
+
+
+def _decode_sgr(b: bytes) -> str:
+    try:
+        return b.decode('ascii')
+    except UnicodeDecodeError:
+        raise ValueError(f'Invalid SGR sequence: {b!r}') from None
+
+
 def _validate_extended_color(value: int):
     if value < 0 or value > 255:
         raise ValueError(f'Invalid color value: {value}; valid values are 0-255 inclusive')
@@ -138,7 +258,7 @@ Special instance in cases where you *have to* select one or
 another SGR, but do not want anything to be actually printed. 
 
 - ``NOOP.print()`` returns empty string.
-- ``NOOP.params()`` returns empty list.
+- ``NOOP.params`` returns empty tuple.
 """
 
 RESET = SequenceSGR(0)  # 0
@@ -218,3 +338,10 @@ BG_HI_WHITE = SequenceSGR(sgr.BG_HI_WHITE)  # 107
 # 58-59: underline color
 # 60-65: ideogram attributes
 # 73-75: superscript and subscript
+
+# cursor control (use build_cursor_*() for movement)
+CURSOR_SAVE = SequenceCSI('s')
+CURSOR_RESTORE = SequenceCSI('u')
+ERASE_LINE = SequenceCSI('K', 2)
+ERASE_LINE_TAIL = SequenceCSI('K')
+ERASE_BELOW = SequenceCSI('J')
@@ -0,0 +1,273 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+from . import sgr
+from .registry import sgr_parity_registry
+from .seq import SequenceSGR
+
+
+class SGRState:
+    """
+    Terminal text attributes which are in effect after some SGR sequences were
+    printed. Attributes (bold, italic, etc.) are stored as bits of one integer,
+    text and background colors -- as two packed integers (default, one of basic
+    colors, 256-color palette index or RGB value), so comparing, hashing and
+    combining the states does not require any list operations.
+
+    States are immutable; `apply()` and `merge()` return new instances. Codes
+    and their breakers are taken from ``sgr_parity_registry``, codes which are
+    not registered there are ignored, as well as extended colors with values
+    out of 0..255 range.
+
+    Usage:
+        >>> state = SGRState().apply(seq.BOLD + seq.RED)
+        >>> state.diff(SGRState().apply(seq.BOLD + seq.BLUE))
+        SequenceSGR[34]
+    """
+    __slots__ = ('_attrs', '_fg', '_bg')
+
+    def __init__(self, attrs: int = 0, fg: int = 0, bg: int = 0):
+        self._attrs: int = attrs
+        self._fg: int = fg
+        self._bg: int = bg
+
+    @classmethod
+    def from_sequence(cls, seq: SequenceSGR) -> SGRState:
+        return cls().apply_params(seq.params)
+
+    @property
+    def attrs(self) -> int:
+        """Bitmask of active attributes, see `attr_bit()`."""
+        return self._attrs
+
+    @property
+    def fg(self) -> int:
+        """Packed text color, 0 for default."""
+        return self._fg
+
+    @property
+    def bg(self) -> int:
+        """Packed background color, 0 for default."""
+        return self._bg
+
+    @property
+    def fg_params(self) -> Tuple[int, ...]:
+        return _color_params(self._fg, _SLOT_FG)
+
+    @property
+    def bg_params(self) -> Tuple[int, ...]:
+        return _color_params(self._bg, _SLOT_BG)
+
+    def has(self, code: int) -> bool:
+        """Check if attribute with specified SGR *code* (e.g. ``sgr.BOLD``) is active."""
+        return bool(self._attrs & attr_bit(code))
+
+    def apply(self, seq: SequenceSGR) -> SGRState:
+        """Get the state after printing *seq* in this state."""
+        return self.apply_params(seq.params)
+
+    def apply_params(self, params: Sequence[int]) -> SGRState:
+        attrs, colors = self._attrs, [self._fg, self._bg]
+        idx, total_len = 0, len(params)
+        while idx < total_len:
+            code = params[idx]
+            idx += 1
+            if code == sgr.RESET:
+                attrs, colors = 0, [0, 0]
+            elif code in _ATTR_BITS:
+                attrs |= _ATTR_BITS[code]
+            elif code in _ATTR_BREAKER_MASKS:
+                attrs &= ~_ATTR_BREAKER_MASKS[code]
+            elif code in _BASIC_COLORS:
+                slot, color = _BASIC_COLORS[code]
+                colors[slot] = color
+            elif code in _COLOR_BREAKERS:
+                colors[_COLOR_BREAKERS[code]] = 0
+            elif code in _EXTENDED_COLORS and idx < total_len:
+                ext_def = _EXTENDED_COLORS[code].get(params[idx])
+                if ext_def is None:
+                    idx += 1
+                    continue
+                slot, kind, args_len = ext_def
+                args = params[idx + 1:idx + 1 + args_len]
+                idx += 1 + args_len
+                if len(args) == args_len and all(arg <= 255 for arg in args):  # out of range colors are ignored
+                    colors[slot] = _pack_color(kind, args)
+
+        if attrs == self._attrs and colors[0] == self._fg and colors[1] == self._bg:
+            return self
+        return SGRState(attrs, *colors)
+
+    def merge(self, other: SGRState) -> SGRState:
+        """
+        Combine the states: attributes of both are active, colors of *other*
+        override the colors of this state, unless they are default.
+        """
+        return SGRState(self._attrs | other._attrs, other._fg or self._fg, other._bg or self._bg)
+
+    def diff(self, other: SGRState) -> SequenceSGR:
+        """
+        Get the shortest sequence which changes this state to *other*. Attributes
+        sharing a breaker with removed ones (e.g. bold and dim) are set again if
+        needed. Switching to the default state results in a reset (``\\e[m``) if
+        that is shorter than the list of breakers.
+        """
+        if self == other:
+            return SequenceSGR()
+        removed = self._attrs & ~other._attrs
+        added = other._attrs & ~self._attrs
+
+        params: List[int] = []
+        if removed:
+            for breaker_code, mask in _ATTR_BREAKER_MASKS.items():
+                if removed & mask:
+                    params.append(breaker_code)
+                    added |= other._attrs & mask
+        params.extend(_attr_params(added))
+        for slot, current, target in ((_SLOT_FG, self._fg, other._fg), (_SLOT_BG, self._bg, other._bg)):
+            if current != target:
+                params.extend(_color_params(target, slot) if target else (_COLOR_BREAKER_CODES[slot],))
+
+        if not other and len(params) > 1:
+            return SequenceSGR(sgr.RESET)
+        return SequenceSGR(*params)
+
+    def to_sequence(self) -> SequenceSGR:
+        """Get the sequence which sets this state starting from the default one."""
+        return _build_sequence(self._attrs, self._fg, self._bg)
+
+    def closing_sequence(self) -> SequenceSGR:
+        """
+        Get the sequence of breakers which switches off everything set by this
+        state. Unlike the result of `diff()` to the default state, it never
+        resets the styles which are set outside of this state.
+        """
+        return _build_closing_sequence(self._attrs, self._fg, self._bg)
+
+    def __bool__(self) -> bool:
+        return bool(self._attrs or self._fg or self._bg)
+
+    def __eq__(self, other: SGRState) -> bool:
+        if not isinstance(other, SGRState):
+            return False
+        return self._attrs == other._attrs and self._fg == other._fg and self._bg == other._bg
+
+    def __hash__(self) -> int:
+        return hash((self._attrs, self._fg, self._bg))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{";".join(str(p) for p in self.to_sequence().params)}]'
+
+
+def attr_bit(code: int) -> int:
+    """Get the bit of `SGRState.attrs` corresponding to attribute *code*, 0 if it's not an attribute."""
+    return _ATTR_BITS.get(code, 0)
+
+
+@lru_cache(maxsize=4096)
+def apply_printed(state: SGRState, printed: str | bytes) -> SGRState:
+    """
+    Get the state after printing SGR sequence *printed* (e.g. ``'\\e[1;31m'``
+    or its bytes) in *state*. Results are cached, so this is the fastest way
+    to track the style through a text, as it contains the same sequences over
+    and over again.
+
+    :raises ValueError: if *printed* is not an SGR sequence
+    """
+    if isinstance(printed, bytes):
+        return state.apply(SequenceSGR.parse_bytes(printed))
+    return state.apply(SequenceSGR.parse(printed))
+
+
+SGR_REGEX = re.compile(r'(\033\[[0-9;]*m)')
+"""
+SGR sequence in a string, for feeding to `apply_printed()`. The whole sequence
+is captured, so ``SGR_REGEX.split()`` keeps the sequences in the result.
+"""
+SGR_BYTES_REGEX = re.compile(rb'(\033\[[0-9;]*m)')
+"""Same as `SGR_REGEX`, but for encoded text."""
+
+
+_SLOT_FG = 0
+_SLOT_BG = 1
+_COLOR_BREAKER_CODES = {_SLOT_FG: sgr.COLOR_OFF, _SLOT_BG: sgr.BG_COLOR_OFF}
+_COLOR_BREAKERS = {code: slot for slot, code in _COLOR_BREAKER_CODES.items()}
+
+_COLOR_BASIC = 1
+_COLOR_256 = 2
+_COLOR_RGB = 3
+_EXTENDED_MODE_KINDS = {sgr.EXTENDED_MODE_256: _COLOR_256, sgr.EXTENDED_MODE_RGB: _COLOR_RGB}
+
+_ATTR_BITS: Dict[int, int] = dict()
+_ATTR_BREAKER_MASKS: Dict[int, int] = dict()
+_BASIC_COLORS: Dict[int, Tuple[int, int]] = dict()
+_EXTENDED_COLORS: Dict[int, Dict[int, Tuple[int, int, int]]] = dict()
+_EXTENDED_CODES: Dict[int, int] = dict()
+
+
+def _build_tables():
+    attr_defs: List[Tuple[int, int]] = []
+    for starter_code, breaker_code, args_len in sgr_parity_registry.iter_starters():
+        slot = _COLOR_BREAKERS.get(breaker_code)
+        if isinstance(starter_code, tuple):
+            if slot is None:
+                raise RuntimeError(f'Complex SGR code {starter_code} is not a color')
+            code, mode = starter_code
+            _EXTENDED_COLORS.setdefault(code, dict())[mode] = (slot, _EXTENDED_MODE_KINDS[mode], args_len)
+            _EXTENDED_CODES[slot] = code
+        elif slot is not None:
+            _BASIC_COLORS[starter_code] = (slot, _pack_color(_COLOR_BASIC, (starter_code,)))
+        else:
+            attr_defs.append((starter_code, breaker_code))
+
+    for bit_idx, (code, breaker_code) in enumerate(sorted(attr_defs)):
+        _ATTR_BITS[code] = 1 << bit_idx
+        _ATTR_BREAKER_MASKS[breaker_code] = _ATTR_BREAKER_MASKS.get(breaker_code, 0) | 1 << bit_idx
+
+
+def _pack_color(kind: int, args: Sequence[int]) -> int:
+    if kind == _COLOR_RGB:
+        r, g, b = args
+        return kind << 24 | r << 16 | g << 8 | b
+    return kind << 24 | args[0]
+
+
+@lru_cache(maxsize=1024)
+def _color_params(color: int, slot: int) -> Tuple[int, ...]:
+    kind, value = color >> 24, color & 0xffffff
+    if kind == _COLOR_BASIC:
+        return value,
+    if kind == _COLOR_256:
+        return _EXTENDED_CODES[slot], sgr.EXTENDED_MODE_256, value
+    if kind == _COLOR_RGB:
+        return _EXTENDED_CODES[slot], sgr.EXTENDED_MODE_RGB, value >> 16, (value >> 8) & 0xff, value & 0xff
+    return ()
+
+
+@lru_cache(maxsize=2048)
+def _attr_params(attrs: int) -> Tuple[int, ...]:
+    return tuple(code for code, bit in _ATTR_BITS.items() if attrs & bit)
+
+
+@lru_cache(maxsize=1024)
+def _build_sequence(attrs: int, fg: int, bg: int) -> SequenceSGR:
+    return SequenceSGR(*_attr_params(attrs), *_color_params(fg, _SLOT_FG), *_color_params(bg, _SLOT_BG))
+
+
+@lru_cache(maxsize=1024)
+def _build_closing_sequence(attrs: int, fg: int, bg: int) -> SequenceSGR:
+    params = [breaker_code for breaker_code, mask in _ATTR_BREAKER_MASKS.items() if attrs & mask]
+    for slot, color in ((_SLOT_FG, fg), (_SLOT_BG, bg)):
+        if color:
+            params.append(_COLOR_BREAKER_CODES[slot])
+    return SequenceSGR(*params)
+
+
+_build_tables()
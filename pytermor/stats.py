@@ -0,0 +1,219 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+"""
+Opt-in instrumentation of the rendering and filtering hot paths.
+
+While disabled (default), the library code is not affected at all. `enable()`
+replaces the instrumented methods at class level with counting wrappers, and
+`disable()` puts the original ones back. Counters are kept per thread without
+any locking and merged by `snapshot()`.
+
+Collected metrics:
+  - ``seq.rendered`` -- sequence `print()` calls, ``seq.rendered_uncached`` -- of
+    them the ones that actually built the string;
+  - ``fmt.calls``, ``fmt.bytes`` -- `Format` wrap calls (``str`` and ``bytes``
+    ones) and UTF-8 bytes emitted, per format opening sequence params;
+  - ``registry.resolutions`` -- closing sequence lookups (`autof()` included);
+  - ``filter.calls``, ``filter.scanned`` -- `StringFilter` applications and
+    characters (bytes for bytes filters) scanned, per filter class;
+  - ``numf.calls`` -- formatter calls, per function and preset;
+  - ``timing`` -- if enabled with *timing*, log2 histograms of call durations of
+    all the above except numf. Keys are upper bounds in nanoseconds.
+
+Usage:
+    >>> from pytermor import stats
+    >>> stats.enable(timing=True)
+    >>> ...
+    >>> metrics.push(stats.snapshot())
+"""
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from . import common
+from .fmt import Format, set_color_mode, get_color_mode
+from .numf import PRESET_SI_METRIC, PRESET_SI_BINARY
+from .registry import Registry
+from .seq import AbstractSequence
+from .strf import StringFilter
+
+_lock: threading.Lock = threading.Lock()
+_local: threading.local = threading.local()
+_thread_counters: List[Dict[Tuple, int]] = []
+_originals: Dict[Tuple[type, str], Callable] = dict()
+_enabled: bool = False
+_timing: bool = False
+
+
+def enable(timing: bool = False):
+    """Start collecting the stats; with *timing* call durations are measured as well."""
+    global _enabled, _timing
+    with _lock:
+        if _enabled:
+            _restore()
+        _instrument(AbstractSequence, 'print', _count_print, timing and 'seq.print')
+        _instrument(Format, '_wrap_colored', _count_wrap, timing and 'fmt.wrap')
+        _instrument(Format, '_wrap_plain', _count_wrap, timing and 'fmt.wrap')
+        _instrument(Format, '_wrap_bytes_colored', _count_wrap_bytes, timing and 'fmt.wrap_bytes')
+        _instrument(Format, '_wrap_bytes_plain', _count_wrap_bytes, timing and 'fmt.wrap_bytes')
+        _instrument(Registry, 'get_closing_seq', _count_resolution, timing and 'registry.get_closing_seq')
+        _instrument(StringFilter, 'apply', _count_filter, timing and 'filter.apply')
+        common.numf_hook = _count_numf
+        _enabled, _timing = True, timing
+    set_color_mode(get_color_mode())  # rebind Format.wrap etc. to the instrumented methods
+
+
+def disable():
+    """Stop collecting the stats and restore the original methods. Counters are kept."""
+    global _enabled, _timing
+    with _lock:
+        _restore()
+        _enabled, _timing = False, False
+    set_color_mode(get_color_mode())
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    with _lock:
+        for counters in _thread_counters:
+            counters.clear()
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Merge the counters of all threads into a dict, e.g.:
+    ``{'seq.rendered': 12, 'fmt.calls': {'1;31': 4}, 'timing': {'fmt.wrap': {1024: 3, 2048: 1}}}``.
+    """
+    with _lock:
+        thread_counters = [counters.copy() for counters in _thread_counters]
+
+    result: Dict[str, Any] = dict()
+    for counters in thread_counters:
+        for (metric, *labels), value in counters.items():
+            if not labels:
+                result[metric] = result.get(metric, 0) + value
+                continue
+            node = result.setdefault(metric, dict())
+            for label in labels[:-1]:
+                node = node.setdefault(label, dict())
+            node[labels[-1]] = node.get(labels[-1], 0) + value
+    return result
+
+
+@contextmanager
+def collecting(timing: bool = False) -> Iterator[None]:
+    """Collect the stats within the context only. Previous state is restored on exit."""
+    was_enabled, was_timing = _enabled, _timing
+    enable(timing)
+    try:
+        yield
+    finally:
+        if was_enabled:
+            enable(was_timing)
+        else:
+            disable()
+
+
+def _counters() -> Dict[Tuple, int]:
+    try:
+        return _local.counters
+    except AttributeError:
+        counters = _local.counters = defaultdict(int)
+        with _lock:
+            _thread_counters.append(counters)
+        return counters
+
+
+def _instrument(cls: type, name: str, make_wrapper: Callable[[Callable], Callable], timing_key: str | bool):
+    original = cls.__dict__[name]
+    _originals[(cls, name)] = original
+    target = _timed(original, timing_key) if timing_key else original
+    setattr(cls, name, wraps(original)(make_wrapper(target)))
+
+
+def _restore():
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+    common.numf_hook = None
+
+
+def _timed(fn: Callable, key: str) -> Callable:
+    def timed(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _counters()[('timing', key, 1 << (perf_counter_ns() - start).bit_length())] += 1
+    return timed
+
+
+def _count_print(original: Callable) -> Callable:
+    def print_(self: AbstractSequence) -> str:
+        counters = _counters()
+        counters[('seq.rendered',)] += 1
+        if self._printed is None:
+            counters[('seq.rendered_uncached',)] += 1
+        return original(self)
+    return print_
+
+
+def _count_wrap(original: Callable) -> Callable:
+    def wrap(self: Format, text: Any = None) -> str:
+        result = original(self, text)
+        label = ';'.join(str(p) for p in self._opening_seq.params)
+        counters = _counters()
+        counters[('fmt.calls', label)] += 1
+        counters[('fmt.bytes', label)] += len(result.encode('utf-8', 'surrogatepass'))
+        return result
+    return wrap
+
+
+def _count_wrap_bytes(original: Callable) -> Callable:
+    def wrap_bytes(self: Format, data: bytes) -> bytes:
+        result = original(self, data)
+        label = ';'.join(str(p) for p in self._opening_seq.params)
+        counters = _counters()
+        counters[('fmt.calls', label)] += 1
+        counters[('fmt.bytes', label)] += len(result)
+        return result
+    return wrap_bytes
+
+
+def _count_resolution(original: Callable) -> Callable:
+    def get_closing_seq(self: Registry, *args, **kwargs):
+        _counters()[('registry.resolutions',)] += 1
+        return original(self, *args, **kwargs)
+    return get_closing_seq
+
+
+def _count_filter(original: Callable) -> Callable:
+    def apply(self: StringFilter, s):
+        label = type(self).__name__
+        counters = _counters()
+        counters[('filter.calls', label)] += 1
+        counters[('filter.scanned', label)] += len(s)
+        return original(self, s)
+    return apply
+
+
+_PRESET_LABELS: Dict[int, str] = {
+    id(PRESET_SI_METRIC): 'PRESET_SI_METRIC',
+    id(PRESET_SI_BINARY): 'PRESET_SI_BINARY',
+}
+
+
+def _count_numf(func_name: str, preset: Any):
+    if not isinstance(preset, str):
+        preset = _PRESET_LABELS.get(id(preset), 'custom')
+    _counters()[('numf.calls', func_name, preset)] += 1
@@ -3,7 +3,12 @@
 # (C) 2022 A. Shavykin <0.delameter@gmail.com>
 # -----------------------------------------------------------------------------
 from .string_filter import *
+from .styled_text import *
 from .fmtd import *
+from .table import *
+from .markup import *
+from .anchoring import *
+from .search import *
 
 __all__ = [
     'apply_filters',
@@ -12,7 +17,25 @@ __all__ = [
     'ReplaceSGR',
     'ReplaceNonAsciiBytes',
 
+    'StyledText',
+
     'ljust_fmtd',
     'rjust_fmtd',
     'center_fmtd',
+    'truncate_fmtd',
+    'slice_fmtd',
+    'wrap_fmtd',
+
+    'TableColumn',
+    'TableRenderer',
+
+    'MarkupTemplate',
+    'compile_markup',
+    'render_markup',
+
+    'anchor_lines',
+    'unanchor_lines',
+
+    'SearchableText',
+    'highlight_fmtd',
 ]
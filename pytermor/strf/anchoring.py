@@ -0,0 +1,114 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Match, Tuple
+
+from ..state import SGR_REGEX, SGRState, apply_printed
+
+
+def anchor_lines(lines: Iterable[str], state: SGRState = None) -> Iterator[str]:
+    """
+    Make each of the *lines* self-contained: prepend the style which is in
+    effect at its start (i.e. opened in the previous lines) and close the
+    style which is left open at its end. The result can be split into lines,
+    which are filtered, sorted or processed in parallel independently, and
+    still render the same as the original.
+
+    *lines* should keep their line breaks, e.g. as read from a file or split
+    with ``str.splitlines(keepends=True)``; the breaks are left outside of
+    the styles. Style is tracked with `SGRState`, so SGR codes unknown to
+    ``sgr_parity_registry`` are kept as is, but not carried to other lines.
+    If *lines* are taken from the middle of a text, pass the style in effect
+    at the start of the first one as *state*.
+
+    Usage:
+        >>> ''.join(anchor_lines(['\\x1b[31mred\\n', 'still red\\x1b[39m\\n']))
+        '\\x1b[31mred\\x1b[39m\\n\\x1b[31mstill red\\x1b[39m\\n'
+    """
+    empty_state = SGRState()
+    if state is None:
+        state = empty_state
+    for line in lines:
+        content, line_break = _split_line_break(line)
+        opening_str = state.to_sequence().print()
+        for match in _iter_sgr(content):
+            state = apply_printed(state, match.group(0))
+        yield opening_str + content + state.diff(empty_state).print() + line_break
+
+
+def unanchor_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Inverse of `anchor_lines()`: replace SGR sequences at the ends and starts
+    of adjacent lines with the minimal transition between the styles, placed
+    right after the line break, so that the style is carried across the
+    lines instead of being closed and reopened. Text renders the same, but
+    line breaks themselves can now be inside of a style. Style left open at
+    the end of the last line is closed as it was in the original. SGR codes
+    unknown to ``sgr_parity_registry`` are dropped from the line boundaries.
+    """
+    logical_state = emitted_state = SGRState()
+    iterator = iter(lines)
+    line = next(iterator, None)
+    while line is not None:
+        next_line = next(iterator, None)
+        content, line_break = _split_line_break(line)
+        matches = list(_iter_sgr(content))
+        body_start, body_end = _find_body(content, matches)
+        parts: List[str] = []
+
+        if body_start == body_end:  # nothing to render, transition is postponed
+            for match in matches:
+                logical_state = apply_printed(logical_state, match.group(0))
+        else:
+            leading = [m for m in matches if m.end() <= body_start]
+            body = [m for m in matches if m.end() > body_start and m.start() < body_end]
+            trailing = matches[len(leading) + len(body):]
+
+            for match in leading:
+                logical_state = apply_printed(logical_state, match.group(0))
+            parts += emitted_state.diff(logical_state).print(), content[body_start:body_end]
+            for match in body:
+                logical_state = apply_printed(logical_state, match.group(0))
+            emitted_state = logical_state
+            for match in trailing:
+                logical_state = apply_printed(logical_state, match.group(0))
+
+        if next_line is None or not line_break:
+            parts.append(emitted_state.diff(logical_state).print())
+            emitted_state = logical_state
+        parts.append(line_break)
+        yield ''.join(parts)
+        line = next_line
+
+
+def _split_line_break(line: str) -> Tuple[str, str]:
+    if line.endswith('\r\n'):
+        return line[:-2], '\r\n'
+    if line.endswith('\n'):
+        return line[:-1], '\n'
+    return line, ''
+
+
+def _iter_sgr(content: str) -> Iterator[Match]:
+    if '\033' not in content:
+        return iter(())
+    return SGR_REGEX.finditer(content)
+
+
+def _find_body(content: str, matches: List[Match]) -> Tuple[int, int]:
+    """Find the part of *content* between leading and trailing runs of SGR sequences."""
+    body_start = 0
+    for match in matches:
+        if match.start() != body_start:
+            break
+        body_start = match.end()
+
+    body_end = len(content)
+    for match in reversed(matches):
+        if match.end() != body_end or match.start() < body_start:
+            break
+        body_end = match.start()
+    return body_start, body_end
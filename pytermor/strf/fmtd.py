@@ -2,42 +2,302 @@
 # pytermor [ANSI formatted terminal output toolset]
 # (C) 2022 A. Shavykin <0.delameter@gmail.com>
 # -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import re
+from typing import List, Match, Iterator
+
 from . import ReplaceSGR
+from .styled_text import StyledText
+from ..state import SGR_REGEX, SGRState, apply_printed
 
 
-def ljust_fmtd(s: str, width: int, fillchar: str = ' ') -> str:
+def ljust_fmtd(s: str | StyledText, width: int, fillchar: str = ' ') -> str | StyledText:
     """
     SGR-formatting-aware implementation of str.ljust().
 
     Return a left-justified string of length width. Padding is done
     using the specified fill character (default is a space).
+    `StyledText` is padded without rendering and returned as `StyledText`.
     """
+    if isinstance(s, StyledText):
+        return s + fillchar * max(0, width - len(s))
     sanitized = ReplaceSGR().apply(s)
     return s + fillchar * max(0, width - len(sanitized))
 
 
-def rjust_fmtd(s: str, width: int, fillchar: str = ' ') -> str:
+def rjust_fmtd(s: str | StyledText, width: int, fillchar: str = ' ') -> str | StyledText:
     """
     SGR-formatting-aware implementation of str.rjust().
 
     Return a right-justified string of length width. Padding is done
     using the specified fill character (default is a space).
+    `StyledText` is padded without rendering and returned as `StyledText`.
     """
+    if isinstance(s, StyledText):
+        return fillchar * max(0, width - len(s)) + s
     sanitized = ReplaceSGR().apply(s)
     return fillchar * max(0, width - len(sanitized)) + s
 
 
-def center_fmtd(s: str, width: int, fillchar: str = ' ') -> str:
+def center_fmtd(s: str | StyledText, width: int, fillchar: str = ' ') -> str | StyledText:
     """
     SGR-formatting-aware implementation of str.center().
 
     Return a centered string of length width. Padding is done using the
     specified fill character (default is a space).
+    `StyledText` is padded without rendering and returned as `StyledText`.
     """
-    sanitized = ReplaceSGR().apply(s)
-    fill_len = max(0, width - len(sanitized))
+    if isinstance(s, StyledText):
+        fill_len = max(0, width - len(s))
+    else:
+        fill_len = max(0, width - len(ReplaceSGR().apply(s)))
     if fill_len == 0:
         return s
     right_fill_len = fill_len // 2
     left_fill_len = fill_len - right_fill_len
     return (fillchar * left_fill_len) + s + (fillchar * right_fill_len)
+
+
+def truncate_fmtd(s: str | StyledText, width: int, ellipsis: str = '') -> str | StyledText:
+    """
+    SGR-formatting-aware string truncation.
+
+    Return a string which is at most *width* characters long (SGR sequences
+    are not counted). If the string doesn't fit, it is cut, *ellipsis* is
+    appended and all the formats active at the cut point are closed. The
+    string is scanned only until the limit is reached. `StyledText` is cut
+    without rendering and returned as `StyledText`.
+    """
+    if width < 0:
+        raise ValueError(f'Invalid width: {width}')
+    ellipsis = ellipsis[:width]
+    cut_width = width - len(ellipsis)
+    if isinstance(s, StyledText):
+        if len(s) <= width:
+            return s
+        if cut_width == 0:
+            return StyledText(ellipsis)
+        return s[:cut_width] + StyledText(ellipsis, s.format_at(cut_width - 1))
+
+    tracker = _SGRTracker()
+    raw_pos = visible_len = 0
+    cut_pos = None
+    closing_str = ''
+    while True:
+        scan_limit = raw_pos + width + 1 - visible_len
+        match = _find_sgr(s, raw_pos, scan_limit)
+        text_len = (match.start() if match else min(len(s), scan_limit)) - raw_pos
+
+        if cut_pos is None and visible_len + text_len >= cut_width:
+            cut_pos = raw_pos + cut_width - visible_len
+            closing_str = tracker.closing_str
+        visible_len += text_len
+        if visible_len > width:
+            return s[:cut_pos] + ellipsis + closing_str
+        if not match:
+            return s
+
+        if cut_pos is None:
+            tracker.feed(match.group(0))
+        raw_pos = match.end()
+
+
+def slice_fmtd(s: str | StyledText, start: int = None, stop: int = None) -> str | StyledText:
+    """
+    SGR-formatting-aware implementation of string slicing, i.e. ``s[start:stop]``.
+
+    Indices are counted in visible characters. The result begins with the
+    formats active at *start* being reopened and ends with the ones active
+    at *stop* being closed. Negative indices require the whole string to be
+    scanned, non-negative ones -- only up to *stop*. `StyledText` is sliced
+    without rendering and returned as `StyledText`.
+    """
+    if isinstance(s, StyledText):
+        return s[start:stop]
+    if (start or 0) < 0 or (stop or 0) < 0:
+        start, stop, _ = slice(start, stop).indices(len(ReplaceSGR().apply(s)))
+    start = start or 0
+    if stop is not None and stop <= start:
+        return ''
+
+    tracker = _SGRTracker()
+    raw_pos = visible_len = 0
+    start_pos = None
+    opening_str = ''
+    while True:
+        scan_limit = len(s) if stop is None else raw_pos + stop - visible_len
+        match = _find_sgr(s, raw_pos, scan_limit)
+        text_len = (match.start() if match else min(len(s), scan_limit)) - raw_pos
+
+        if start_pos is None and visible_len + text_len > start:
+            start_pos = raw_pos + start - visible_len
+            opening_str = tracker.opening_str
+        visible_len += text_len
+        if not match:
+            if start_pos is None:
+                return ''
+            return opening_str + s[start_pos:raw_pos + text_len] + tracker.closing_str
+
+        tracker.feed(match.group(0))
+        raw_pos = match.end()
+
+
+def wrap_fmtd(s: str | StyledText, width: int) -> Iterator[str]:
+    """
+    SGR-formatting-aware text wrapping.
+
+    Split the string into lines which are at most *width* characters long (SGR
+    sequences are not counted), breaking them at whitespace or inside the words
+    which are longer than *width*. Formats active at the end of each line are
+    closed and then reopened at the beginning of the next one. Newline characters
+    are kept as line breaks.
+
+    Lines are yielded as soon as they are complete, so long texts can be
+    processed incrementally. `StyledText` is rendered first.
+    """
+    if width < 1:
+        raise ValueError(f'Invalid width: {width}')
+    if isinstance(s, StyledText):
+        s = s.render()
+
+    tracker = _SGRTracker()
+    line: List[str] = []
+    line_len = 0
+    word: List[str | Match] = []
+    word_len = 0
+    space = ''
+    paragraph_start = True
+
+    def break_line() -> str:
+        nonlocal line, line_len, paragraph_start
+        result = ''.join(line)
+        line = []
+        line_len = 0
+        paragraph_start = False
+        if tracker:
+            result += tracker.closing_str
+            line.append(tracker.opening_str)
+        return result
+
+    def append_word():
+        nonlocal word, word_len, line_len
+        for piece in word:
+            if isinstance(piece, str):
+                line.append(piece)
+            else:
+                line.append(piece.group())
+                tracker.feed(piece.group(_WRAP_TOKEN_SGR))
+        line_len += word_len
+        word = []
+        word_len = 0
+
+    def place_word() -> List[str]:
+        nonlocal word, word_len, line_len
+        gap = len(space) if line_len or paragraph_start else 0
+        if line_len + gap + word_len <= width:
+            if gap:
+                line.append(space)
+                line_len += gap
+            append_word()
+            return []
+
+        broken_lines = []
+        if word_len <= width:
+            if line_len:
+                broken_lines.append(break_line())
+            append_word()
+            return broken_lines
+        if line_len + gap < width:
+            if gap:
+                line.append(space)
+                line_len += gap
+        elif line_len:
+            broken_lines.append(break_line())
+        for piece in word:
+            if not isinstance(piece, str):
+                line.append(piece.group())
+                tracker.feed(piece.group(_WRAP_TOKEN_SGR))
+                continue
+            while piece:
+                if line_len == width:
+                    broken_lines.append(break_line())
+                chunk = piece[:width - line_len]
+                line.append(chunk)
+                line_len += len(chunk)
+                piece = piece[len(chunk):]
+        word = []
+        word_len = 0
+        return broken_lines
+
+    for match in _WRAP_TOKEN_REGEX.finditer(s):
+        token_type = match.lastindex
+        if token_type == _WRAP_TOKEN_TEXT:
+            piece = match.group()
+            word.append(piece)
+            word_len += len(piece)
+            continue
+        if token_type == _WRAP_TOKEN_SGR:
+            word.append(match)
+            continue
+
+        if word_len:
+            yield from place_word()
+            space = ''
+        elif word:
+            append_word()
+
+        if token_type == _WRAP_TOKEN_NEWLINE:
+            yield break_line()
+            space = ''
+            paragraph_start = True
+        else:
+            space += match.group()
+
+    if word_len:
+        yield from place_word()
+    elif word:
+        append_word()
+    if line_len:
+        yield break_line()
+
+
+_WRAP_TOKEN_SGR, _WRAP_TOKEN_SGR_PARAMS, _WRAP_TOKEN_NEWLINE, _WRAP_TOKEN_SPACE, _WRAP_TOKEN_TEXT = range(1, 6)
+_WRAP_TOKEN_REGEX = re.compile(r'(\033\[([0-9;]*)m)|(\n)|([^\S\n]+)|([^\s\033]+|\033)')
+
+
+def _find_sgr(s: str, pos: int, endpos: int) -> Match | None:
+    """Find first SGR sequence starting in [pos, endpos) range of string *s*."""
+    while True:
+        esc_pos = s.find('\033', pos, endpos)
+        if esc_pos == -1:
+            return None
+        match = SGR_REGEX.match(s, esc_pos)
+        if match:
+            return match
+        pos = esc_pos + 1
+
+
+class _SGRTracker:
+    """
+    Keeps track of the style which is in effect at current position of the
+    string being scanned, see `SGRState`.
+    """
+    __slots__ = ('_state',)
+
+    def __init__(self):
+        self._state: SGRState = SGRState()
+
+    def feed(self, seq_str: str):
+        self._state = apply_printed(self._state, seq_str)
+
+    def __bool__(self) -> bool:
+        return bool(self._state)
+
+    @property
+    def opening_str(self) -> str:
+        return self._state.to_sequence().print()
+
+    @property
+    def closing_str(self) -> str:
+        return self._state.closing_sequence().print()
@@ -0,0 +1,116 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, List
+
+from ..fmt import get_color_mode
+from ..registry import sgr_parity_registry
+from ..seq import SequenceSGR, build
+
+
+class MarkupTemplate:
+    """
+    Template with markup tags compiled into SGR sequences. Opening tag contains
+    one or more space-separated keys accepted by `build()` (e.g. ``[bold red]``),
+    closing tag ``[/]`` closes the innermost open one. Closing sequences are
+    taken from ``sgr_parity_registry``; if they break any of the outer formats
+    (e.g. ``[red]outer [blue]inner[/] outer[/]``), these formats are reopened
+    right after. Use ``[[`` for literal ``[``. Brackets inside ``str.format``
+    replacement fields (e.g. ``{0[1]}`` or ``{d[red]}``) are not parsed as tags.
+
+    The result is a ``str.format`` string with sequences already inlined, so
+    rendering is a single `str.format()` call. When colors are disabled (see
+    `set_color_mode()`), the template without any sequences is used instead.
+    """
+    def __init__(self, template: str):
+        self._template: str = template
+        self._colored: str = ''
+        self._plain: str = ''
+        self._compile(template)
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        if get_color_mode():
+            return self._colored.format(*args, **kwargs)
+        return self._plain.format(*args, **kwargs)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str:
+        return self.render(*args, **kwargs)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{self._template!r}]'
+
+    def _compile(self, template: str):
+        colored_parts: List[str] = []
+        plain_parts: List[str] = []
+        stack: List[SequenceSGR] = []
+        pos = 0
+
+        for match in _TAG_REGEX.finditer(template):
+            colored_parts.append(template[pos:match.start()])
+            plain_parts.append(template[pos:match.start()])
+            pos = match.end()
+
+            field, tag = match.groups()
+            if field is not None:  # str.format replacement field or escaped brace, kept as is
+                colored_parts.append(field)
+                plain_parts.append(field)
+            elif tag is None:
+                colored_parts.append('[')
+                plain_parts.append('[')
+            elif tag == '/':
+                if not stack:
+                    raise ValueError(f'Unexpected closing tag at position {match.start()}: {template!r}')
+                colored_parts.append(self._close(stack))
+            else:
+                opening_seq = build(*tag.split())
+                stack.append(opening_seq)
+                colored_parts.append(opening_seq.print())
+
+        colored_parts.append(template[pos:])
+        plain_parts.append(template[pos:])
+        while stack:
+            colored_parts.append(self._close(stack))
+
+        self._colored = ''.join(colored_parts)
+        self._plain = ''.join(plain_parts)
+
+    # noinspection PyMethodMayBeStatic
+    def _close(self, stack: List[SequenceSGR]) -> str:
+        closing_seq = sgr_parity_registry.get_closing_seq(stack.pop())
+        broken_codes = set(closing_seq.params)
+
+        reopening_params = []
+        for outer_seq in stack:
+            for group, breaker_code in sgr_parity_registry.split_params(outer_seq.params):
+                if breaker_code in broken_codes:
+                    reopening_params.extend(group)
+        return closing_seq.print() + SequenceSGR(*reopening_params).print()
+
+
+_TAG_REGEX = re.compile(r'(\{\{|\}\}|\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})|'
+                        r'\[(?:\[|(/|[A-Za-z0-9_]+(?: [A-Za-z0-9_]+)*)\])')
+
+
+@lru_cache(maxsize=512)
+def compile_markup(template: str) -> MarkupTemplate:
+    """Compile *template* into `MarkupTemplate`, the results are cached."""
+    return MarkupTemplate(template)
+
+
+def render_markup(template: str, *args: Any, **kwargs: Any) -> str:
+    """
+    Render markup *template* with specified ``str.format`` arguments.
+
+    Usage:
+        >>> render_markup('[bold red]{name}[/] is [green]{state}[/]', name='db01', state='up')
+    """
+    return compile_markup(template).render(*args, **kwargs)
@@ -0,0 +1,157 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain
+from typing import Iterator, List, Match, Pattern, Tuple
+
+from ..fmt import Format, get_color_mode
+from ..state import SGR_REGEX, SGRState, apply_printed
+
+
+class SearchableText:
+    """
+    Text with SGR sequences prepared for searching by its visible content:
+    substrings and patterns are found even if they are interrupted by
+    sequences (e.g. a word with differently styled letters), and reported as
+    spans of the original string.
+
+    Sequences are stripped in one pass, which also records a compact offset
+    map -- offsets of each run of visible characters between the sequences
+    in the plain and in the original text -- so mapping a match back is a
+    bisection over the runs. Styles of the runs are computed only when
+    needed, i.e. by `state_at()` and `highlight()`, by replaying the sequences
+    up to the requested run; the results are kept for the subsequent calls.
+
+    Usage:
+        >>> text = SearchableText('\\x1b[31mer\\x1b[1mror\\x1b[m: disk full')
+        >>> text.find('error')
+        (5, 14)
+        >>> text.highlight('disk', Format(seq.INVERSED, seq.INVERSED_OFF))
+        '\\x1b[31mer\\x1b[1mror\\x1b[m: \\x1b[7mdisk\\x1b[27m full'
+    """
+    def __init__(self, raw: str):
+        self._raw: str = raw
+        parts = SGR_REGEX.split(raw)  # runs of visible characters alternating with sequences
+        self._plain: str = ''.join(parts[::2])
+        self._plain_offsets: array = array('Q', accumulate(chain((0,), map(len, parts[:-1:2]))))
+        self._raw_offsets: array = array('Q', accumulate(chain((0,), map(len, parts[:-1]))))[::2]
+        self._sequences: List[str] = parts[1::2]
+        self._states: List[SGRState] = [SGRState()]
+
+    @property
+    def raw(self) -> str:
+        return self._raw
+
+    @property
+    def plain(self) -> str:
+        """Visible content, i.e. the text with SGR sequences removed."""
+        return self._plain
+
+    def to_raw(self, plain_pos: int) -> int:
+        """Get the offset of the visible character at *plain_pos* in the original text."""
+        if plain_pos >= len(self._plain):
+            return len(self._raw)
+        run_idx = bisect_right(self._plain_offsets, plain_pos) - 1
+        return self._raw_offsets[run_idx] + plain_pos - self._plain_offsets[run_idx]
+
+    def to_raw_span(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Map [*start*, *end*) span of visible content to the original text. The
+        result begins with the first visible character and ends right after
+        the last one, i.e. doesn't include the sequences around the span.
+        """
+        raw_start = self.to_raw(start)
+        if end <= start:
+            return raw_start, raw_start
+        return raw_start, self.to_raw(end - 1) + 1
+
+    def state_at(self, plain_pos: int) -> SGRState:
+        """Get the style in effect for the visible character at *plain_pos*."""
+        if plain_pos >= len(self._plain):
+            return self._get_state(len(self._sequences))
+        return self._get_state(bisect_right(self._plain_offsets, plain_pos) - 1)
+
+    def find(self, sub: str, start: int = 0, end: int = None) -> Tuple[int, int] | None:
+        """
+        SGR-formatting-aware implementation of str.find(). *start* and *end*
+        are offsets in visible content; result is a span in the original text
+        or *None* if *sub* is not found.
+        """
+        plain_start = self._plain.find(sub, start, len(self._plain) if end is None else end)
+        if plain_start < 0:
+            return None
+        return self.to_raw_span(plain_start, plain_start + len(sub))
+
+    def finditer(self, pattern: str | Pattern, flags: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Find all matches of regular expression *pattern* in visible content,
+        yield their spans in the original text.
+        """
+        for match in self._finditer_plain(pattern, flags):
+            yield self.to_raw_span(*match.span())
+
+    def highlight(self, pattern: str | Pattern, fmt: Format, flags: int = 0) -> str:
+        """
+        Get the original text with all matches of *pattern* formatted with *fmt*
+        on top of the style in effect at the start of each match. Sequences
+        inside the matches are dropped; the style which the original text has
+        right after a match is restored with the minimal sequence, so the rest
+        of the text renders the same. If SGR output is disabled (see
+        `set_color_mode()`), the original text is returned as is.
+
+        Matches are located in O(matches * log runs), but the styles in effect
+        at them require replaying all the sequences before the last match (in
+        O(runs) on the first call only, see `SearchableText`).
+        """
+        if not get_color_mode():
+            return self._raw
+        fmt_state = SGRState.from_sequence(fmt.opening_seq)
+        parts: List[str] = []
+        raw_pos = 0
+        for match in self._finditer_plain(pattern, flags):
+            start, end = match.span()
+            if start == end:
+                continue
+            raw_start, raw_end = self.to_raw_span(start, end)
+            state = self.state_at(start)
+            match_state = state.merge(fmt_state)
+            parts += (self._raw[raw_pos:raw_start], state.diff(match_state).print(), self._plain[start:end],
+                      match_state.diff(self.state_at(end - 1)).print())
+            raw_pos = raw_end
+        parts.append(self._raw[raw_pos:])
+        return ''.join(parts)
+
+    def __len__(self) -> int:
+        return len(self._plain)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{self._plain!r}]'
+
+    def _get_state(self, run_idx: int) -> SGRState:
+        """Get the style in effect at the start of run *run_idx*, replaying the sequences before it if needed."""
+        states = self._states
+        if run_idx >= len(states):
+            state = states[-1]
+            for seq_str in self._sequences[len(states) - 1:run_idx]:
+                state = apply_printed(state, seq_str)
+                states.append(state)
+        return states[run_idx]
+
+    def _finditer_plain(self, pattern: str | Pattern, flags: int) -> Iterator[Match]:
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, flags)
+        return pattern.finditer(self._plain)
+
+
+def highlight_fmtd(s: str, pattern: str | Pattern, fmt: Format, flags: int = 0) -> str:
+    """
+    SGR-formatting-aware highlighting of all matches of regular expression
+    *pattern* in *s* with *fmt*, see `SearchableText.highlight()`.
+    """
+    return SearchableText(s).highlight(pattern, fmt, flags)
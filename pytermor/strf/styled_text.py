@@ -0,0 +1,271 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import chain
+from typing import IO, Iterable, Iterator, List, Tuple
+
+from .. import sgr
+from ..fmt import Format, get_color_mode
+from ..registry import sgr_parity_registry
+from ..seq import SequenceSGR
+from ..state import SGRState
+
+
+class StyledText:
+    """
+    Immutable text consisting of spans, each of them being a plain text (without
+    any escape sequences) with optional `Format`. Spans are kept in a balanced
+    tree, so concatenation and slicing are O(log n), while the visible length is
+    stored in the tree nodes and is available in O(1).
+
+    Nothing is rendered until `render()`, `render_bytes()` or `write()` call.
+    Adjacent spans with the same format are merged, and only the difference
+    between the formats of neighbour spans is emitted, e.g. switching from bold
+    red to bold blue results in a single ``\\e[34m``. Formats are closed with
+    the breaker codes from ``sgr_parity_registry``.
+
+    To assemble a text of many parts use `join()`, which builds the tree in
+    linear time, rather than repeated concatenation.
+
+    Usage:
+        >>> report = StyledText('Status: ') + StyledText('OK', fmt.green)
+        >>> ljust_fmtd(report, 20).render()
+        >>> StyledText(', ').join(StyledText(name, fmt.bold) for name in names)
+    """
+    def __init__(self, text: str = '', fmt: Format = None):
+        self._root: _Node | None = _Leaf(text, fmt) if text else None
+
+    @classmethod
+    def _from_root(cls, root: _Node | None) -> StyledText:
+        result = cls.__new__(cls)
+        result._root = root
+        return result
+
+    @property
+    def plain(self) -> str:
+        """Text without formatting."""
+        return ''.join(leaf.text for leaf in self._leaves())
+
+    def join(self, parts: Iterable[StyledText | str]) -> StyledText:
+        """Concatenate *parts* with this text as a separator, same as ``str.join()``."""
+        nodes: List[_Node] = []
+        for idx, part in enumerate(parts):
+            if idx and self._root:
+                nodes.append(self._root)
+            if isinstance(part, str):
+                part = StyledText(part)
+            if part._root:
+                nodes.append(part._root)
+        while len(nodes) > 1:
+            nodes = [_concat(*nodes[idx:idx + 2]) for idx in range(0, len(nodes), 2)]
+        return self._from_root(nodes[0] if nodes else None)
+
+    def spans(self) -> Iterator[Tuple[str, Format | None]]:
+        for leaf in self._leaves():
+            yield leaf.text, leaf.fmt
+
+    def render(self) -> str:
+        return ''.join(self._render_parts())
+
+    def render_bytes(self, encoding: str = 'utf-8') -> bytes:
+        return self.render().encode(encoding)
+
+    def write(self, stream: IO[str]):
+        """Render directly into the *stream*, without building the whole string."""
+        stream.writelines(self._render_parts())
+
+    def __len__(self) -> int:
+        return self._root.length if self._root else 0
+
+    def __bool__(self) -> bool:
+        return self._root is not None
+
+    def __add__(self, other: StyledText | str) -> StyledText:
+        if isinstance(other, str):
+            other = StyledText(other)
+        elif not isinstance(other, StyledText):
+            return NotImplemented
+        return self._from_root(_concat(self._root, other._root))
+
+    def __radd__(self, other: str) -> StyledText:
+        if not isinstance(other, str):
+            return NotImplemented
+        return StyledText(other) + self
+
+    def __getitem__(self, key: int | slice) -> StyledText | str:
+        if isinstance(key, int):
+            leaf, offset = self._find_leaf(key)
+            return leaf.text[offset]
+
+        start, stop, step = key.indices(len(self))
+        if step != 1:
+            raise ValueError('StyledText slicing with step is not supported')
+        if stop <= start:
+            return StyledText()
+        return self._from_root(_tail(_head(self._root, stop), start))
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def format_at(self, idx: int) -> Format | None:
+        """Get format of the character at *idx* position."""
+        return self._find_leaf(idx)[0].fmt
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}[{len(self)}]'
+
+    def _find_leaf(self, idx: int) -> Tuple[_Leaf, int]:
+        """Get leaf containing the character at *idx* position and offset of the character in it."""
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('StyledText index out of range')
+        node = self._root
+        while isinstance(node, _Concat):
+            if idx < node.left.length:
+                node = node.left
+            else:
+                idx -= node.left.length
+                node = node.right
+        return node, idx
+
+    def _leaves(self) -> Iterator[_Leaf]:
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _Concat):
+                stack += (node.right, node.left)
+            else:
+                yield node
+
+    def _render_parts(self) -> Iterator[str]:
+        if not get_color_mode():
+            yield from (leaf.text for leaf in self._leaves())
+            return
+
+        prev_params: Tuple[int, ...] = ()
+        for leaf in self._leaves():
+            if leaf.params != prev_params:
+                yield _transition(prev_params, leaf.params)
+                prev_params = leaf.params
+            yield leaf.text
+        if prev_params:
+            yield _transition(prev_params, ())
+
+
+class _Node:
+    __slots__ = ()
+    length: int
+    height: int
+
+
+class _Leaf(_Node):
+    __slots__ = ('text', 'fmt', 'params', 'length')
+    height = 0
+
+    def __init__(self, text: str, fmt: Format | None):
+        self.text: str = text
+        self.fmt: Format | None = fmt
+        self.params: Tuple[int, ...] = tuple(fmt.opening_seq.params) if fmt else ()
+        self.length: int = len(text)
+
+
+class _Concat(_Node):
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left: _Node, right: _Node):
+        self.left: _Node = left
+        self.right: _Node = right
+        self.length: int = left.length + right.length
+        self.height: int = (left.height if left.height > right.height else right.height) + 1
+
+
+_MAX_MERGED_LEAF_LEN = 256
+
+
+def _concat(a: _Node | None, b: _Node = None) -> _Node | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if isinstance(a, _Leaf) and isinstance(b, _Leaf) and a.params == b.params and \
+            a.length + b.length <= _MAX_MERGED_LEAF_LEN:
+        return _Leaf(a.text + b.text, a.fmt)
+    if a.height > b.height + 1:
+        return _balance(a.left, _concat(a.right, b))
+    if b.height > a.height + 1:
+        return _balance(_concat(a, b.left), b.right)
+    return _Concat(a, b)
+
+
+def _balance(left: _Node, right: _Node) -> _Node:
+    """Make a node of two AVL trees, which heights differ by at most 2."""
+    if left.height > right.height + 1:
+        if left.left.height >= left.right.height:
+            return _Concat(left.left, _Concat(left.right, right))
+        return _Concat(_Concat(left.left, left.right.left), _Concat(left.right.right, right))
+    if right.height > left.height + 1:
+        if right.right.height >= right.left.height:
+            return _Concat(_Concat(left, right.left), right.right)
+        return _Concat(_Concat(left, right.left.left), _Concat(right.left.right, right.right))
+    return _Concat(left, right)
+
+
+def _head(node: _Node | None, idx: int) -> _Node | None:
+    """Get first *idx* characters of the tree."""
+    if node is None or idx >= node.length:
+        return node
+    if idx <= 0:
+        return None
+    if isinstance(node, _Leaf):
+        return _Leaf(node.text[:idx], node.fmt)
+    left_len = node.left.length
+    if idx <= left_len:
+        return _head(node.left, idx)
+    return _concat(node.left, _head(node.right, idx - left_len))
+
+
+def _tail(node: _Node | None, idx: int) -> _Node | None:
+    """Get the tree without first *idx* characters."""
+    if node is None or idx <= 0:
+        return node
+    if idx >= node.length:
+        return None
+    if isinstance(node, _Leaf):
+        return _Leaf(node.text[idx:], node.fmt)
+    left_len = node.left.length
+    if idx >= left_len:
+        return _tail(node.right, idx - left_len)
+    return _concat(_tail(node.left, idx), node.right)
+
+
+@lru_cache(maxsize=1024)
+def _transition(prev_params: Tuple[int, ...], next_params: Tuple[int, ...]) -> str:
+    """
+    Get the sequence switching from the format of one leaf to the next one,
+    see `SGRState.diff()`. Codes unknown to ``sgr_parity_registry`` (as well
+    as resets) are kept in the output as is, but cannot be switched off one
+    by one, so leaving a format with such codes resets everything.
+    """
+    next_unknown = _get_unknown_groups(next_params)
+    if _get_unknown_groups(prev_params):
+        return SequenceSGR(sgr.RESET, *next_params).print()
+    if (sgr.RESET,) in next_unknown:
+        return SequenceSGR(*next_params).print()
+
+    prev_state = SGRState().apply_params(prev_params)
+    if not next_params:
+        return prev_state.closing_sequence().print()
+    next_state = SGRState().apply_params(next_params)
+    return SequenceSGR(*prev_state.diff(next_state).params, *chain.from_iterable(next_unknown)).print()
+
+
+@lru_cache(maxsize=1024)
+def _get_unknown_groups(params: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """Get the codes (along with their arguments) which `SGRState` doesn't keep track of."""
+    return tuple(group for group, breaker_code in sgr_parity_registry.split_params(list(params))
+                 if breaker_code is None and not sgr_parity_registry.is_breaker(group[0]))
@@ -0,0 +1,118 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
+
+from . import ReplaceSGR
+from .fmtd import truncate_fmtd
+from ..fmt import Format
+
+ALIGN_LEFT = '<'
+ALIGN_RIGHT = '>'
+ALIGN_CENTER = '^'
+
+
+@dataclass
+class TableColumn:
+    """
+    Table column settings. *formatter* is applied to raw cell values
+    (e.g. ``format_prefixed_unit``; ``str`` is used if omitted), while *fmt*
+    is applied to already padded cell content. Set *width* to *None* to
+    determine it automatically from the first rows of the table.
+    """
+    width: int|None = None
+    align: str = ALIGN_LEFT
+    formatter: Callable[[Any], str]|None = None
+    fmt: Format|None = None
+    title: str = ''
+
+
+class TableRenderer:
+    """
+    Render rows of values as table lines. Rows are consumed from the iterable
+    one by one and the lines are yielded lazily, so tables of any size can be
+    rendered in a bounded memory.
+
+    If there are columns without *width* specified, first *auto_width_sample*
+    rows are formatted in advance and the widths are set to the maximum cell
+    lengths; cells of the following rows which don't fit are truncated.
+
+    Usage:
+        >>> renderer = TableRenderer([
+        ...     TableColumn(8, '>', format_prefixed_unit, fmt.cyan),
+        ...     TableColumn(None, formatter=lambda s: format_time_delta(s, 6)),
+        ... ], auto_width_sample=100)
+        >>> for line in renderer.render(rows):
+        ...     print(line)
+    """
+    def __init__(self, columns: List[TableColumn], separator: str = ' ', auto_width_sample: int = 0):
+        for column in columns:
+            if column.align not in (ALIGN_LEFT, ALIGN_RIGHT, ALIGN_CENTER):
+                raise ValueError(f'Invalid column alignment: {column.align!r}')
+            if column.width is None and auto_width_sample <= 0:
+                raise ValueError('Column width is not specified and auto width sample size is 0')
+        self._columns: List[TableColumn] = columns
+        self._separator: str = separator
+        self._auto_width_sample: int = auto_width_sample
+
+    def render(self, rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+        rows = iter(rows)
+        widths = [column.width for column in self._columns]
+        sample = []
+
+        if None in widths:
+            sample = [self._format_row(row) for row in islice(rows, self._auto_width_sample)]
+            for idx, width in enumerate(widths):
+                if width is None:
+                    widths[idx] = max([len(self._columns[idx].title)] +
+                                      [_visible_len(cells[idx]) for cells in sample])
+
+        cell_renderers = [_CellRenderer(column, width) for column, width in zip(self._columns, widths)]
+        separator = self._separator
+
+        if any(column.title for column in self._columns):
+            yield separator.join(_CellRenderer(TableColumn(width, column.align), width).render(column.title)
+                                 for column, width in zip(self._columns, widths))
+        for cells in sample:
+            yield separator.join([cr.render(cell) for cr, cell in zip(cell_renderers, cells)])
+        for row in rows:
+            yield separator.join([cr.render(cell) for cr, cell in zip(cell_renderers, self._format_row(row))])
+
+    def _format_row(self, row: Sequence[Any]) -> List[str]:
+        return [(column.formatter or str)(value) for column, value in zip(self._columns, row)]
+
+
+class _CellRenderer:
+    """Column settings compiled into precomputed SGR strings."""
+    def __init__(self, column: TableColumn, width: int):
+        self._width: int = width
+        self._align: str = column.align
+        self._opening_str: str = column.fmt.opening_str if column.fmt else ''
+        self._closing_str: str = column.fmt.closing_str if column.fmt else ''
+
+    def render(self, text: str) -> str:
+        text_len = _visible_len(text)
+        if text_len > self._width:
+            text = truncate_fmtd(text, self._width)
+            text_len = self._width
+
+        fill_len = self._width - text_len
+        if self._align == ALIGN_LEFT:
+            return self._opening_str + text + ' ' * fill_len + self._closing_str
+        if self._align == ALIGN_RIGHT:
+            return self._opening_str + ' ' * fill_len + text + self._closing_str
+
+        right_fill_len = fill_len // 2
+        return self._opening_str + ' ' * (fill_len - right_fill_len) + text + \
+            ' ' * right_fill_len + self._closing_str
+
+
+def _visible_len(text: str) -> int:
+    if '\033' not in text:
+        return len(text)
+    return len(ReplaceSGR().apply(text))
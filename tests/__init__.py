@@ -2,7 +2,7 @@
 # pytermor [ANSI formatted terminal output toolset]
 # (C) 2022 A. Shavykin <0.delameter@gmail.com>
 # -----------------------------------------------------------------------------
-from pytermor import fmt, Format, autof, seq
+from pytermor import fmt, Format, autof, seq, set_color_mode
 
 __all__ = [
     'VERBOSITY_LEVEL',
@@ -14,6 +14,8 @@ __all__ = [
 
 VERBOSITY_LEVEL = 1
 
+set_color_mode(True)  # expected results are colored regardless of NO_COLOR
+
 
 def verb_print(msg: str, _fmt: Format = fmt.noop, **argv):
     print(_fmt(msg or ''), flush=True, **argv)
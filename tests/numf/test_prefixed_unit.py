@@ -4,7 +4,9 @@
 # -----------------------------------------------------------------------------
 import unittest
 
-from pytermor import format_prefixed_unit, PRESET_SI_BINARY, PRESET_SI_METRIC, PrefixedUnitPreset
+from pytermor import (
+    format_prefixed_unit, format_prefixed_unit_interval, PRESET_SI_BINARY, PRESET_SI_METRIC, PrefixedUnitPreset,
+)
 from tests import verb_print_info, verb_print_header, verb_print_subtests
 
 
@@ -98,3 +100,47 @@ class TestPrefixedUnit(unittest.TestCase):
                                             len(actual_output),
                                             f'Actual output ("{actual_output}") exceeds maximum')
         verb_print_subtests(subtest_count)
+
+
+class TestPrefixedUnitInterval(unittest.TestCase):
+    def test_zero(self):
+        self.assertEqual(('0 b', 0, 0), format_prefixed_unit_interval(0))
+
+    def test_integer_input(self):
+        output, lower, upper = format_prefixed_unit_interval(631.5)
+        self.assertEqual(('631 b', 631), (output, lower))
+        self.assertAlmostEqual(632, upper)
+        self.assertLess(upper, 632)
+
+        output, lower, upper = format_prefixed_unit_interval(-631)
+        self.assertEqual(('-631 b', -631), (output, upper))
+        self.assertAlmostEqual(-632, lower)
+        self.assertGreater(lower, -632)
+
+    def test_rounding(self):
+        output, lower, upper = format_prefixed_unit_interval(1.5, PRESET_SI_METRIC)
+        self.assertEqual('1.50 m', output)
+        self.assertAlmostEqual(1.495, lower)
+        self.assertAlmostEqual(1.505, upper)
+
+    def test_same_output_within_interval(self):
+        values = [-156530231500223, -2501234567, -1257800, -15000, -1080, -1010, -100, -1.5, -0.0123, -1e-9,
+                  1e-9, 0.0123, 0.5, 1, 9.996, 10, 43, 631, 999.9, 1010, 1024, 1080, 45200, 1257800, 14530231500]
+        for preset in [PRESET_SI_BINARY, PRESET_SI_METRIC]:
+            for value in values:
+                with self.subTest(msg=f'{value} ({preset.unit})'):
+                    output, lower, upper = format_prefixed_unit_interval(value, preset)
+                    self.assertEqual(format_prefixed_unit(value, preset), output)
+                    self.assertLessEqual(lower, value)
+                    self.assertGreaterEqual(upper, value)
+                    for inner_value in [lower, (lower + upper) / 2, upper]:
+                        self.assertEqual(output, format_prefixed_unit(inner_value, preset))
+
+    def test_interval_is_tight(self):
+        for preset in [PRESET_SI_BINARY, PRESET_SI_METRIC]:
+            for value in [-1257800, -100, -1.5, 0.0123, 9.996, 631, 1080, 1257800]:
+                with self.subTest(msg=f'{value} ({preset.unit})'):
+                    output, lower, upper = format_prefixed_unit_interval(value, preset)
+                    delta = (abs(lower) + abs(upper)) * 1e-9
+                    self.assertNotEqual(output, format_prefixed_unit(lower - delta, preset))
+                    self.assertNotEqual(output, format_prefixed_unit(upper + delta, preset))
@@ -4,8 +4,9 @@
 # -----------------------------------------------------------------------------
 import unittest
 from datetime import timedelta
+from math import inf
 
-from pytermor import format_time_delta
+from pytermor import format_time_delta, format_time_delta_until, format_time_delta_ns
 from tests import verb_print_info, verb_print_header, verb_print_subtests
 
 
@@ -118,3 +119,93 @@ class TestTimeDelta(unittest.TestCase):
         for invalid_max_len in self.invalid_len_list:
             with self.subTest(msg=f'invalid max length {invalid_max_len}'):
                 self.assertRaises(ValueError, lambda: format_time_delta(100, invalid_max_len))
+
+
+class TestTimeDeltaUntil(unittest.TestCase):
+    expected_dataset = [
+        [('0 secs', 0.0010000000000000002), 0, 10],
+        [('<1 sec', 1), 0.5, 10],
+        [('42 secs', 43), 42.7, 10],
+        [('4h 15min', 15360), 15300.5, 10],
+        [('4h 15m', 15360), 15300.5, 6],
+        [('4h', 18000), 15300.5, 3],
+        [('5d 5h', 453600), 450000, 10],
+        [('15 days', 1382400), 1300000, 10],
+        [('-2 secs', -1.9999999999999998), -2.5, 10],
+        [('~0 secs', 0), -0.5, 10],
+        [('ERR', inf), 100 * 86400, 3],
+    ]
+
+    def test_output_has_expected_format(self):
+        for idx, (expected_output, input_arg, max_len) in enumerate(self.expected_dataset):
+            with self.subTest(msg=f'tdelta-until #{idx}: {input_arg} (len {max_len}) -> {expected_output}'):
+                self.assertEqual(expected_output, format_time_delta_until(input_arg, max_len))
+
+    def test_negative_integer_boundary(self):
+        for seconds in (-1, -2, -58, -59, -60, -61, -3599, -3600, -86400, -90061):
+            for max_len in (4, 6, 10):
+                with self.subTest(msg=f'tdelta-until {seconds} (len {max_len})'):
+                    output, valid_until = format_time_delta_until(seconds, max_len)
+                    self.assertGreater(valid_until, seconds)
+                    self.assertEqual(output, format_time_delta(float(seconds), max_len))
+                    self.assertNotEqual(output, format_time_delta(valid_until, max_len))
+
+    def test_negative_subsecond_boundary(self):
+        for max_len in (3, 4, 6):
+            with self.subTest(msg=f'tdelta-until -0.5 (len {max_len})'):
+                output, valid_until = format_time_delta_until(-0.5, max_len)
+                self.assertEqual(-1e-03, valid_until)
+                self.assertEqual(output, format_time_delta(-0.0010000000000000002, max_len))
+                self.assertNotEqual(output, format_time_delta(valid_until, max_len))
+
+    def test_output_is_valid_until_boundary(self):
+        for max_len in (3, 4, 6, 10):
+            for seconds in (-100000.5, -3600, -61.2, -0.25, 0, 0.0005, 0.3, 1, 59.9, 3599, 7261.4, 864001):
+                with self.subTest(msg=f'tdelta-until {seconds} (len {max_len})'):
+                    output, valid_until = format_time_delta_until(seconds, max_len)
+                    self.assertEqual(format_time_delta(seconds, max_len), output)
+                    self.assertGreater(valid_until, seconds)
+                    last_valid = seconds + (valid_until - seconds) * 0.999
+                    if last_valid < valid_until:  # otherwise the interval is one float wide
+                        self.assertEqual(output, format_time_delta(last_valid, max_len))
+                    if valid_until != inf:
+                        self.assertNotEqual(output, format_time_delta(valid_until, max_len))
+
+
+class TestTimeDeltaNs(unittest.TestCase):
+    def test_output_is_same_as_for_seconds(self):
+        for max_len in (3, 4, 6, 10):
+            for idx, (_, input_arg) in enumerate(TestTimeDelta.expected_format_dataset):
+                with self.subTest(msg=f'tdelta-ns #{idx}: "{input_arg}" (len {max_len})'):
+                    expected_output = format_time_delta(input_arg.total_seconds(), max_len)
+                    nanoseconds = input_arg // timedelta(microseconds=1) * 1000
+                    self.assertEqual(expected_output, format_time_delta_ns(nanoseconds, max_len))
+                    self.assertEqual(expected_output, format_time_delta_ns(input_arg, max_len))
+                    self.assertEqual(expected_output, format_time_delta(input_arg, max_len))
+
+    def test_large_values_are_exact(self):
+        self.assertEqual('2h 0min', format_time_delta_ns(7200 * 10 ** 9 + 1))
+        self.assertEqual('1h 59min', format_time_delta_ns(7200 * 10 ** 9 - 1))
+
+    expected_subsecond_dataset = [
+        [('0ns', '0 ns', '0 ns'), 0],
+        [('750ns', '750 ns', '750 ns'), 750],
+        [('12μs', '12 μs', '12 μs'), 12345],
+        [('15ms', '15 ms', '15 ms'), 15 * 10 ** 6],
+        [('9s', '9 sec', '9s 500ms'), 9500 * 10 ** 6],
+        [('9s', '9 sec', '-9s 500ms'), -9500 * 10 ** 6],
+        [('59s', '59 sec', '59 sec'), 59999 * 10 ** 6],
+        [('4h', '4h 15m', '4h 15min'), 15300 * 10 ** 9],
+        [('OVERF', 'OVERFL', 'OVERFLOW'), 10 ** 15 * 86400],
+    ]
+
+    def test_subsecond_output_has_expected_format(self):
+        for idx, (expected_outputs, input_arg) in enumerate(self.expected_subsecond_dataset):
+            for expected_output, max_len in zip(expected_outputs, (5, 6, 10)):
+                with self.subTest(msg=f'tdelta-ns/subsecond #{idx}: {input_arg} (len {max_len})'):
+                    actual_output = format_time_delta_ns(input_arg, max_len, subsecond=True)
+                    self.assertEqual(expected_output, actual_output)
+                    self.assertGreaterEqual(max_len, len(actual_output))
+
+    def test_subsecond_invalid_max_length_fails(self):
+        self.assertRaises(ValueError, lambda: format_time_delta_ns(100, 4, subsecond=True))
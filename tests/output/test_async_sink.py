@@ -0,0 +1,58 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import asyncio
+import socket
+import unittest
+
+from pytermor import fmt
+from pytermor.output import AsyncSink
+
+
+async def _open_socket_pair():
+    rsock, wsock = socket.socketpair()
+    reader, reader_side_writer = await asyncio.open_connection(sock=rsock)
+    _, writer = await asyncio.open_connection(sock=wsock)
+    reader.keepalive = reader_side_writer  # otherwise it closes the socket when collected
+    return reader, writer
+
+
+class TestAsyncSink(unittest.TestCase):
+    def test_formatted_fragments_are_written(self):
+        async def run():
+            reader, writer = await _open_socket_pair()
+            async with AsyncSink(writer) as sink:
+                await sink.write('OK', fmt.green)
+                await sink.write(' ')
+                await sink.write(42, fmt.bold)
+            return await reader.read(), sink
+
+        data, sink = asyncio.run(run())
+        self.assertEqual((fmt.green('OK') + ' ' + fmt.bold('42')).encode(), data)
+        self.assertEqual(1, sink.flush_count)
+        self.assertEqual(len(data), sink.bytes_written)
+
+    def test_flush_on_size_threshold(self):
+        async def run():
+            reader, writer = await _open_socket_pair()
+            sink = AsyncSink(writer, flush_size=10, flush_interval=None)
+            await sink.write('12345')
+            flush_count_before = sink.flush_count
+            await sink.write('67890')
+            data = await reader.readexactly(10)
+            await sink.close()
+            return flush_count_before, sink.flush_count, data
+
+        self.assertEqual((0, 1, b'1234567890'), asyncio.run(run()))
+
+    def test_flush_on_time_threshold(self):
+        async def run():
+            reader, writer = await _open_socket_pair()
+            sink = AsyncSink(writer, flush_interval=0.01)
+            await sink.write('abc', fmt.red)
+            data = await asyncio.wait_for(reader.readexactly(len(fmt.red('abc'))), 1)
+            await sink.close()
+            return data
+
+        self.assertEqual(fmt.red('abc').encode(), asyncio.run(run()))
@@ -0,0 +1,99 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import random
+import re
+import unittest
+from typing import List
+
+from pytermor import fmt, ReplaceSGR
+from pytermor.output import LiveRegion
+
+
+class VirtualTerminal:
+    """Minimal terminal emulator supporting the sequences emitted by LiveRegion; SGRs are ignored."""
+    def __init__(self):
+        self.screen: List[List[str]] = [[]]
+        self.row = self.col = 0
+
+    def feed(self, data: str):
+        for match in re.finditer(r'\033\[([0-9;]*)([A-Za-z])|(.)', data, re.DOTALL):
+            if match.group(3) is not None:
+                self._put_char(match.group(3))
+                continue
+            param = int(match.group(1) or 0)
+            command = match.group(2)
+            if command == 'A':
+                self.row = max(0, self.row - (param or 1))
+            elif command == 'B':
+                self.row = min(len(self.screen) - 1, self.row + (param or 1))
+            elif command == 'G':
+                self.col = (param or 1) - 1
+            elif command == 'K':
+                del self.screen[self.row][self.col:]
+            elif command == 'J':
+                del self.screen[self.row][self.col:]
+                del self.screen[self.row + 1:]
+
+    def _put_char(self, char: str):
+        if char == '\r':
+            self.col = 0
+        elif char == '\n':
+            self.row += 1
+            self.col = 0
+            if self.row == len(self.screen):
+                self.screen.append([])
+        else:
+            line = self.screen[self.row]
+            line.extend(' ' * (self.col - len(line) + 1))
+            line[self.col] = char
+            self.col += 1
+
+    @property
+    def lines(self) -> List[str]:
+        return [''.join(line) for line in self.screen]
+
+
+class TestLiveRegion(unittest.TestCase):
+    def _update(self, region: LiveRegion, stream: io.StringIO, terminal: VirtualTerminal, lines: List[str]) -> str:
+        region.update(lines)
+        data = stream.getvalue()
+        stream.seek(0)
+        stream.truncate()
+        terminal.feed(ReplaceSGR().apply(data))
+        return data
+
+    def test_only_changed_lines_are_rewritten(self):
+        stream, terminal = io.StringIO(), VirtualTerminal()
+        region = LiveRegion(stream)
+        self._update(region, stream, terminal, ['job1 10%', 'job2 20%', 'job3 30%'])
+        data = self._update(region, stream, terminal, ['job1 10%', 'job2 25%', 'job3 30%'])
+
+        self.assertEqual(['job1 10%', 'job2 25%', 'job3 30%', ''], terminal.lines)
+        self.assertNotIn('job1', data)
+        self.assertNotIn('job2', data)
+        self.assertIn('5%', data)
+
+    def test_region_shrinks_and_grows(self):
+        stream, terminal = io.StringIO(), VirtualTerminal()
+        region = LiveRegion(stream)
+        self._update(region, stream, terminal, ['a', 'b', 'c'])
+        self._update(region, stream, terminal, ['a'])
+        self.assertEqual(['a', ''], terminal.lines)
+        self._update(region, stream, terminal, ['a', 'bb', 'c', 'd'])
+        self.assertEqual(['a', 'bb', 'c', 'd', ''], terminal.lines)
+        region.clear()
+        terminal.feed(stream.getvalue())
+        self.assertEqual([''], terminal.lines)
+
+    def test_random_frames_are_drawn_correctly(self):
+        rnd = random.Random(1)
+        stream, terminal = io.StringIO(), VirtualTerminal()
+        region = LiveRegion(stream)
+        for _ in range(200):
+            lines = [f'job{idx} ' + fmt.green('#' * rnd.randint(0, 10)) + ' ' + str(rnd.randint(0, 100))
+                     for idx in range(rnd.randint(0, 6))]
+            self._update(region, stream, terminal, lines)
+            self.assertEqual([ReplaceSGR().apply(line) for line in lines] + [''], terminal.lines)
@@ -0,0 +1,55 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import logging
+import sys
+import unittest
+
+from pytermor import fmt, seq
+from pytermor.output import LogFormatter
+
+
+def _make_record(level: int, msg: str, *args, **kwargs) -> logging.LogRecord:
+    return logging.makeLogRecord(dict(name='app', levelno=level, levelname=logging.getLevelName(level),
+                                      msg=msg, args=args, relativeCreated=65000, **kwargs))
+
+
+class TestLogFormatter(unittest.TestCase):
+    def test_level_fields_are_formatted(self):
+        formatter = LogFormatter('[{levelname}] {name}: {message}', colorize=True)
+        self.assertEqual(f'[{fmt.yellow("WARNING")}] app: disk 95% full',
+                         formatter.format(_make_record(logging.WARNING, 'disk %d%% full', 95)))
+        self.assertEqual(f'[{seq.BOLD + seq.RED}CRITICAL{seq.BOLD_DIM_OFF + seq.COLOR_OFF}] app: x',
+                         formatter.format(_make_record(logging.CRITICAL, 'x')))
+
+    def test_custom_styled_fields(self):
+        formatter = LogFormatter('{levelname} {message}', styled_fields=['message'], colorize=True)
+        self.assertEqual(f'ERROR {fmt.red("failed")}', formatter.format(_make_record(logging.ERROR, 'failed')))
+
+    def test_custom_level_uses_closest_lower_level_format(self):
+        formatter = LogFormatter('{message}', styled_fields=['message'], colorize=True)
+        self.assertEqual(fmt.yellow('x'), formatter.format(_make_record(35, 'x')))
+
+    def test_no_sequences_when_not_colorized(self):
+        formatter = LogFormatter('{{{levelname:>7s}}} {message}', colorize=False)
+        self.assertEqual('{  ERROR} failed', formatter.format(_make_record(logging.ERROR, 'failed')))
+
+    def test_colorize_depends_on_stream(self):
+        formatter = LogFormatter('{levelname}', stream=io.StringIO())
+        self.assertEqual('ERROR', formatter.format(_make_record(logging.ERROR, '')))
+
+    def test_relative_time(self):
+        formatter = LogFormatter('{reltime} {message}', colorize=False, reltime_len=6)
+        self.assertEqual('1 min msg', formatter.format(_make_record(logging.INFO, 'msg')))
+
+    def test_exception_is_appended(self):
+        formatter = LogFormatter('{message}', colorize=False)
+        try:
+            raise ValueError('oops')
+        except ValueError:
+            record = _make_record(logging.ERROR, 'failed', exc_info=sys.exc_info())
+        output = formatter.format(record)
+        self.assertTrue(output.startswith('failed\nTraceback'))
+        self.assertTrue(output.endswith('ValueError: oops'))
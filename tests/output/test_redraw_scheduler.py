@@ -0,0 +1,51 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import time
+import unittest
+
+from pytermor import format_prefixed_unit
+from pytermor.output import LiveRegion, RedrawScheduler
+
+
+class TestRedrawScheduler(unittest.TestCase):
+    def test_requests_are_coalesced(self):
+        rendered = []
+        scheduler = RedrawScheduler(lambda state: rendered.append(state), max_fps=20)
+        for idx in range(1000):
+            scheduler.request(idx)
+        time.sleep(0.06)
+        scheduler.request(1000)
+        scheduler.stop()
+        stats = scheduler.stats
+
+        self.assertEqual(1000, rendered[-1])
+        self.assertLess(len(rendered), 10)
+        self.assertEqual(1001, stats['requests'])
+        self.assertEqual(len(rendered), stats['frames'])
+        self.assertEqual(1001 - len(rendered), stats['skipped'])
+
+    def test_frame_rate_is_limited(self):
+        frame_times = []
+        scheduler = RedrawScheduler(lambda _: frame_times.append(time.monotonic()), max_fps=50)
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:
+            scheduler.request(None)
+            time.sleep(0.001)
+        scheduler.stop()
+
+        intervals = [b - a for a, b in zip(frame_times, frame_times[1:-1])]
+        self.assertGreater(len(frame_times), 2)
+        self.assertTrue(all(interval >= 0.019 for interval in intervals), intervals)
+
+    def test_final_frame_is_rendered_to_region(self):
+        stream = io.StringIO()
+        region = LiveRegion(stream)
+        with RedrawScheduler(lambda value: [format_prefixed_unit(value)], region, max_fps=1) as scheduler:
+            for value in range(0, 10000, 1000):
+                scheduler.request(value)
+        self.assertEqual(['8.789 kb'], region.lines)
+        self.assertIsNotNone(scheduler.stats['frame_time_max'])
+        self.assertEqual(0, scheduler.stats['errors'])
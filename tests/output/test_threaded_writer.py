@@ -0,0 +1,114 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import threading
+import unittest
+
+from pytermor import fmt
+from pytermor.output import ThreadedWriter, POLICY_DROP
+
+
+class BlockedStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.unblocked.wait()
+        return super().write(s)
+
+
+class TestThreadedWriter(unittest.TestCase):
+    def test_records_are_rendered_and_written(self):
+        stream = io.StringIO()
+        writer = ThreadedWriter(stream)
+        writer.write('OK', fmt.green)
+        writer.write(lambda: ' lazy')
+        writer.write(5, fmt.bold)
+        writer.close()
+
+        self.assertEqual(fmt.green('OK') + ' lazy' + fmt.bold(5), stream.getvalue())
+        self.assertEqual(3, writer.queued)
+        self.assertEqual(3, writer.written)
+        self.assertEqual(0, writer.dropped)
+
+    def test_flush_waits_for_queued_records(self):
+        stream = io.StringIO()
+        writer = ThreadedWriter(stream, batch_size=2)
+        for idx in range(10):
+            writer.write(idx)
+        writer.flush()
+        self.assertEqual('0123456789', stream.getvalue())
+        writer.close()
+
+    def test_drop_policy(self):
+        stream = BlockedStream()
+        writer = ThreadedWriter(stream, max_queue=2, policy=POLICY_DROP, batch_size=1)
+        for idx in range(10):
+            writer.write(idx)
+        stream.unblocked.set()
+        writer.close()
+
+        self.assertEqual(10, writer.queued + writer.dropped)
+        self.assertEqual(writer.queued, writer.written)
+        self.assertLessEqual(7, writer.dropped)
+
+    def test_write_to_closed_writer_fails(self):
+        writer = ThreadedWriter(io.StringIO())
+        writer.close()
+        self.assertRaises(RuntimeError, writer.write, 'abc')
+
+    def test_failed_record_does_not_drop_batch(self):
+        stream, errors = io.StringIO(), []
+        writer = ThreadedWriter(stream, on_error=lambda e, texts: errors.append((e, texts)))
+        failing = lambda: 1 / 0
+        writer.write('a')
+        writer.write(failing)
+        writer.write('b', fmt.bold)
+        writer.close()
+
+        self.assertEqual('a' + fmt.bold('b'), stream.getvalue())
+        self.assertEqual((2, 1, 1), (writer.written, writer.lost, writer.errors))
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0][0], ZeroDivisionError)
+        self.assertEqual([failing], errors[0][1])
+
+    def test_stream_failure_reports_batch(self):
+        class FailingStream(io.StringIO):
+            def write(self, s: str) -> int:
+                raise OSError('disk full')
+
+        errors = []
+        writer = ThreadedWriter(FailingStream(), on_error=lambda e, texts: errors.append(texts))
+        writer.write('a')
+        writer.flush()
+        writer.close()
+        self.assertEqual((0, 1), (writer.written, writer.lost))
+        self.assertEqual([['a']], errors)
+
+    def test_write_racing_with_close(self):
+        stream = io.StringIO()
+        writer = ThreadedWriter(stream, max_queue=4, batch_size=2)
+        rejected = []
+
+        def produce():
+            for idx in range(200):
+                try:
+                    writer.write(idx)
+                except RuntimeError:
+                    rejected.append(idx)
+                    return
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        writer.close()
+        for thread in threads:
+            thread.join()
+        writer.flush()  # must not hang
+        self.assertEqual(writer.queued, writer.written)
+
+    def test_invalid_policy_fails(self):
+        self.assertRaises(ValueError, ThreadedWriter, io.StringIO(), policy='wait')
@@ -0,0 +1,82 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pytermor import fmt, seq
+from pytermor.output import VectoredWriter
+
+
+class TestVectoredWriter(unittest.TestCase):
+    def setUp(self):
+        self.file = tempfile.TemporaryFile()
+
+    def tearDown(self):
+        self.file.close()
+
+    def read_file(self) -> bytes:
+        self.file.seek(0)
+        return self.file.read()
+
+    def test_fragments_are_written_in_order(self):
+        writer = VectoredWriter(self.file.fileno())
+        writer.write(b'OK', fmt.green)
+        writer.write(b' ')
+        writer.write_seq(seq.BOLD)
+        writer.write('ты'.encode())
+        writer.flush()
+        self.assertEqual(b'\033[32mOK\033[39m \033[1m\xd1\x82\xd1\x8b', self.read_file())
+        self.assertEqual(1, writer.syscall_count)
+        self.assertEqual(21, writer.bytes_written)
+
+    def test_batches_respect_iov_max(self):
+        writer = VectoredWriter(self.file.fileno(), iov_max=4)
+        for i in range(5):
+            writer.write(b'%d' % i, fmt.bold)
+        writer.flush()
+        self.assertEqual(b''.join(fmt.bold(i).encode() for i in range(5)), self.read_file())
+        self.assertEqual(5, writer.syscall_count)
+
+    def test_partial_writes_are_resumed(self):
+        def writev_by_3_bytes(fd, buffers):
+            return os.write(fd, b''.join(bytes(b) for b in buffers)[:3])
+
+        with mock.patch('pytermor.output.vectored_writer.os.writev', side_effect=writev_by_3_bytes):
+            writer = VectoredWriter(self.file.fileno())
+            writer.write(b'abcd', fmt.red)
+            writer.write(b'ef')
+            writer.flush()
+        self.assertEqual(b'\033[31mabcd\033[39mef', self.read_file())
+        self.assertEqual(6, writer.syscall_count)
+
+    def test_flush_on_iov_max(self):
+        writer = VectoredWriter(self.file.fileno(), iov_max=4)
+        writer.write(b'ab', fmt.red)
+        self.assertEqual(b'', self.read_file())
+        writer.write(b'cd')
+        self.assertEqual(b'\033[31mab\033[39mcd', self.read_file())
+
+    def test_binary_stream_is_flushed_first(self):
+        with open(self.file.fileno(), 'wb', closefd=False) as stream:
+            stream.write(b'head ')
+            with VectoredWriter(stream) as writer:
+                writer.write(b'tail', fmt.bold)
+        self.assertEqual(b'head \033[1mtail\033[22m', self.read_file())
+
+    def test_fallback_without_file_descriptor(self):
+        stream = io.BytesIO()
+        with VectoredWriter(stream) as writer:
+            writer.write(b'OK', fmt.green)
+            writer.write(b'!')
+        self.assertEqual(b'\033[32mOK\033[39m!', stream.getvalue())
+
+    def test_disabled_colors(self):
+        stream = io.BytesIO()
+        with fmt.color_mode(False), VectoredWriter(stream) as writer:
+            writer.write(b'OK', fmt.green)
+        self.assertEqual(b'OK', stream.getvalue())
@@ -0,0 +1,77 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import random
+import re
+import unittest
+from typing import List, Tuple
+
+from pytermor import seq, SequenceSGR, SGRState
+from pytermor.strf import anchor_lines, unanchor_lines
+
+
+def render(text: str) -> List[Tuple[str, SGRState]]:
+    """Get visible characters along with their styles, line breaks excluded."""
+    result = []
+    state = SGRState()
+    for part in re.split(r'(\033\[[0-9;]*m)', text):
+        if part.startswith('\033'):
+            state = state.apply(SequenceSGR.parse(part))
+        else:
+            result.extend((c, state) for c in part if c not in '\r\n')
+    return result
+
+
+def generate_text(seed: int, parts_count: int) -> str:
+    rnd = random.Random(seed)
+    pieces = [seq.BOLD, seq.DIM, seq.BOLD_DIM_OFF, seq.RED, seq.BLUE, seq.COLOR_OFF, seq.BG_GRAY, seq.RESET,
+              seq.build_c256(208), seq.UNDERLINED, seq.UNDERLINED_OFF, 'word', ' ', '\n', '\n', '\r\n']
+    return ''.join(str(rnd.choice(pieces)) for _ in range(parts_count))
+
+
+class TestAnchorLines(unittest.TestCase):
+    def test_anchor(self):
+        lines = ['\033[1;31mbold red\n', 'bold\033[39m\n', 'still bold\033[22m\n', 'plain']
+        self.assertEqual(['\033[1;31mbold red\033[m\n',
+                          '\033[1;31mbold\033[39m\033[22m\n',
+                          '\033[1mstill bold\033[22m\n',
+                          'plain'], list(anchor_lines(lines)))
+
+    def test_lines_are_self_contained(self):
+        for seed in range(20):
+            text = generate_text(seed, 200)
+            anchored = list(anchor_lines(text.splitlines(keepends=True)))
+            with self.subTest(seed=seed):
+                self.assertEqual(render(text), render(''.join(anchored)))
+                self.assertEqual(render(text), [c for line in anchored for c in render(line)])
+                for line in anchored:
+                    self.assertFalse(render(line.rstrip('\r\n') + 'x')[-1][1])
+
+    def test_empty(self):
+        self.assertEqual([], list(anchor_lines([])))
+        self.assertEqual([], list(unanchor_lines([])))
+
+
+class TestUnanchorLines(unittest.TestCase):
+    def test_inverse(self):
+        lines = ['\033[31mred\n', 'still red\033[39m\n']
+        self.assertEqual(''.join(lines), ''.join(unanchor_lines(anchor_lines(lines))))
+
+    def test_empty_lines_are_skipped(self):
+        lines = ['\033[1;31mred\n', 'a\033[22mb\n', '\n', 'x\033[mlast']
+        self.assertEqual(''.join(lines), ''.join(unanchor_lines(anchor_lines(lines))))
+
+    def test_renders_the_same(self):
+        for seed in range(20):
+            text = generate_text(seed, 200)
+            with self.subTest(seed=seed):
+                anchored = list(anchor_lines(text.splitlines(keepends=True)))
+                restored = ''.join(unanchor_lines(anchored))
+                self.assertEqual(render(text), render(restored))
+                self.assertEqual(text.count('\n'), restored.count('\n'))
+                self.assertLessEqual(len(restored), len(''.join(anchored)))
+
+    def test_style_is_closed_at_the_end(self):
+        restored = ''.join(unanchor_lines(anchor_lines(['\033[1mbold\n', 'bold\n'])))
+        self.assertEqual('\033[1mbold\nbold\033[22m\n', restored)
@@ -0,0 +1,102 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import textwrap
+import unittest
+
+from pytermor import fmt, seq, truncate_fmtd, slice_fmtd, wrap_fmtd, ReplaceSGR
+
+
+class TestTruncateFmtd(unittest.TestCase):
+    sample = fmt.red('hello ' + fmt.bold('world') + ' foo') + ' bar'
+
+    def test_fitting_string_is_not_modified(self):
+        self.assertIs(self.sample, truncate_fmtd(self.sample, 19))
+        self.assertIs(self.sample, truncate_fmtd(self.sample, 100, '…'))
+
+    def test_truncation_closes_active_formats(self):
+        self.assertEqual(f'{seq.RED}hello {seq.BOLD}wo{seq.BOLD_DIM_OFF + seq.COLOR_OFF}',
+                         truncate_fmtd(self.sample, 8))
+
+    def test_truncation_with_ellipsis(self):
+        self.assertEqual(f'{seq.RED}hello…{seq.COLOR_OFF}', truncate_fmtd(self.sample, 6, '…'))
+
+    def test_truncation_after_closed_format(self):
+        self.assertEqual(f'{seq.RED}hello {seq.BOLD}world{seq.BOLD_DIM_OFF} fo{seq.COLOR_OFF}',
+                         truncate_fmtd(self.sample, 14))
+
+    def test_result_fits_in_required_width(self):
+        for width in range(0, 22):
+            with self.subTest(width=width):
+                result = truncate_fmtd(self.sample, width, '..')
+                self.assertGreaterEqual(width, len(ReplaceSGR().apply(result)))
+
+    def test_reset_clears_active_formats(self):
+        s = f'{seq.BOLD}{seq.RED}ab{seq.RESET}cdef'
+        self.assertEqual(f'{seq.BOLD}{seq.RED}ab{seq.RESET}c', truncate_fmtd(s, 3))
+
+    def test_extended_colors(self):
+        s = fmt.bold(f'{seq.build_c256(208)}abcdef')
+        self.assertEqual(f'{seq.BOLD}{seq.build_c256(208)}ab{seq.BOLD_DIM_OFF + seq.COLOR_OFF}', truncate_fmtd(s, 2))
+
+    def test_invalid_width_fails(self):
+        self.assertRaises(ValueError, truncate_fmtd, 'abc', -1)
+
+
+class TestSliceFmtd(unittest.TestCase):
+    sample = fmt.red('hello ' + fmt.bold('world') + ' foo') + ' bar'
+
+    def test_slice_matches_plain_slice(self):
+        plain = ReplaceSGR().apply(self.sample)
+        for start, stop in [(0, 3), (2, 8), (6, 11), (7, None), (None, 5), (-5, None), (3, -2), (20, 30), (5, 2)]:
+            with self.subTest(start=start, stop=stop):
+                self.assertEqual(plain[start:stop], ReplaceSGR().apply(slice_fmtd(self.sample, start, stop)))
+
+    def test_slice_reopens_active_formats(self):
+        self.assertEqual(f'{seq.BOLD + seq.RED}world{seq.BOLD_DIM_OFF + seq.COLOR_OFF}',
+                         slice_fmtd(self.sample, 6, 11))
+
+    def test_unknown_codes_are_not_carried_over(self):
+        self.assertEqual(f'{seq.BOLD}b{seq.BOLD_DIM_OFF}', slice_fmtd('\033[51;1mabc\033[m', 1, 2))
+
+    def test_slice_of_unformatted_string(self):
+        self.assertEqual('cde', slice_fmtd('abcdefgh', 2, 5))
+
+
+class TestWrapFmtd(unittest.TestCase):
+    def test_plain_text_is_wrapped_as_textwrap_does(self):
+        s = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore'
+        for width in [5, 10, 17, 40, 200]:
+            with self.subTest(width=width):
+                self.assertEqual(textwrap.wrap(s, width), list(wrap_fmtd(s, width)))
+
+    def test_formats_are_carried_over(self):
+        s = fmt.red('hello ' + fmt.bold('wide world'))
+        self.assertEqual([
+            f'{seq.RED}hello{seq.COLOR_OFF}',
+            f'{seq.RED}{seq.BOLD}wide{seq.BOLD_DIM_OFF + seq.COLOR_OFF}',
+            f'{seq.BOLD + seq.RED}world{seq.BOLD_DIM_OFF}{seq.COLOR_OFF}',
+        ], list(wrap_fmtd(s, 6)))
+
+    def test_long_words_are_broken(self):
+        s = 'ab ' + fmt.underlined('cdefghij') + ' k'
+        self.assertEqual([
+            f'ab {seq.UNDERLINED}c{seq.UNDERLINED_OFF}',
+            f'{seq.UNDERLINED}defg{seq.UNDERLINED_OFF}',
+            f'{seq.UNDERLINED}hij{seq.UNDERLINED_OFF}',
+            'k',
+        ], list(wrap_fmtd(s, 4)))
+
+    def test_newlines_are_kept(self):
+        self.assertEqual(['abc', '', '  de', 'f'], list(wrap_fmtd('abc\n\n  de f', 4)))
+
+    def test_lines_fit_in_required_width(self):
+        s = ' '.join(fmt.bold(w) if idx % 2 else fmt.cyan(w) for idx, w in enumerate('abc defg h ijklmnopq rs tuv'.split()))
+        for width in range(1, 12):
+            with self.subTest(width=width):
+                for line in wrap_fmtd(s, width):
+                    self.assertGreaterEqual(width, len(ReplaceSGR().apply(line)))
+
+    def test_invalid_width_fails(self):
+        self.assertRaises(ValueError, lambda: list(wrap_fmtd('abc', 0)))
@@ -0,0 +1,48 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import unittest
+
+from pytermor import fmt, seq, color_mode, compile_markup, render_markup
+
+
+class TestMarkup(unittest.TestCase):
+    def test_tags_and_placeholders(self):
+        self.assertEqual(f'{seq.BOLD + seq.RED}db01{seq.BOLD_DIM_OFF + seq.COLOR_OFF} is {fmt.green("up")}',
+                         render_markup('[bold red]{name}[/] is [green]{}[/]', 'up', name='db01'))
+
+    def test_nested_tags_restore_outer_format(self):
+        self.assertEqual(f'{seq.RED}a{seq.BLUE}b{seq.COLOR_OFF}{seq.RED}c{seq.COLOR_OFF}',
+                         render_markup('[red]a[blue]b[/]c[/]'))
+        self.assertEqual(f'{seq.RED}a{seq.BOLD}b{seq.BOLD_DIM_OFF}c{seq.COLOR_OFF}',
+                         render_markup('[red]a[bold]b[/]c[/]'))
+
+    def test_unclosed_tags_are_closed(self):
+        self.assertEqual(f'{seq.UNDERLINED}a{seq.UNDERLINED_OFF}', render_markup('[underlined]a'))
+
+    def test_escaped_bracket(self):
+        self.assertEqual(f'[INFO] {fmt.bold("ok")}', render_markup('[[INFO] [bold]{}[/]', 'ok'))
+
+    def test_placeholder_values_are_not_parsed(self):
+        self.assertEqual('[red]', render_markup('{}', '[red]'))
+
+    def test_indexed_and_keyed_placeholders(self):
+        self.assertEqual(fmt.bold('b'), render_markup('[bold]{0[1]}[/]', 'ab'))
+        self.assertEqual(f'{fmt.red("up")}!', render_markup('[red]{d[red]}[/]!', d={'red': 'up'}))
+        self.assertEqual(' 1.50', render_markup('{v[x]:{w}.2f}', v={'x': 1.5}, w=5))
+
+    def test_escaped_braces(self):
+        self.assertEqual(f'{{{fmt.bold("a")}}}', render_markup('{{[bold]{}[/]}}', 'a'))
+        self.assertEqual('{[red]}', render_markup('{{[[red]}}'))
+
+    def test_templates_are_cached(self):
+        self.assertIs(compile_markup('[bold]{}[/]'), compile_markup('[bold]{}[/]'))
+
+    def test_disabled_colors(self):
+        with color_mode(False):
+            self.assertEqual('db01 is up', render_markup('[bold red]{}[/] is [green]up[/]', 'db01'))
+
+    def test_invalid_markup_fails(self):
+        self.assertRaises(KeyError, compile_markup, '[nonexistent]a[/]')
+        self.assertRaises(ValueError, compile_markup, 'a[/]')
@@ -0,0 +1,93 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import re
+import unittest
+
+from pytermor import seq, color_mode, Format, SGRState
+from pytermor.strf import SearchableText, highlight_fmtd, ReplaceSGR
+from tests.strf.test_anchoring import generate_text, render
+
+
+class TestSearchableText(unittest.TestCase):
+    def setUp(self):
+        self.raw = '\033[31mer\033[1mror\033[m: disk \033[34mfull\033[39m'
+        self.text = SearchableText(self.raw)
+        self.fmt = Format(seq.INVERSED, seq.INVERSED_OFF)
+
+    def test_plain(self):
+        self.assertEqual('error: disk full', self.text.plain)
+        self.assertEqual(16, len(self.text))
+
+    def test_plain_matches_replace_sgr(self):
+        raw = generate_text(3, 2000)
+        self.assertEqual(ReplaceSGR().apply(raw), SearchableText(raw).plain)
+
+    def test_to_raw(self):
+        for plain_pos, char in enumerate(self.text.plain):
+            self.assertEqual(char, self.raw[self.text.to_raw(plain_pos)])
+        self.assertEqual(len(self.raw), self.text.to_raw(len(self.text)))
+
+    def test_find_interrupted(self):
+        self.assertEqual((5, 14), self.text.find('error'))
+        self.assertEqual('er\033[1mror', self.raw[slice(*self.text.find('error'))])
+
+    def test_find_excludes_surrounding_sequences(self):
+        self.assertEqual('full', self.raw[slice(*self.text.find('full'))])
+
+    def test_find_not_found(self):
+        self.assertIsNone(self.text.find('warning'))
+        self.assertIsNone(self.text.find('error', 1))
+
+    def test_find_empty(self):
+        self.assertEqual((5, 5), self.text.find(''))
+
+    def test_finditer(self):
+        spans = list(self.text.finditer(r'r+'))
+        self.assertEqual(['r\033[1mr', 'r'], [self.raw[start:end] for start, end in spans])
+
+    def test_finditer_compiled_pattern(self):
+        self.assertEqual(1, len(list(self.text.finditer(re.compile('DISK', re.IGNORECASE)))))
+
+    def test_state_at(self):
+        self.assertEqual(SGRState().apply(seq.RED), self.text.state_at(0))
+        self.assertEqual(SGRState().apply(seq.RED + seq.BOLD), self.text.state_at(2))
+        self.assertEqual(SGRState(), self.text.state_at(5))
+        self.assertEqual(SGRState().apply(seq.BLUE), self.text.state_at(12))
+
+    def test_highlight(self):
+        self.assertEqual('\033[31mer\033[1mror\033[m: \033[7mdisk\033[27m \033[34mfull\033[39m',
+                         self.text.highlight('disk', self.fmt))
+
+    def test_highlight_interrupted(self):
+        self.assertEqual('\033[31me\033[7mrror\033[27;1m\033[m: disk \033[34mfull\033[39m',
+                         self.text.highlight('rror', self.fmt))
+
+    def test_highlight_disabled_colors(self):
+        with color_mode(False):
+            self.assertEqual(self.raw, self.text.highlight('disk', self.fmt))
+
+    def test_states_are_computed_up_to_requested_run(self):
+        text = SearchableText(self.raw)
+        self.assertEqual(SGRState(), text.state_at(5))
+        self.assertEqual(4, len(text._states))
+        self.assertEqual(SGRState(), text.state_at(len(text)))
+
+    def test_highlight_no_matches(self):
+        self.assertEqual(self.raw, self.text.highlight('warning', self.fmt))
+
+    def test_highlight_restores_state(self):
+        raw = generate_text(7, 3000)
+        expected = render(raw)
+        highlight_state = SGRState().apply(seq.INVERSED)
+        result = render(highlight_fmtd(raw, r'o\w', self.fmt))
+
+        self.assertEqual([c for c, _ in expected], [c for c, _ in result])
+        highlighted = {m.start() for m in re.finditer(r'o\w', ''.join(c for c, _ in expected))}
+        highlighted |= {pos + 1 for pos in highlighted}
+        for pos, ((_, expected_state), (_, state)) in enumerate(zip(expected, result)):
+            if pos in highlighted:
+                self.assertTrue(state.has(highlight_state.to_sequence().params[0]), f'pos {pos}')
+            else:
+                self.assertEqual(expected_state, state, f'pos {pos}')
@@ -0,0 +1,124 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import random
+import unittest
+
+from pytermor import fmt, seq, autof, color_mode, Format, ReplaceSGR, SequenceSGR, StyledText
+from pytermor import ljust_fmtd, rjust_fmtd, center_fmtd, truncate_fmtd, slice_fmtd, wrap_fmtd
+from pytermor.strf.styled_text import _Concat
+
+
+def tree_height(node) -> int:
+    if not isinstance(node, _Concat):
+        return 0
+    left, right = tree_height(node.left), tree_height(node.right)
+    assert abs(left - right) <= 1, 'Tree is unbalanced'
+    return max(left, right) + 1
+
+
+class TestStyledText(unittest.TestCase):
+    def test_render(self):
+        text = StyledText('a', fmt.red) + StyledText('b', fmt.bold) + 'c'
+        self.assertEqual(3, len(text))
+        self.assertEqual('abc', text.plain)
+        self.assertEqual(f'{seq.RED}a{seq.BOLD + seq.COLOR_OFF}b{seq.BOLD_DIM_OFF}c', text.render())
+        self.assertEqual(text.render(), str(text))
+        self.assertEqual(text.render().encode(), text.render_bytes())
+
+    def test_minimal_transitions(self):
+        text = StyledText('r', autof(seq.BOLD, seq.RED)) + StyledText('b', autof(seq.BOLD, seq.BLUE)) + \
+            StyledText('d', autof(seq.DIM, seq.BLUE))
+        self.assertEqual(f'{seq.BOLD + seq.RED}r{seq.BLUE}b{seq.BOLD_DIM_OFF + seq.DIM}d{seq.BOLD_DIM_OFF + seq.COLOR_OFF}',
+                         text.render())
+
+    def test_same_format_spans_are_merged(self):
+        text = StyledText('a', fmt.green) + StyledText('b', autof(seq.GREEN))
+        self.assertEqual(fmt.green('ab'), text.render())
+
+    def test_unknown_codes_are_kept_and_closed_with_reset(self):
+        text = StyledText('a', Format(SequenceSGR(51, 1))) + StyledText('b', fmt.bold) + StyledText('c', fmt.red)
+        self.assertEqual('\033[1;51ma\033[0;1mb\033[22;31mc\033[39m', text.render())
+
+    def test_reset_format_is_closed_with_reset(self):
+        text = StyledText('a', autof(seq.RESET + seq.RED)) + StyledText('b', fmt.bold)
+        self.assertEqual(f'\033[0;31ma\033[0;1mb{seq.BOLD_DIM_OFF}', text.render())
+
+    def test_indexing_and_slicing(self):
+        text = StyledText('abc', fmt.red) + StyledText('def', fmt.blue)
+        self.assertEqual('d', text[3])
+        self.assertEqual('f', text[-1])
+        self.assertIs(fmt.blue, text.format_at(3))
+        self.assertRaises(IndexError, text.__getitem__, 6)
+        self.assertEqual(f'{seq.RED}c{seq.BLUE}de{seq.COLOR_OFF}', text[2:5].render())
+        self.assertEqual(fmt.blue('f'), text[-1:].render())
+        self.assertEqual('', text[4:2].render())
+        self.assertRaises(ValueError, text.__getitem__, slice(None, None, 2))
+
+    def test_str_concatenation(self):
+        text = '[' + StyledText('x', fmt.bold) + ']'
+        self.assertEqual(f'[{fmt.bold("x")}]', text.render())
+
+    def test_join(self):
+        parts = [StyledText(str(i), [fmt.red, fmt.bold][i % 2]) for i in range(100)] + ['plain']
+        text = StyledText(', ').join(parts)
+        self.assertEqual(', '.join(p if isinstance(p, str) else p.render() for p in parts), text.render())
+        tree_height(text._root)
+        self.assertEqual('', StyledText('-').join([]).render())
+
+    def test_write(self):
+        stream = io.StringIO()
+        text = StyledText('ab', fmt.red) + StyledText('c', fmt.blue)
+        text.write(stream)
+        self.assertEqual(text.render(), stream.getvalue())
+
+    def test_disabled_colors(self):
+        text = StyledText('a', fmt.red) + StyledText('b', fmt.bold)
+        with color_mode(False):
+            self.assertEqual('ab', text.render())
+
+    def test_random_operations_against_plain_string(self):
+        rnd = random.Random(1)
+        formats = [None, fmt.red, fmt.bold, autof(seq.BOLD, seq.BLUE), fmt.underlined]
+        text, model = StyledText(), ''
+        for _ in range(2000):
+            op = rnd.random()
+            if op < 0.6:
+                piece = ''.join(rnd.choice('abcdef') for _ in range(rnd.randint(0, 300)))
+                if rnd.random() < 0.5:
+                    text, model = text + StyledText(piece, rnd.choice(formats)), model + piece
+                else:
+                    text, model = StyledText(piece, rnd.choice(formats)) + text, piece + model
+            else:
+                start, stop = sorted(rnd.randint(-10, len(model) + 10) for _ in range(2))
+                if op < 0.8:
+                    text, model = text[start:stop] + text, model[start:stop] + model
+                else:
+                    text, model = text[:start] + text[stop:], model[:start] + model[stop:]
+            self.assertEqual(len(model), len(text))
+        self.assertEqual(model, text.plain)
+        self.assertEqual(model, ReplaceSGR().apply(text.render()))
+        tree_height(text._root)
+
+
+class TestStyledTextFmtd(unittest.TestCase):
+    def setUp(self):
+        self.text = StyledText('ab', fmt.red) + StyledText('cd', fmt.bold)
+
+    def test_justify(self):
+        self.assertIsInstance(ljust_fmtd(self.text, 6), StyledText)
+        self.assertEqual(ljust_fmtd(self.text.render(), 6), ljust_fmtd(self.text, 6).render())
+        self.assertEqual(rjust_fmtd(self.text.render(), 6, '.'), rjust_fmtd(self.text, 6, '.').render())
+        self.assertEqual(center_fmtd(self.text.render(), 7), center_fmtd(self.text, 7).render())
+
+    def test_truncate(self):
+        self.assertIs(self.text, truncate_fmtd(self.text, 4))
+        self.assertEqual(truncate_fmtd(self.text.render(), 3, '…'), truncate_fmtd(self.text, 3, '…').render())
+
+    def test_slice(self):
+        self.assertEqual(slice_fmtd(self.text.render(), 1, 3), slice_fmtd(self.text, 1, 3).render())
+
+    def test_wrap(self):
+        self.assertEqual(list(wrap_fmtd(self.text.render(), 3)), list(wrap_fmtd(self.text, 3)))
@@ -0,0 +1,44 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import unittest
+
+from pytermor import fmt, seq, TableColumn, TableRenderer, format_prefixed_unit
+
+
+class TestTableRenderer(unittest.TestCase):
+    def test_alignment(self):
+        renderer = TableRenderer([TableColumn(4, '<'), TableColumn(4, '>'), TableColumn(5, '^')], separator='|')
+        self.assertEqual(['ab  |  cd|  ef '], list(renderer.render([('ab', 'cd', 'ef')])))
+
+    def test_formatter_and_format(self):
+        renderer = TableRenderer([TableColumn(8, '>', format_prefixed_unit, fmt.bold)])
+        self.assertEqual([f'{seq.BOLD}1.000 kb{seq.BOLD_DIM_OFF}', f'{seq.BOLD}   631 b{seq.BOLD_DIM_OFF}'],
+                         list(renderer.render([(1024,), (631,)])))
+
+    def test_overflowing_cells_are_truncated(self):
+        renderer = TableRenderer([TableColumn(3)])
+        self.assertEqual(['abc', f'{seq.RED}ab{seq.COLOR_OFF}c'],
+                         list(renderer.render([('abcdef',), (fmt.red('ab') + 'cdef',)])))
+
+    def test_auto_width(self):
+        renderer = TableRenderer([TableColumn(title='id'), TableColumn(2, '>')], auto_width_sample=2)
+        self.assertEqual(['id    ', 'a    1', 'bcd  2', 'efg 33'],
+                         list(renderer.render([('a', 1), ('bcd', 2), ('efgh', 33)])))
+
+    def test_rows_are_consumed_lazily(self):
+        consumed = []
+
+        def rows():
+            for idx in range(1000):
+                consumed.append(idx)
+                yield idx,
+
+        lines = TableRenderer([TableColumn(4)]).render(rows())
+        next(lines)
+        self.assertEqual([0], consumed)
+
+    def test_invalid_settings_fail(self):
+        self.assertRaises(ValueError, TableRenderer, [TableColumn(4, '?')])
+        self.assertRaises(ValueError, TableRenderer, [TableColumn()])
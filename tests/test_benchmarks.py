@@ -0,0 +1,49 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import unittest
+
+from benchmarks.run import (
+    compare, measure, parse_thresholds, STATUS_FASTER, STATUS_NEW, STATUS_OK, STATUS_REGRESSION,
+)
+from pytermor import get_color_mode
+
+
+def result(ns_per_op: float, calibration_ns: float = 100.0) -> dict:
+    return {'ns_per_op': ns_per_op, 'calibration_ns': calibration_ns}
+
+
+class TestCompare(unittest.TestCase):
+    def test_statuses(self):
+        baseline = {'a': result(100), 'b': result(100), 'c': result(100)}
+        results = {'a': result(125), 'b': result(140), 'c': result(70), 'd': result(10)}
+        self.assertEqual([('a', 1.25, STATUS_OK), ('b', 1.4, STATUS_REGRESSION),
+                          ('c', 0.7, STATUS_FASTER), ('d', None, STATUS_NEW)],
+                         compare(results, baseline, 0.3, dict()))
+
+    def test_threshold_overrides_max_regression(self):
+        report = compare({'a': result(140)}, {'a': result(100)}, 0.3, {'a': 0.5})
+        self.assertEqual([('a', 1.4, STATUS_OK)], report)
+
+    def test_normalization(self):
+        baseline, results = {'a': result(100, 100)}, {'a': result(200, 200)}
+        self.assertEqual([('a', 1.0, STATUS_OK)], compare(results, baseline, 0.3, dict()))
+        self.assertEqual([('a', 2.0, STATUS_REGRESSION)], compare(results, baseline, 0.3, dict(), normalize=False))
+
+
+class TestParseThresholds(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual({'seq.parse': 0.5}, parse_thresholds(['seq.parse=0.5']))
+
+    def test_invalid(self):
+        for value in ('seq.parse', 'unknown=0.5', 'seq.parse=x'):
+            with self.subTest(value=value):
+                self.assertRaises(ValueError, parse_thresholds, [value])
+
+
+class TestMeasure(unittest.TestCase):
+    def test_teardown_restores_color_mode(self):
+        prev_color_mode = get_color_mode()
+        measure('fmt.wrap.disabled', 1, 0.001)
+        self.assertEqual(prev_color_mode, get_color_mode())
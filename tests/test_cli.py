@@ -0,0 +1,119 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from pytermor import fmt, seq, autof
+from pytermor.cli import main, iter_chunks, strip_chunk
+
+
+def generate_log(seed: int, parts_count: int) -> bytes:
+    rnd = random.Random(seed)
+    pieces = [fmt.red('word'), '\n', 'ты ', seq.build_cursor_up(2).print(), '\udcff',
+              autof(seq.build_rgb(10, 20, 30))('x '), 'long_line_without_breaks_' * 3]
+    return ''.join(rnd.choice(pieces) for _ in range(parts_count)).encode('utf-8', 'surrogateescape')
+
+
+class TestStripChunk(unittest.TestCase):
+    def test_strip(self):
+        data = fmt.bold('ты').encode() + seq.build_cursor_up(2).print().encode() + b'\xff\n'
+        self.assertEqual('ты'.encode() + b'\033[2A\xff\n', strip_chunk(data))
+        self.assertEqual('ты'.encode() + b'\xff\n', strip_chunk(data, all_csi=True))
+
+    def test_chunks_do_not_split_sequences(self):
+        data = generate_log(1, 5000)
+        for chunk_size in (1, 7, 64, 1000):
+            chunks = list(iter_chunks(io.BytesIO(data), chunk_size))
+            self.assertEqual(data, b''.join(chunks))
+            self.assertEqual(strip_chunk(data, True), b''.join(strip_chunk(c, True) for c in chunks))
+
+
+class TestStripCommand(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for idx in range(3):
+            path = os.path.join(self.dir.name, f'job{idx}.log')
+            with open(path, 'wb') as f:
+                f.write(generate_log(idx, 3000))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def run_strip(self, *args: str) -> str:
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            self.assertEqual(0, main(['strip', *args]))
+        return stderr.getvalue()
+
+    def read_results(self, output_dir: str):
+        results = []
+        for path in self.paths:
+            with open(os.path.join(output_dir, os.path.basename(path)), 'rb') as f:
+                results.append(f.read())
+        return results
+
+    def test_parallel_output_is_identical_to_sequential(self):
+        sequential_dir, parallel_dir = (os.path.join(self.dir.name, name) for name in ('seq', 'par'))
+        self.run_strip('-q', '-j', '1', '-o', sequential_dir, *self.paths)
+        self.run_strip('-q', '-j', '2', '-c', '256', '-o', parallel_dir, *self.paths)
+
+        expected = []
+        for path in self.paths:
+            with open(path, 'rb') as f:
+                expected.append(strip_chunk(f.read()))
+        self.assertEqual(expected, self.read_results(sequential_dir))
+        self.assertEqual(expected, self.read_results(parallel_dir))
+
+    def test_in_place(self):
+        with open(self.paths[0], 'rb') as f:
+            expected = strip_chunk(f.read())
+        self.run_strip('-q', '-j', '1', '-c', '100', '-i', self.paths[0])
+        with open(self.paths[0], 'rb') as f:
+            self.assertEqual(expected, f.read())
+
+    def test_throughput_report(self):
+        report = self.run_strip('-j', '1', '-o', os.path.join(self.dir.name, 'out'), *self.paths)
+        self.assertRegex(report, r'^3 file\(s\), .+ -> .+ in [0-9.]+s \(.+/s, 1 job\(s\)\)$')
+
+    def test_missing_file(self):
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(1, main(['strip', '-q', '-j', '1', os.path.join(self.dir.name, 'missing.log')]))
+        self.assertIn('No such file', stderr.getvalue())
+
+    def test_missing_file_in_place(self):
+        missing_path = os.path.join(self.dir.name, 'missing.log')
+        with open(self.paths[1], 'rb') as f:
+            expected = strip_chunk(f.read())
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(1, main(['strip', '-q', '-j', '1', '-i', missing_path, self.paths[1]]))
+        self.assertIn('No such file', stderr.getvalue())
+        with open(self.paths[1], 'rb') as f:
+            self.assertEqual(expected, f.read())
+        self.assertEqual([], [name for name in os.listdir(self.dir.name) if name.startswith('.pytermor-')])
+
+    def test_missing_file_output_dir(self):
+        output_dir = os.path.join(self.dir.name, 'out')
+        missing_path = os.path.join(self.dir.name, 'missing.log')
+        with redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(1, main(['strip', '-q', '-j', '2', '-o', output_dir, missing_path, *self.paths]))
+        self.assertIn('No such file', stderr.getvalue())
+        self.assertFalse(os.path.exists(os.path.join(output_dir, 'missing.log')))
+        self.assertEqual(3, len(self.read_results(output_dir)))
+
+    def test_output_dir_name_conflict(self):
+        other_dir = os.path.join(self.dir.name, 'other')
+        os.makedirs(other_dir)
+        other_path = os.path.join(other_dir, os.path.basename(self.paths[0]))
+        with open(other_path, 'wb') as f:
+            f.write(b'other')
+        with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit):
+            main(['strip', '-q', '-o', os.path.join(self.dir.name, 'out'), self.paths[0], other_path])
+        self.assertIn('job0.log', stderr.getvalue())
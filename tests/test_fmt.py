@@ -4,7 +4,7 @@
 # -----------------------------------------------------------------------------
 import unittest
 
-from pytermor import autof, seq, sgr, SequenceSGR, Format
+from pytermor import autof, fmt, seq, sgr, SequenceSGR, Format, color_mode, set_color_mode, get_color_mode
 
 
 class TestEquality(unittest.TestCase):
@@ -90,3 +90,66 @@ class TestAutoFormat(unittest.TestCase):
 
         self.assertEqual(f.opening_seq, SequenceSGR(sgr.BOLD, sgr.RED))
         self.assertEqual(f.closing_seq, SequenceSGR(sgr.BOLD_DIM_OFF, sgr.COLOR_OFF))
+
+
+class TestWrapBytes(unittest.TestCase):
+    def test_wrap_bytes(self):
+        f = autof(seq.BOLD, seq.RED)
+        self.assertEqual(b'\033[1;31m\xd1\x82\033[22;39m', f.wrap_bytes('т'.encode()))
+        self.assertEqual(f('т').encode(), f.wrap_bytes('т'.encode()))
+
+    def test_opening_and_closing_bytes(self):
+        self.assertEqual(b'\033[33m', fmt.yellow.opening_bytes)
+        self.assertEqual(b'\033[39m', fmt.yellow.closing_bytes)
+        self.assertEqual(b'', fmt.noop.opening_bytes)
+
+
+class TestColorMode(unittest.TestCase):
+    def setUp(self):
+        self.prev_color_mode = get_color_mode()
+        set_color_mode(True)
+
+    def tearDown(self):
+        set_color_mode(self.prev_color_mode)
+
+    def test_disabled_mode_returns_text_as_is(self):
+        f = autof(seq.BOLD, seq.RED)
+        with color_mode(False):
+            self.assertEqual('text', f('text'))
+            self.assertEqual('123', fmt.red.wrap(123))
+            self.assertEqual('', fmt.bold())
+            self.assertEqual('', fmt.bold(None))
+            self.assertEqual('', f.opening_str)
+            self.assertEqual('', f.closing_str)
+            self.assertEqual(b'text', f.wrap_bytes(b'text'))
+            self.assertEqual(b'', f.opening_bytes)
+            self.assertEqual(b'', f.closing_bytes)
+        self.assertEqual('\033[1;31mtext\033[22;39m', f('text'))
+        self.assertEqual(b'\033[1;31mtext\033[22;39m', f.wrap_bytes(b'text'))
+
+    def test_context_restores_previous_mode(self):
+        with color_mode(False):
+            with color_mode(True):
+                self.assertTrue(get_color_mode())
+                self.assertEqual('\033[1mx\033[22m', fmt.bold('x'))
+            self.assertFalse(get_color_mode())
+        self.assertTrue(get_color_mode())
+
+    def test_global_switch(self):
+        prev_color_mode = get_color_mode()
+        try:
+            set_color_mode(False)
+            self.assertEqual('x', Format(seq.BOLD, seq.RESET)('x'))
+        finally:
+            set_color_mode(prev_color_mode)
+        self.assertEqual('\033[1mx\033[m', Format(seq.BOLD, seq.RESET)('x'))
+
+    def test_call_uses_overridden_wrap(self):
+        class UpperFormat(Format):
+            def wrap(self, text=None):
+                return super().wrap(str(text).upper())
+
+        f = UpperFormat(seq.BOLD, seq.BOLD_DIM_OFF)
+        self.assertEqual('\033[1mX\033[22m', f('x'))
+        with color_mode(False):
+            self.assertEqual('X', f('x'))
@@ -0,0 +1,105 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import sys
+import unittest
+from unittest import mock
+
+from pytermor import build_c256, build_rgb, color_mode, seq, Gradient, Palette
+from pytermor import gradient
+from pytermor.gradient import MODE_C256
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestPalette(unittest.TestCase):
+    def setUp(self):
+        self.palette = Palette([0x00ff00, (255, 255, 0), 0xff0000], thresholds=[100, 500])
+
+    def test_index(self):
+        self.assertEqual(0, self.palette.index(-1))
+        self.assertEqual(0, self.palette.index(99.9))
+        self.assertEqual(1, self.palette.index(100))
+        self.assertEqual(2, self.palette.index(500))
+        self.assertEqual(2, self.palette.index(float('nan')))
+
+    def test_wrap(self):
+        self.assertEqual(f'{build_rgb(255, 255, 0)}230ms{seq.COLOR_OFF}', self.palette.wrap(230, '230ms'))
+        with color_mode(False):
+            self.assertEqual('230ms', self.palette.wrap(230, '230ms'))
+
+    def test_background(self):
+        palette = Palette([0x000000, 0xffffff], thresholds=[0], bg=True)
+        self.assertEqual(f'{build_rgb(255, 255, 255, bg=True)}x{seq.BG_COLOR_OFF}', palette.wrap(1, 'x'))
+
+    def test_c256_mode(self):
+        palette = Palette([0xff0000, 0x808080, 0x0000ff], thresholds=[0, 1], mode=MODE_C256)
+        self.assertEqual([build_c256(196).print(), build_c256(244).print(), build_c256(21).print()],
+                         list(palette.prefixes([-1, 0, 1])))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, Palette, [0, 1], thresholds=[1, 2])
+        self.assertRaises(ValueError, Palette, [0, 1, 2], thresholds=[2, 1])
+        self.assertRaises(ValueError, Palette, [0, 0x1000000], thresholds=[1])
+        self.assertRaises(ValueError, Palette, [0, 1], thresholds=[1], mode='cmyk')
+
+
+class TestGradient(unittest.TestCase):
+    def setUp(self):
+        self.gradient = Gradient([0x0000ff, 0xff0000], steps=5, vmin=0, vmax=100)
+
+    def test_stops(self):
+        self.assertEqual([(0, 0, 255), (64, 0, 191), (128, 0, 128), (191, 0, 64), (255, 0, 0)], self.gradient.colors)
+        self.assertEqual([20, 40, 60, 80], self.gradient.thresholds)
+
+    def test_values_are_clamped(self):
+        self.assertEqual([0, 0, 1, 4, 4], list(self.gradient.indices([-50, 0, 20, 100, 150])))
+
+    def test_batch_methods_match_single_value_ones(self):
+        values = [v * 3.7 for v in range(-5, 40)]
+        self.assertEqual([self.gradient.index(v) for v in values], list(self.gradient.indices(values)))
+        self.assertEqual([self.gradient.prefix(v) for v in values], list(self.gradient.prefixes(values)))
+        texts = [str(v) for v in values]
+        self.assertEqual([self.gradient.wrap(v, t) for v, t in zip(values, texts)],
+                         self.gradient.wrap_many(values, texts))
+
+    def test_disabled_colors(self):
+        with color_mode(False):
+            self.assertEqual(['', ''], list(self.gradient.prefixes([1, 99])))
+            self.assertEqual(['1', '99'], self.gradient.wrap_many([1, 99], ['1', '99']))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, Gradient, [0x0000ff])
+        self.assertRaises(ValueError, Gradient, [0x0000ff, 0xff0000], steps=1)
+        self.assertRaises(ValueError, Gradient, [0x0000ff, 0xff0000], vmin=1, vmax=1)
+
+
+class TestGradientWithoutNumpy(TestGradient):
+    def setUp(self):
+        patcher = mock.patch.object(gradient, 'numpy', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+class TestNumpyImport(unittest.TestCase):
+    def test_numpy_is_imported_on_palette_creation(self):
+        with mock.patch.object(gradient, 'numpy', gradient._NOT_IMPORTED), \
+                mock.patch.dict(sys.modules, {'numpy': None}):  # makes the import fail
+            self.assertIs(gradient._NOT_IMPORTED, gradient.numpy)
+            palette = Palette([0x00ff00, 0xff0000], thresholds=[1])
+            self.assertIsNone(gradient.numpy)
+            self.assertEqual([0, 1], palette.indices([0, 1]))
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestGradientNumpy(unittest.TestCase):
+    def test_2d_array(self):
+        g = Gradient([0x0000ff, 0xff0000], steps=4, vmin=0, vmax=1)
+        values = numpy.array([[0.1, 0.3], [0.6, 0.9]])
+        self.assertEqual([[0, 1], [2, 3]], g.indices(values).tolist())
+        self.assertEqual((2, 2), g.prefixes(values).shape)
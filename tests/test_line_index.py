@@ -0,0 +1,132 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+
+from pytermor import LineIndex
+from pytermor.strf import anchor_lines
+from tests.strf.test_anchoring import generate_text, render
+
+
+class TestLineIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'input.log')
+        self.text = generate_text(5, 3000)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, data: str, mode: str = 'w'):
+        with open(self.path, mode, newline='') as f:
+            f.write(data)
+
+    def _expected_lines(self, text: str):
+        return [line.rstrip('\r\n') for line in anchor_lines(text.splitlines(keepends=True))]
+
+    def test_offsets(self):
+        self._write('ab\n\ncd\r\nef')
+        with LineIndex(self.path, 2) as index:
+            self.assertEqual(3, index.update())
+            self.assertEqual(4, len(index))
+            self.assertEqual(8, index.indexed_size)
+            self.assertEqual([b'ab\n', b'\n', b'cd\r\n', b'ef'], [index.get_line(i) for i in range(4)])
+            with self.assertRaises(IndexError):
+                index.get_line(4)
+
+    def test_empty_file(self):
+        self._write('')
+        with LineIndex(self.path) as index:
+            self.assertEqual(0, index.update())
+            self.assertEqual(0, len(index))
+            self.assertEqual([], index.render(0, 10))
+
+    def test_state_at(self):
+        self._write(self.text)
+        lines = self.text.splitlines(keepends=True)
+        with LineIndex(self.path, 7) as index:
+            index.update()
+            for idx in range(len(lines)):
+                prefix = ''.join(lines[:idx]) + '_'
+                self.assertEqual(render(prefix)[-1][1], index.state_at(idx), f'line {idx}')
+
+    def test_render_window(self):
+        self._write(self.text)
+        expected = self._expected_lines(self.text)
+        with LineIndex(self.path, 7) as index:
+            index.update()
+            self.assertEqual(len(expected), len(index))
+            for start in (0, 1, 6, 7, 8, 50, len(index) - 3):
+                self.assertEqual(expected[start:start + 20], index.render(start, 20), f'start {start}')
+
+    def test_render_matches_full_replay(self):
+        self._write(self.text)
+        with LineIndex(self.path, 10) as index:
+            index.update()
+            rendered = index.render(0, len(index))
+        self.assertEqual(render(self.text), render(''.join(rendered)))
+
+    def test_incremental_append(self):
+        split_pos = len(self.text) // 3
+        self._write(self.text[:split_pos])
+        with LineIndex(self.path, 5) as index:
+            first_count = index.update()
+            self._write(self.text[split_pos:], 'a')
+            second_count = index.update()
+            self.assertEqual(0, index.update())
+            self.assertEqual(self.text.count('\n'), first_count + second_count)
+            self.assertEqual(self._expected_lines(self.text), index.render(0, len(index)))
+
+    def test_sidecar_round_trip(self):
+        self.text += '\n'
+        self._write(self.text)
+        with LineIndex(self.path, 5) as index:
+            index.update()
+            index.save()
+            expected = index.render(0, len(index))
+        self.assertTrue(os.path.exists(self.path + '.ptidx'))
+
+        self._write('\033[1mappended\n', 'a')
+        with LineIndex(self.path, 5) as index:
+            self.assertEqual(1, index.update())
+            self.assertEqual(expected, index.render(0, len(expected)))
+            self.assertEqual(self._expected_lines(self.text + '\033[1mappended\n'), index.render(0, len(index)))
+
+    def test_sidecar_ignored_for_other_interval(self):
+        self._write(self.text)
+        with LineIndex(self.path, 5) as index:
+            index.update()
+            index.save()
+        with LineIndex(self.path, 6) as index:
+            self.assertEqual(self.text.count('\n'), index.update())
+
+    def test_rebuild_on_truncation(self):
+        self._write(self.text)
+        with LineIndex(self.path, 5) as index:
+            index.update()
+            self._write('\033[31mred\nplain')
+            self.assertEqual(1, index.update())
+            self.assertEqual(['\033[31mred\033[39m', '\033[31mplain\033[39m'], index.render(0, 10))
+
+    def test_rebuild_on_replacement(self):
+        self._write('\033[1mfirst\nline\n')
+        with LineIndex(self.path) as index:
+            index.update()
+            index.save()
+        self._write('\033[3mother\nline\nmore\n')
+        with LineIndex(self.path) as index:
+            self.assertEqual(3, index.update())
+            self.assertEqual(['\033[3mother\033[23m', '\033[3mline\033[23m'], index.render(0, 2))
+
+    def test_save_refuses_non_regular_sidecar(self):
+        self._write(self.text)
+        with LineIndex(self.path, sidecar_path=self.tmp_dir.name) as index:
+            index.update()
+            self.assertRaises(ValueError, index.save)
+        self.assertTrue(os.path.isdir(self.tmp_dir.name))
+
+    def test_invalid_interval(self):
+        self.assertRaises(ValueError, LineIndex, self.path, 0)
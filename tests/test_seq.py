@@ -4,7 +4,7 @@
 # -----------------------------------------------------------------------------
 import unittest
 
-from pytermor import seq, sgr, build, build_c256, build_rgb, SequenceSGR
+from pytermor import seq, sgr, build, build_c256, build_rgb, SequenceSGR, SequenceCSI
 
 
 class TestEquality(unittest.TestCase):
@@ -104,3 +104,70 @@ class TestBuild(unittest.TestCase):
         self.assertRaises(ValueError, build_rgb, 10, 310, 30)
         self.assertRaises(ValueError, build_rgb, 310, 10, 130)
         self.assertRaises(ValueError, build_rgb, 0, 0, 256, bg=True)
+
+
+class TestSequenceCSI(unittest.TestCase):
+    def test_print(self):
+        self.assertEqual('\033[3A', seq.build_cursor_up(3).print())
+        self.assertEqual('\033[2K', seq.ERASE_LINE.print())
+        self.assertEqual('\033[s', str(seq.CURSOR_SAVE))
+
+    def test_builders_are_cached(self):
+        self.assertIs(seq.build_cursor_column(10), seq.build_cursor_column(10))
+
+    def test_equality(self):
+        self.assertEqual(SequenceCSI('B', 2), seq.build_cursor_down(2))
+        self.assertNotEqual(SequenceCSI('A', 2), seq.build_cursor_down(2))
+        self.assertNotEqual(SequenceCSI('m', 1), SequenceSGR(1))
+
+
+class TestPrintBytes(unittest.TestCase):
+    def test_print_bytes(self):
+        self.assertEqual(b'\033[1;31m', (seq.BOLD + seq.RED).print_bytes())
+        self.assertEqual(b'\033[2K', seq.ERASE_LINE.print_bytes())
+        self.assertEqual(b'', seq.NOOP.print_bytes())
+
+    def test_print_bytes_is_cached(self):
+        s = build_rgb(10, 20, 30)
+        self.assertIs(s.print_bytes(), s.print_bytes())
+
+
+class TestParse(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(seq.BOLD + build_c256(208), SequenceSGR.parse('\033[1;38;5;208m'))
+        self.assertEqual(build_rgb(255, 128, 0, bg=True), SequenceSGR.parse('\033[48;2;255;128;0m'))
+
+    def test_parse_empty_params(self):
+        self.assertEqual(seq.RESET, SequenceSGR.parse('\033[m'))
+        self.assertEqual(SequenceSGR(0, 1), SequenceSGR.parse('\033[;1m'))
+
+    def test_parse_round_trip(self):
+        for s in [seq.BOLD, seq.RED + seq.BG_BLACK, build_rgb(1, 2, 3), seq.RESET]:
+            self.assertEqual(s, SequenceSGR.parse(s.print()))
+
+    def test_parse_bytes(self):
+        self.assertEqual(seq.BOLD + seq.RED, SequenceSGR.parse_bytes(b'\033[1;31m'))
+
+    def test_parse_is_interned(self):
+        self.assertIs(SequenceSGR.parse('\033[1;31m'), SequenceSGR.parse('\033[1;31m'))
+        self.assertIs(SequenceSGR.parse('\033[1;32m'), SequenceSGR.parse_bytes(b'\033[1;32m'))
+
+    def test_parse_returns_subclass_instances(self):
+        class CustomSGR(SequenceSGR):
+            pass
+        self.assertIs(CustomSGR, type(CustomSGR.parse('\033[1;31m')))
+        self.assertIs(CustomSGR, type(CustomSGR.parse_bytes(b'\033[1;31m')))
+        self.assertIs(SequenceSGR, type(SequenceSGR.parse('\033[1;31m')))
+
+    def test_parsed_params_are_immutable(self):
+        parsed = SequenceSGR.parse('\033[1;33m')
+        self.assertEqual((1, 33), parsed.params)
+        with self.assertRaises(AttributeError):
+            parsed.params.append(4)
+        self.assertEqual(SequenceSGR(1, 33), SequenceSGR.parse('\033[1;33m'))
+
+    def test_parse_invalid(self):
+        for s in ['', '\033[', '\033m', '\033[1', '[1m', '\033[1Am', '\033[1:2m', '\033[ 1m', '\033[²m', '\033[1m ']:
+            with self.subTest(s=s):
+                self.assertRaises(ValueError, SequenceSGR.parse, s)
+        self.assertRaises(ValueError, SequenceSGR.parse_bytes, b'\033[\xff1m')
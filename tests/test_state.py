@@ -0,0 +1,120 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import unittest
+
+from pytermor import seq, sgr, SGRState, SequenceSGR
+from pytermor.state import apply_printed
+
+
+def state(*sequences: SequenceSGR) -> SGRState:
+    result = SGRState()
+    for s in sequences:
+        result = result.apply(s)
+    return result
+
+
+class TestApply(unittest.TestCase):
+    def test_attributes(self):
+        s = state(seq.BOLD + seq.ITALIC)
+        self.assertTrue(s.has(sgr.BOLD))
+        self.assertTrue(s.has(sgr.ITALIC))
+        self.assertFalse(s.has(sgr.UNDERLINED))
+
+    def test_shared_breaker(self):
+        s = state(seq.BOLD + seq.DIM + seq.ITALIC, seq.BOLD_DIM_OFF)
+        self.assertEqual(state(seq.ITALIC), s)
+
+    def test_colors(self):
+        s = state(seq.RED + seq.BG_BLACK)
+        self.assertEqual((sgr.RED,), s.fg_params)
+        self.assertEqual((sgr.BG_BLACK,), s.bg_params)
+
+    def test_color_override(self):
+        self.assertEqual(state(seq.build_rgb(1, 2, 3)), state(seq.RED, seq.build_c256(100), seq.build_rgb(1, 2, 3)))
+
+    def test_extended_colors(self):
+        s = state(seq.build_c256(208) + seq.build_rgb(255, 128, 0, bg=True))
+        self.assertEqual((38, 5, 208), s.fg_params)
+        self.assertEqual((48, 2, 255, 128, 0), s.bg_params)
+
+    def test_color_off(self):
+        self.assertEqual(state(seq.BG_BLUE), state(seq.RED + seq.BG_BLUE, seq.COLOR_OFF))
+
+    def test_reset(self):
+        self.assertFalse(state(seq.BOLD + seq.RED + seq.BG_RED, seq.RESET))
+
+    def test_unknown_and_incomplete_codes_are_ignored(self):
+        self.assertEqual(state(seq.BOLD), state(SequenceSGR(1, 51, 38, 7, 38, 5)))
+
+    def test_out_of_range_extended_colors_are_ignored(self):
+        s = state(seq.RED + seq.BG_BLUE)
+        self.assertIs(s, s.apply(SequenceSGR(38, 5, 256)))
+        self.assertIs(s, s.apply(SequenceSGR(48, 2, 1, 300, 3)))
+        self.assertEqual((48, 2, 255, 0, 255), s.apply(SequenceSGR(48, 2, 255, 0, 255)).bg_params)
+
+    def test_unchanged_state_is_returned_as_is(self):
+        s = state(seq.BOLD)
+        self.assertIs(s, s.apply(seq.BOLD))
+
+    def test_apply_printed(self):
+        self.assertEqual(state(seq.BOLD + seq.RED), apply_printed(SGRState(), '\033[1;31m'))
+        self.assertEqual(state(seq.BOLD + seq.RED), apply_printed(SGRState(), b'\033[1;31m'))
+        self.assertRaises(ValueError, apply_printed, SGRState(), '\033[2A')
+
+
+class TestValueType(unittest.TestCase):
+    def test_equality_and_hashing(self):
+        a = state(seq.BOLD + seq.RED)
+        b = state(seq.RED, seq.BOLD)
+        self.assertEqual(a, b)
+        self.assertEqual({a: 1}[b], 1)
+        self.assertNotEqual(a, state(seq.BOLD))
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            SGRState().custom = 1
+
+    def test_merge(self):
+        merged = state(seq.BOLD + seq.RED + seq.BG_BLACK).merge(state(seq.ITALIC + seq.BLUE))
+        self.assertEqual(state(seq.BOLD + seq.ITALIC + seq.BLUE + seq.BG_BLACK), merged)
+
+
+class TestToSequence(unittest.TestCase):
+    def test_canonical_order(self):
+        s = state(seq.BG_RED + seq.build_c256(208) + seq.UNDERLINED + seq.BOLD)
+        self.assertEqual(SequenceSGR(1, 4, 38, 5, 208, 41), s.to_sequence())
+
+    def test_empty(self):
+        self.assertEqual('', SGRState().to_sequence().print())
+
+    def test_round_trip(self):
+        s = state(seq.DIM + seq.OVERLINED + seq.build_rgb(1, 2, 3) + seq.BG_HI_CYAN)
+        self.assertEqual(s, SGRState.from_sequence(s.to_sequence()))
+
+
+class TestDiff(unittest.TestCase):
+    def test_same(self):
+        self.assertEqual(SequenceSGR(), state(seq.BOLD).diff(state(seq.BOLD)))
+
+    def test_color_switch(self):
+        self.assertEqual(seq.BLUE, state(seq.BOLD + seq.RED).diff(state(seq.BOLD + seq.BLUE)))
+
+    def test_attribute_off(self):
+        self.assertEqual(seq.ITALIC_OFF + seq.COLOR_OFF,
+                         state(seq.BOLD + seq.ITALIC + seq.RED).diff(state(seq.BOLD)))
+
+    def test_shared_breaker_reopens(self):
+        self.assertEqual(seq.BOLD_DIM_OFF + seq.DIM, state(seq.BOLD + seq.DIM).diff(state(seq.DIM)))
+
+    def test_reset_if_shorter(self):
+        self.assertEqual(seq.RESET, state(seq.BOLD + seq.RED).diff(SGRState()))
+        self.assertEqual(seq.COLOR_OFF, state(seq.RED).diff(SGRState()))
+
+    def test_diff_applied_gives_target(self):
+        states = [state(seq.BOLD + seq.RED), state(seq.DIM + seq.build_c256(1)), SGRState(),
+                  state(seq.UNDERLINED + seq.BG_BLUE), state(seq.DOUBLE_UNDERLINED + seq.build_rgb(1, 2, 3, True))]
+        for a in states:
+            for b in states:
+                self.assertEqual(b, a.apply(a.diff(b)), f'{a!r} -> {b!r}')
@@ -0,0 +1,115 @@
+# -----------------------------------------------------------------------------
+# pytermor [ANSI formatted terminal output toolset]
+# (C) 2022 A. Shavykin <0.delameter@gmail.com>
+# -----------------------------------------------------------------------------
+import threading
+import unittest
+
+from pytermor import fmt, seq, stats, autof, color_mode, Format, SequenceSGR, ReplaceSGR
+from pytermor import format_prefixed_unit, format_time_delta, PRESET_SI_METRIC
+from pytermor.registry import Registry
+from pytermor.strf import StringFilter
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        stats.reset()
+
+    def tearDown(self):
+        stats.disable()
+        stats.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(stats.is_enabled())
+        fmt.red('text')
+        self.assertEqual({}, stats.snapshot())
+
+    def test_disable_restores_original_methods(self):
+        originals = (SequenceSGR.print, Format._wrap_colored, Registry.get_closing_seq, StringFilter.apply)
+        stats.enable(timing=True)
+        self.assertIsNot(Format._wrap_colored, originals[1])
+        self.assertIs(Format.wrap, Format._wrap_colored)
+        stats.disable()
+        self.assertEqual(originals, (SequenceSGR.print, Format._wrap_colored, Registry.get_closing_seq,
+                                     StringFilter.apply))
+        self.assertIs(Format.wrap, originals[1])
+
+    def test_format_counters(self):
+        with stats.collecting():
+            fmt.red('text')
+            fmt.red.wrap('other')
+            autof(seq.BOLD)('text')
+        snapshot = stats.snapshot()
+        self.assertEqual({'31': 2, '1': 1}, snapshot['fmt.calls'])
+        self.assertEqual({'31': 2 * len(seq.RED.print() + seq.COLOR_OFF.print()) + 9,
+                          '1': len(seq.BOLD.print() + seq.BOLD_DIM_OFF.print()) + 4}, snapshot['fmt.bytes'])
+        self.assertEqual(1, snapshot['registry.resolutions'])
+        self.assertGreater(snapshot['seq.rendered'], 0)
+
+    def test_format_bytes_counters(self):
+        with stats.collecting():
+            fmt.red.wrap_bytes(b'text')
+        self.assertEqual({'31': 14}, stats.snapshot()['fmt.bytes'])
+
+    def test_format_counters_with_disabled_colors(self):
+        with stats.collecting(), color_mode(False):
+            fmt.red('text')
+        self.assertEqual({'31': 4}, stats.snapshot()['fmt.bytes'])
+
+    def test_uncached_rendering(self):
+        with stats.collecting():
+            SequenceSGR(1, 31).print()
+        self.assertEqual(1, stats.snapshot()['seq.rendered_uncached'])
+
+    def test_filter_counters(self):
+        with stats.collecting():
+            ReplaceSGR().apply(fmt.red('text'))
+        snapshot = stats.snapshot()
+        self.assertEqual({'ReplaceSGR': 1}, snapshot['filter.calls'])
+        self.assertEqual({'ReplaceSGR': 14}, snapshot['filter.scanned'])
+
+    def test_numf_counters(self):
+        with stats.collecting():
+            format_time_delta(100, 6)
+            format_time_delta(100)
+            format_prefixed_unit(100, PRESET_SI_METRIC)
+        snapshot = stats.snapshot()
+        self.assertEqual({'max_len=6': 1, 'max_len=10': 1}, snapshot['numf.calls']['format_time_delta'])
+        self.assertEqual({'PRESET_SI_METRIC': 1}, snapshot['numf.calls']['format_prefixed_unit'])
+
+    def test_timing_histogram(self):
+        with stats.collecting(timing=True):
+            for _ in range(10):
+                fmt.red('text')
+        histogram = stats.snapshot()['timing']['fmt.wrap']
+        self.assertEqual(10, sum(histogram.values()))
+        for upper_bound in histogram.keys():
+            self.assertEqual(0, upper_bound & (upper_bound - 1))
+
+    def test_collecting_restores_previous_timing(self):
+        stats.enable(timing=False)
+        with stats.collecting(timing=True):
+            pass
+        self.assertTrue(stats.is_enabled())
+        fmt.red('text')
+        self.assertEqual({'31': 1}, stats.snapshot()['fmt.calls'])
+        self.assertNotIn('timing', stats.snapshot())
+
+    def test_counters_are_merged_across_threads(self):
+        def render():
+            for _ in range(100):
+                fmt.green('text')
+
+        with stats.collecting():
+            threads = [threading.Thread(target=render) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual({'32': 400}, stats.snapshot()['fmt.calls'])
+
+    def test_reset(self):
+        with stats.collecting():
+            fmt.red('text')
+        stats.reset()
+        self.assertEqual({}, stats.snapshot())